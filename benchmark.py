@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+ADK Streaming Test Tool Benchmarks
+
+Micro-benchmarks for the client-side hot paths of test_tool.py. They run
+offline against synthetic live events and need no credentials.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+from datetime import datetime
+from types import SimpleNamespace
+
+from test_tool import (ADKStreamingTester, AudioSegment, Config, decode_audio, get_adk_version, np,
+                       replay_session, synthesize_prompt, to_mono_pcm)
+
+def _audio_event(chunk: bytes):
+    """Build a live event carrying one audio chunk."""
+    part = SimpleNamespace(text=None, inline_data=SimpleNamespace(mime_type="audio/pcm;rate=24000", data=chunk))
+    return SimpleNamespace(turn_complete=False, partial=True, content=SimpleNamespace(parts=[part]),
+                           output_transcription=None)
+
+def _turn_complete_event():
+    """Build the live event that ends a turn."""
+    return SimpleNamespace(turn_complete=True, partial=False, content=None, output_transcription=None)
+
+async def _replay(events: list):
+    """Yield prebuilt events as an async live event stream."""
+    for event in events:
+        yield event
+
+async def _collect_audio_baseline(live_events) -> bytes:
+    """Previous collector: immutable bytes concatenation (O(n^2) copying)."""
+    audio_data = b""
+    async for event in live_events:
+        if event.turn_complete:
+            break
+        audio_data += event.content.parts[0].inline_data.data
+    return audio_data
+
+async def _collect_audio_buffered(live_events) -> bytearray:
+    """Current collector strategy: bytearray append without the per-event logging."""
+    audio_buffer = bytearray()
+    async for event in live_events:
+        if event.turn_complete:
+            break
+        audio_buffer += event.content.parts[0].inline_data.data
+    return audio_buffer
+
+def _time(coroutine_factory, repeat: int) -> float:
+    """Return the best wall time in seconds over `repeat` awaits inside one event loop."""
+    async def measure():
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            await coroutine_factory()
+            best = min(best, time.perf_counter() - started)
+        return best
+    return asyncio.run(measure())
+
+def bench_collectors(durations: list, chunk_bytes: int, repeat: int):
+    """Compare bytes concatenation with the buffered audio collector."""
+    bytes_per_second = Config.OUTPUT_RATE * 2
+    tester = ADKStreamingTester("google-ai-studio", "benchmark")
+
+    print(f"Audio collector: {chunk_bytes}-byte chunks at {Config.OUTPUT_RATE}Hz, best of {repeat}")
+    print(f"{'Audio':>8} {'Events':>8} {'bytes +=':>12} {'bytearray':>12} {'collector':>12} {'Speedup':>8}")
+    for seconds in durations:
+        events = [_audio_event(bytes(chunk_bytes))] * (seconds * bytes_per_second // chunk_bytes)
+        events.append(_turn_complete_event())
+
+        baseline = _time(lambda: _collect_audio_baseline(_replay(events)), repeat)
+        buffered = _time(lambda: _collect_audio_buffered(_replay(events)), repeat)
+        # Full collector including its per-event logging, with stdout discarded
+        with contextlib.redirect_stdout(io.StringIO()):
+            collector = _time(lambda: tester._collect_audio_response(_replay(events)), repeat)
+
+        print(f"{seconds:>7}s {len(events):>8} {baseline * 1000:>10.1f}ms {buffered * 1000:>10.1f}ms "
+              f"{collector * 1000:>10.1f}ms {baseline / buffered:>7.1f}x")
+
+def _best(func, repeat: int) -> float:
+    """Return the best wall time in seconds over `repeat` calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def _write_source_wav(path: str, seconds: int, rate: int = 44100):
+    """Write a 44.1kHz stereo WAV of a tone with a noise floor, a typical recorded prompt format."""
+    frames = np.arange(seconds * rate)
+    tone = 0.3 * np.sin(2 * np.pi * 440 * frames / rate)
+    noise = np.random.default_rng(0).normal(0.0, 0.01, (frames.size, 2))
+    samples = np.clip((tone[:, None] + noise) * 32767, -32768, 32767).astype("<i2")
+    with wave.open(path, 'wb') as f:
+        f.setnchannels(2)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(samples.tobytes())
+
+def bench_prompts(durations: list, repeat: int):
+    """Compare pydub conversion with NumPy decoding and resampling, and time prompt synthesis, by input length."""
+    print(f"Voice prompt preparation: 44.1kHz stereo WAV to {Config.INPUT_RATE}Hz mono, best of {repeat}")
+    print(f"{'Input':>8} {'PCM bytes':>12} {'pydub':>12} {'NumPy':>12} {'Speedup':>8} {'synthesize':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        for seconds in durations:
+            source = os.path.join(directory, f"prompt_{seconds}s.wav")
+            _write_source_wav(source, seconds)
+            pydub = _best(lambda: AudioSegment.from_file(source).set_frame_rate(Config.INPUT_RATE)
+                          .set_channels(1).set_sample_width(2).raw_data, repeat)
+            numpy = _best(lambda: to_mono_pcm(*decode_audio(source)), repeat)
+            # Synthesis is cached per arguments, so each run pads to a distinct length
+            runs = iter(range(repeat))
+            synthesis = _best(lambda: synthesize_prompt((source,), seconds + next(runs) / 1000, "repeat",
+                                                        noise_dbfs=-50.0), repeat)
+            pcm_bytes = seconds * Config.INPUT_RATE * 2
+            print(f"{seconds:>7}s {pcm_bytes:>12,} {pydub * 1000:>10.1f}ms {numpy * 1000:>10.1f}ms "
+                  f"{pydub / numpy:>7.1f}x {synthesis * 1000:>10.1f}ms")
+
+def bench_replay(trace_path: str, repeat: int):
+    """Replay a recorded trace through its collector at maximum speed."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        elapsed = _time(lambda: replay_session(trace_path, speed=0), repeat)
+        turns = asyncio.run(replay_session(trace_path, speed=0))
+    print(f"Replay of {trace_path}: {len(turns)} turn(s), best of {repeat}: {elapsed * 1000:.1f}ms")
+
+def _importtime(command: list) -> tuple[float, list]:
+    """Run a Python command with -X importtime; return wall ms and (cumulative us, module) for top-level imports."""
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", *command], capture_output=True, text=True, check=True)
+    wall = (time.perf_counter() - started) * 1000
+    top_level = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented below their importer
+        if not name[1:].startswith(" "):
+            top_level.append((int(cumulative), name.strip()))
+    return wall, top_level
+
+def bench_startup(repeat: int, top: int, record: str = None):
+    """Measure `test_tool.py --help` startup and summarize -X importtime by top-level module."""
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_tool.py")
+    runs = [_importtime([script, "--help"]) for _ in range(repeat)]
+    wall, top_level = min(runs, key=lambda run: run[0])
+    import_ms = sum(cumulative for cumulative, _ in top_level) / 1000
+    heaviest = sorted(top_level, reverse=True)[:top]
+
+    print(f"Startup of test_tool.py --help, best of {repeat}: {wall:.0f}ms wall, {import_ms:.0f}ms importing")
+    print(f"{'Module':<40} {'Cumulative':>12}")
+    for cumulative, name in heaviest:
+        print(f"{name:<40} {cumulative / 1000:>10.1f}ms")
+
+    if record:
+        entry = {
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "adk_version": get_adk_version(),
+            "python": sys.version.split()[0],
+            "wall_ms": round(wall, 1),
+            "import_ms": round(import_ms, 1),
+            "top_imports": {name: round(cumulative / 1000, 1) for cumulative, name in heaviest},
+        }
+        with open(record, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + "\n")
+        print(f"Recorded to {record}")
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="ADK Streaming Test Tool Benchmarks")
+    parser.add_argument("benchmark", choices=["collectors", "prompts", "replay", "startup"], help="Benchmark to run")
+    parser.add_argument("--durations", type=lambda value: [int(d) for d in value.split(",")],
+                       default=[10, 60, 300],
+                       help="Response audio durations, or prompt lengths, in seconds (collectors, prompts)")
+    parser.add_argument("--chunk-bytes", type=int, default=3840, help="Audio bytes per event (collectors)")
+    parser.add_argument("--trace", help="Recorded trace to replay (replay)")
+    parser.add_argument("--top", type=int, default=10, help="Heaviest top-level imports to list (startup)")
+    parser.add_argument("--record", help="Append the result as a JSON line to this file (startup)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+
+    args = parser.parse_args()
+
+    if args.benchmark == "collectors":
+        bench_collectors(args.durations, args.chunk_bytes, args.repeat)
+    elif args.benchmark == "prompts":
+        bench_prompts(args.durations, args.repeat)
+    elif args.benchmark == "replay":
+        if not args.trace:
+            parser.error("replay needs --trace")
+        bench_replay(args.trace, args.repeat)
+    elif args.benchmark == "startup":
+        bench_startup(args.repeat, args.top, args.record)
+
+if __name__ == "__main__":
+    main()
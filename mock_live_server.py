@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Mock Live API Server
+
+Local stand-in for the Gemini Live API bidirectional streaming endpoint used by
+runner.run_live. Streams scripted text, transcription and audio events at
+configurable delays and can close sessions with the error codes seen in test
+reports (e.g. 1007, 1008), so the test tool can be benchmarked and run in CI
+without credentials or network access.
+
+The google-genai client always connects over wss://, so the server serves TLS
+with a self-signed certificate for localhost. Point the test tool at it with:
+
+    python mock_live_server.py --port 8765
+    python test_tool.py --mock-server https://localhost:8765 --mock-ca mock_live_server_cert.pem
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import math
+import random
+import re
+import ssl
+import struct
+import subprocess
+from datetime import datetime, timedelta, timezone
+
+import websockets
+
+# Scenario configuration; override any key with --scenario <file.json>
+DEFAULT_SCENARIO = {
+    "setup_delay": 0.05,         # Seconds before setupComplete is sent
+    "first_event_delay": 0.3,    # Seconds from end of user turn to first response event
+    "event_interval": 0.05,      # Seconds between response events
+    "end_of_speech_gap": 0.3,    # Seconds without realtime audio that end the user turn
+    "response_text": "The current time in Tokyo Japan is {time}",  # {time}: wall clock at response_utc_offset
+    "response_utc_offset": 9,    # Hours from UTC of the spoken time
+    "audio_chunks": 10,          # Audio events per response
+    "audio_chunk_ms": 100,       # Duration of audio per event (24kHz, 16-bit, mono)
+    "audio_text_parts": True,    # Also stream the response text as text events in audio responses
+    "error_rate": 0.0,           # Probability of closing a session with random_error
+    "random_error": {"code": 1011, "reason": "Internal error encountered."},
+    # Close rules: first rule whose model substring and modality match is applied
+    "errors": [
+        {
+            "model": "gemini-3.1-flash-live-preview",
+            "modality": "TEXT",
+            "code": 1007,
+            "reason": "The requested combination of response modalities (TEXT) is not supported "
+                      "by the model. models/gemini-3.1-flash-live-preview",
+        },
+    ],
+}
+
+OUTPUT_RATE = 24000  # Live API output audio rate
+
+def load_scenario(path: str = None) -> dict:
+    """Load scenario overrides from a JSON file on top of the defaults."""
+    scenario = dict(DEFAULT_SCENARIO)
+    if path:
+        with open(path, 'r') as f:
+            scenario.update(json.load(f))
+    return scenario
+
+def generate_tone(duration_ms: int, frequency: float = 440.0, amplitude: float = 0.3) -> bytes:
+    """Generate a 16-bit mono PCM sine tone at the output rate."""
+    samples = OUTPUT_RATE * duration_ms // 1000
+    peak = int(32767 * amplitude)
+    return struct.pack(f"<{samples}h", *(int(peak * math.sin(2 * math.pi * frequency * i / OUTPUT_RATE))
+                                         for i in range(samples)))
+
+def spoken_time(utc_offset: float) -> str:
+    """Return the current time at a UTC offset as spoken, e.g. "10:14 a.m."."""
+    now = datetime.now(timezone.utc) + timedelta(hours=utc_offset)
+    return f"{now.hour % 12 or 12}:{now.minute:02d} {'a.m.' if now.hour < 12 else 'p.m.'}"
+
+def ensure_certificate(certfile: str, keyfile: str):
+    """Create a self-signed certificate for localhost with openssl if none exists."""
+    try:
+        with open(certfile):
+            return
+    except FileNotFoundError:
+        pass
+    subprocess.run([
+        "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+        "-keyout", keyfile, "-out", certfile, "-days", "365", "-subj", "/CN=localhost",
+        "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1",
+    ], check=True, capture_output=True)
+    print(f"Generated self-signed certificate: {certfile}")
+
+def _camel_case_keys(value):
+    """Convert snake_case keys to camelCase; the client sends both styles."""
+    if isinstance(value, dict):
+        return {re.sub(r"_([a-z])", lambda m: m.group(1).upper(), key): _camel_case_keys(item)
+                for key, item in value.items()}
+    if isinstance(value, list):
+        return [_camel_case_keys(item) for item in value]
+    return value
+
+def _match_error(scenario: dict, model: str, modalities: list) -> dict:
+    """Return the close rule for this session, if any."""
+    for rule in scenario["errors"]:
+        if rule.get("model") and rule["model"] not in model:
+            continue
+        if rule.get("modality") and rule["modality"] not in modalities:
+            continue
+        return rule
+    if scenario["error_rate"] and random.random() < scenario["error_rate"]:
+        return scenario["random_error"]
+    return None
+
+async def _receive_turns(websocket, scenario: dict):
+    """Yield "text" or "audio" each time the client finishes a user turn."""
+    audio_pending = False
+    while True:
+        try:
+            if audio_pending:
+                raw = await asyncio.wait_for(websocket.recv(), scenario["end_of_speech_gap"])
+            else:
+                raw = await websocket.recv()
+        except asyncio.TimeoutError:
+            audio_pending = False
+            yield "audio"
+            continue
+        except websockets.ConnectionClosed:
+            return
+
+        message = _camel_case_keys(json.loads(raw))
+        if "clientContent" in message:
+            if message["clientContent"].get("turnComplete"):
+                yield "text"
+        elif "realtimeInput" in message:
+            realtime_input = message["realtimeInput"]
+            if realtime_input.get("audioStreamEnd") or "activityEnd" in realtime_input:
+                if audio_pending:
+                    audio_pending = False
+                    yield "audio"
+            else:
+                audio_pending = True
+
+async def _send_server_content(websocket, content: dict):
+    """Send one serverContent message."""
+    await websocket.send(json.dumps({"serverContent": content}))
+
+async def _send_response(websocket, scenario: dict, modalities: list, transcription: bool, tone: bytes):
+    """Stream one scripted model turn."""
+    words = scenario["response_text"].format(time=spoken_time(scenario["response_utc_offset"])).split(" ")
+    await asyncio.sleep(scenario["first_event_delay"])
+
+    if "TEXT" in modalities:
+        for word in words:
+            await _send_server_content(websocket, {"modelTurn": {"parts": [{"text": word + " "}]}})
+            await asyncio.sleep(scenario["event_interval"])
+    else:
+        chunks = scenario["audio_chunks"]
+        data = base64.b64encode(tone).decode("ascii")
+        for i in range(chunks):
+            # Spread the response text over the audio events
+            piece = " ".join(words[len(words) * i // chunks:len(words) * (i + 1) // chunks])
+            audio_part = {"inlineData": {"mimeType": f"audio/pcm;rate={OUTPUT_RATE}", "data": data}}
+            await _send_server_content(websocket, {"modelTurn": {"parts": [audio_part]}})
+            if piece and scenario["audio_text_parts"]:
+                await _send_server_content(websocket, {"modelTurn": {"parts": [{"text": piece + " "}]}})
+            if piece and transcription:
+                await _send_server_content(websocket, {"outputTranscription": {"text": piece + " "}})
+            await asyncio.sleep(scenario["event_interval"])
+
+    await _send_server_content(websocket, {"generationComplete": True})
+    await _send_server_content(websocket, {"turnComplete": True})
+
+async def handle_session(websocket, scenario: dict, tone: bytes):
+    """Serve one bidi session: setup, then one scripted response per user turn."""
+    try:
+        setup = _camel_case_keys(json.loads(await websocket.recv())).get("setup", {})
+    except websockets.ConnectionClosed:
+        return
+    model = setup.get("model", "").split("/")[-1]
+    modalities = setup.get("generationConfig", {}).get("responseModalities", ["AUDIO"])
+    transcription = "outputAudioTranscription" in setup
+    print(f"Session: model={model} modalities={modalities} transcription={transcription}")
+
+    await asyncio.sleep(scenario["setup_delay"])
+    error = _match_error(scenario, model, modalities)
+    if error:
+        print(f"Closing session with {error['code']}: {error['reason']}")
+        await websocket.close(code=error["code"], reason=error["reason"][:120])
+        return
+
+    await websocket.send(json.dumps({"setupComplete": {}}))
+    try:
+        async for _ in _receive_turns(websocket, scenario):
+            await _send_response(websocket, scenario, modalities, transcription, tone)
+    except websockets.ConnectionClosed:
+        pass
+
+async def serve(host: str, port: int, scenario: dict, ssl_context: ssl.SSLContext):
+    """Run the mock server until cancelled."""
+    tone = generate_tone(scenario["audio_chunk_ms"])
+    async with websockets.serve(lambda websocket: handle_session(websocket, scenario, tone),
+                                host, port, ssl=ssl_context, max_size=None):
+        print(f"Mock Live API server listening on wss://{host}:{port}")
+        await asyncio.Future()
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Mock Live API server for the ADK Bidirectional Streaming Test Tool")
+    parser.add_argument("--host", default="localhost", help="Host to bind")
+    parser.add_argument("--port", type=int, default=8765, help="Port to bind")
+    parser.add_argument("--scenario", help="JSON file overriding the default scenario")
+    parser.add_argument("--certfile", default="mock_live_server_cert.pem",
+                       help="TLS certificate (generated with openssl if missing)")
+    parser.add_argument("--keyfile", default="mock_live_server_key.pem", help="TLS private key")
+
+    args = parser.parse_args()
+
+    ensure_certificate(args.certfile, args.keyfile)
+    ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    ssl_context.load_cert_chain(args.certfile, args.keyfile)
+
+    try:
+        asyncio.run(serve(args.host, args.port, load_scenario(args.scenario), ssl_context))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
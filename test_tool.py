@@ -10,19 +10,76 @@ text and voice tests for comprehensive evaluation.
 import os
 import asyncio
 import argparse
+import contextlib
+import contextvars
+import cProfile
+import glob
+import hashlib
+import importlib
+import json
+import math
+import mmap
+import pstats
+import queue
+import random
+import re
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
 import warnings
-from datetime import datetime
+import wave
+from abc import ABC, abstractmethod
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import cache
 from dotenv import load_dotenv
-from google.genai.types import Content, Part, Blob
-from google.genai import types
-from google.adk.runners import InMemoryRunner
-from google.adk.agents import Agent, LiveRequestQueue
-from google.adk.agents.run_config import RunConfig
-from google.adk.tools import google_search
-from google.cloud import speech
-import pyaudio
-from pydub import AudioSegment
-import google.adk
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory file locks
+    fcntl = None
+
+class LazyImport:
+    """Stand-in for a module, or a name in a module, imported on first use.
+
+    Attribute access and calls go to the real object. Keeps google.adk,
+    google.genai, Speech-to-Text, PyAudio and pydub off the startup path:
+    --help, report rendering and replays load none of them, and text-only
+    runs never load the voice stack.
+    """
+
+    def __init__(self, module: str, name: str = None):
+        self._module = module
+        self._name = name
+        self._target = None
+
+    def _resolve(self):
+        if self._target is None:
+            target = importlib.import_module(self._module)
+            self._target = getattr(target, self._name) if self._name else target
+        return self._target
+
+    def __getattr__(self, attr: str):
+        return getattr(self._resolve(), attr)
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+types = LazyImport("google.genai.types")
+Content = LazyImport("google.genai.types", "Content")
+Part = LazyImport("google.genai.types", "Part")
+Blob = LazyImport("google.genai.types", "Blob")
+InMemoryRunner = LazyImport("google.adk.runners", "InMemoryRunner")
+Agent = LazyImport("google.adk.agents", "Agent")
+LiveRequestQueue = LazyImport("google.adk.agents", "LiveRequestQueue")
+RunConfig = LazyImport("google.adk.agents.run_config", "RunConfig")
+speech = LazyImport("google.cloud.speech")
+pyaudio = LazyImport("pyaudio")
+AudioSegment = LazyImport("pydub", "AudioSegment")
+np = LazyImport("numpy")
 
 # Suppress Pydantic serialization warnings
 warnings.filterwarnings("ignore", category=UserWarning, module="pydantic")
@@ -37,7 +94,8 @@ def get_adk_version():
             return f.read().strip()
     except FileNotFoundError:
         # Fallback to installed package version if file doesn't exist
-        return google.adk.__version__
+        from importlib.metadata import version
+        return version("google-adk")
 
 # Configuration
 class Config:
@@ -58,67 +116,586 @@ class Config:
     ]
     
     # Audio configuration
-    AUDIO_FORMAT = pyaudio.paInt16
+    AUDIO_FORMAT = "paInt16"  # PyAudio sample format constant
     CHANNELS = 1
     INPUT_RATE = 16000   # Input audio rate for Live API
     OUTPUT_RATE = 24000  # Output audio rate from Live API
     CHUNK_SIZE = 1024    # Audio chunk size for streaming
+    UPLOAD_PACING = "fixed"    # fixed, realtime, accelerated or burst (see UploadPacer)
+    UPLOAD_SPEED = 2.0         # Real-time multiple for accelerated pacing
+    FIXED_CHUNK_DELAY = 0.01   # Seconds between chunks for fixed pacing
     TIMEOUT = 60         # Test timeout in seconds
+    DEADLINES = {        # Per-phase budgets in seconds; see phase_deadline and PhaseTimeout
+        "connect": 30,        # Opening the live connection (PlatformGemini.connect)
+        "upload": 30,         # Sending the voice prompt
+        "first_event": 30,    # Request sent to the first response event
+        "idle": 15,           # Gap between response events
+        "turn": TIMEOUT,      # Request sent to the end of the response
+    }
+    VOICE_WORKERS = 4    # Threads for decoding and batch Speech-to-Text, on top of two per voice session
+    VOICE_SESSIONS = None  # Concurrent voice sessions the voice thread pool serves; None for MAX_CONCURRENCY
+    PLAYBACK_BUFFER_SECONDS = 120  # Ring buffer capacity of the playback sink
+    PLAYBACK_CHUNK_BYTES = 4800    # Bytes per PyAudio write (100ms at 24kHz)
+    LOOP_LAG_INTERVAL = 0.05       # Seconds between event-loop lag probes
+
+    # Scheduler configuration
+    MAX_CONCURRENCY = 8  # Live sessions running at once across all platforms
+    PLATFORM_CONCURRENCY = {  # Separate quotas per platform
+        "google-ai-studio": 3,
+        "vertex-ai": 5,
+    }
+
+    # Sharded execution (--workers, --shard, --merge-shards); see run_sharded_tests
+    SHARD_DIR = "shards"  # Per-worker result stores written by --workers
+
+    # Load test configuration
+    LOAD_STEPS = [1, 2, 4, 8]  # Concurrent sessions (stepped) or sessions/sec (arrival)
+    LOAD_STEP_DURATION = 60    # Seconds each load step keeps starting sessions
+
+    # Soak test configuration
+    SOAK_TURNS = 100                 # Turns sent over one run_live stream
+    SOAK_SCRIPT = ["text", "audio"]  # Turn kinds cycled in order: TEST_QUESTION as text or AUDIO_FILE
+    SOAK_TURN_INTERVAL = 1.0         # Seconds between turns
+    SOAK_TOP_ALLOCATIONS = 10        # Allocation sites listed in the memory growth table
+
+    # Retry configuration: failure class -> (max attempts, base backoff seconds); see RetryPolicy
+    RETRY_POLICY = {
+        "permanent": (1, 0.0),   # 1007/1008 config errors, missing credentials
+        "quota": (3, 10.0),      # 429 / RESOURCE_EXHAUSTED / 1013 try again later
+        "transient": (3, 1.0),   # 1011 internal errors, dropped connections, off-target answers
+        "timeout": (2, 2.0),
+        "empty": (3, 1.0),       # No text or audio came back
+    }
+    RETRY_MAX_DELAY = 30.0  # Cap on a single backoff in seconds
+    PERMANENT_FAILURES_FILE = ".permanent_failures.json"  # Known dead (platform, model, test, ADK version)
+
+    # Capability probe configuration; see CapabilityCache
+    CAPABILITY_CACHE_FILE = ".capability_cache.json"
+    CAPABILITY_TTL = 24 * 3600       # Seconds before a model is probed again
+    CAPABILITY_PROBE_TIMEOUT = 15    # Seconds a probe session may take
+    PROBE_PROMPT = "Say hello."
+
+    # Event traces (set by --record-traces); see EventRecorder and replay_trace
+    TRACE_DIR = None
+
+    # Hot-path instrumentation (set by --profile-events and --profile-dir)
+    PROFILE_EVENTS = False     # Histogram per-event handling time, event sizes and inter-arrival gaps
+    PROFILE_DIR = None         # Write cProfile stats of the collector loops to this directory
+
+    # Mock Live API server (set by --mock-server); see mock_live_server.py
+    MOCK_SERVER_URL = None
     
     # Test configuration
     TEST_QUESTION = "What time is it now?"
     AUDIO_FILE = "whattime.m4a"
-    TIME_KEYWORDS = ["time", "clock", "hour", "minute", "am", "pm", "a.m", "p.m", "utc", "gmt", "o'clock"]
+    PCM_CACHE_DIR = ".pcm_cache"  # Decoded voice prompts as raw .pcm files
+    RECOGNIZER = "streaming"  # Response audio recognizer, see RECOGNIZERS
+    RESULTS_STORE = "test_results.jsonl"  # Append-only result records, see ResultStore
+
+    # History and regression detection (--history)
+    HISTORY_REPORT = "history_report.md"
+    HISTORY_METRICS = ["first_event", "verified"]  # Latencies compared across ADK versions (tests close on verified)
+    HISTORY_BASELINE_RUNS = 10          # Most recent runs of earlier ADK versions used as baseline
+    HISTORY_MIN_SAMPLES = 3             # Latency samples needed on each side to test for a regression
+    HISTORY_BREAK_RUNS = 3              # Passing baseline runs after which failing every latest run is a regression
+    REGRESSION_ALPHA = 0.05             # One-sided significance level
+    LATENCY_REGRESSION_THRESHOLD = 0.10  # Minimum relative median increase worth flagging
+    TIME_KEYWORDS = ["time", "clock", "hour", "minute", "utc", "gmt", "o'clock"]  # Plus am/pm after a number
+
+    # Response verification; see ResponseVerifier
+    RESPONSE_VALIDATORS = []         # Opt-in validators from VALIDATORS applied after the keyword match
+    CLOCK_TOLERANCE_MINUTES = 3      # Allowed difference between a spoken time and the wall clock
+    CLOCK_UTC_OFFSETS = None         # UTC offsets (hours) a spoken time may use; None allows any quarter hour
+    CLOSE_ON_VERIFIED = True         # End a test's session as soon as its partial response is verified
+
+    # Response audio analysis; see analyze_audio
+    VAD_FRAME_MS = 20                # Analysis frame length
+    VAD_THRESHOLD_DBFS = -40.0       # Frames with RMS above this level are voiced
+    SILENCE_THRESHOLD_DBFS = -60.0   # Frames with RMS below this level are silence
+    VAD_MIN_GAP_MS = 200             # Shorter pauses do not split a voiced segment
+    VAD_MIN_SEGMENT_MS = 60          # Shorter voiced bursts (clicks) are ignored
+    CLIPPING_LEVEL = 32767           # Absolute sample value counted as clipped
+
+    # Synthetic voice prompts (--prompt-*); see synthesize_prompt. Any setting replaces AUDIO_FILE as sent
+    PROMPT_DURATION = None           # Pad the prompt to this many seconds; None for no padding
+    PROMPT_UTTERANCES = None         # Audio files spoken in order; None speaks AUDIO_FILE
+    PROMPT_FILL = "silence"          # Padding before the utterances: "silence" or "repeat" (cycle them)
+    PROMPT_LEAD_SILENCE = 0.0        # Seconds of silence at the start
+    PROMPT_GAP = 0.5                 # Seconds of silence between utterances
+    PROMPT_NOISE_DBFS = None         # RMS level of a white noise overlay; None for a clean prompt
+    PROMPT_SEED = 0                  # Noise generator seed, so prompts are reproducible
+
+    # Input-length scaling (--input-scaling)
+    SCALING_DURATIONS = [1, 10, 30, 60, 300]  # Prompt lengths in seconds
+    SCALING_SESSIONS = 3                       # Voice sessions per prompt length
+
+class PCMCache:
+    """Caches decoded PCM per source content and target format, in-process and on disk.
+
+    Decoded audio is stored as raw .pcm files named by the SHA-256 of the source
+    file plus the target format, and served as read-only memory maps, so each
+    source is converted at most once and sessions slice chunks out of the map.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self._pcm = {}     # cache key -> memoryview over the mapped .pcm file
+        self._hashes = {}  # (path, mtime_ns, size) -> content hash
+        self._lock = threading.Lock()
+        self._key_locks = {}  # cache key -> lock held while that key is loaded
+
+    def _content_hash(self, audio_path: str) -> str:
+        """Hash the source file, reusing the hash while the file is unchanged."""
+        stat = os.stat(audio_path)
+        file_id = (os.path.abspath(audio_path), stat.st_mtime_ns, stat.st_size)
+        if file_id not in self._hashes:
+            with open(audio_path, 'rb') as f:
+                self._hashes[file_id] = hashlib.sha256(f.read()).hexdigest()
+        return self._hashes[file_id]
+
+    def load(self, audio_path: str, rate: int, channels: int, sample_width: int, decode) -> memoryview:
+        """Return cached PCM for audio_path, calling decode() only on a cache miss.
+
+        Threads missing the same key wait for the first one, so each key is
+        decoded once per process.
+        """
+        key = f"{self._content_hash(audio_path)[:32]}_{rate}hz_{channels}ch_{sample_width * 8}bit"
+        if key in self._pcm:
+            return self._pcm[key]
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            if key in self._pcm:
+                return self._pcm[key]
+            pcm_path = os.path.join(self.cache_dir, f"{key}.pcm")
+            if not os.path.exists(pcm_path):
+                pcm_data = decode()
+                os.makedirs(self.cache_dir, exist_ok=True)
+                # Write to a temporary file of our own first, so other processes never map a partial file
+                fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f"{key}.", suffix=".tmp")
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(pcm_data)
+                os.replace(tmp_path, pcm_path)
+
+            with open(pcm_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    self._pcm[key] = memoryview(b"")
+                else:
+                    self._pcm[key] = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            return self._pcm[key]
+
+PCM_CACHE = PCMCache(Config.PCM_CACHE_DIR)
+
+@cache
+def voice_executor() -> ThreadPoolExecutor:
+    """Bounded pool for blocking audio and Speech-to-Text calls, keeping them off the event loop.
+
+    Created on first use, after the command line set Config.VOICE_SESSIONS.
+    Every voice session holds a thread for its streaming recognizer and one
+    for its playback drain while the response arrives, so the pool has two
+    per session plus Config.VOICE_WORKERS for decoding and batch recognition.
+    """
+    sessions = Config.VOICE_SESSIONS or Config.MAX_CONCURRENCY
+    return ThreadPoolExecutor(max_workers=2 * sessions + Config.VOICE_WORKERS, thread_name_prefix="voice")
+
+async def _run_blocking(func, *args):
+    """Run a blocking call in the voice thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(voice_executor(), func, *args)
+
+class PlaybackSink:
+    """Non-blocking audio output backed by a ring buffer.
+
+    write() copies into the ring buffer and returns immediately; a worker in
+    the voice thread pool drains it into a blocking PyAudio stream. Audio that does
+    not fit into the buffer is dropped and counted.
+    """
+
+    def __init__(self, pool: "VoiceResourcePool"):
+        self._pool = pool
+        self._buffer = bytearray(Config.OUTPUT_RATE * 2 * Config.PLAYBACK_BUFFER_SECONDS)
+        self._start = 0
+        self._size = 0
+        self._closed = False
+        self._ready = threading.Condition()
+        self.dropped = 0
+        self._drainer = voice_executor().submit(self._drain)
+
+    def write(self, data: bytes | memoryview):
+        """Queue audio for playback without blocking."""
+        data = memoryview(data)
+        capacity = len(self._buffer)
+        with self._ready:
+            accepted = min(len(data), capacity - self._size)
+            self.dropped += len(data) - accepted
+            end = (self._start + self._size) % capacity
+            first = min(accepted, capacity - end)
+            self._buffer[end:end + first] = data[:first]
+            self._buffer[:accepted - first] = data[first:accepted]
+            self._size += accepted
+            self._ready.notify()
+
+    def close(self):
+        """Stop accepting audio; queued audio is still played."""
+        with self._ready:
+            self._closed = True
+            self._ready.notify()
+
+    async def wait_closed(self):
+        """Close the sink and wait until queued audio has been played."""
+        self.close()
+        await asyncio.wrap_future(self._drainer)
+
+    def _read(self, max_bytes: int) -> bytes | None:
+        """Take up to max_bytes from the ring buffer, or None once closed and empty."""
+        with self._ready:
+            while self._size == 0 and not self._closed:
+                self._ready.wait()
+            if self._size == 0:
+                return None
+            count = min(self._size, max_bytes, len(self._buffer) - self._start)
+            chunk = bytes(self._buffer[self._start:self._start + count])
+            self._start = (self._start + count) % len(self._buffer)
+            self._size -= count
+            return chunk
+
+    def _drain(self):
+        """Play queued audio until the sink is closed (runs in the voice thread pool)."""
+        stream = self._pool.open_output_stream()
+        try:
+            while (chunk := self._read(Config.PLAYBACK_CHUNK_BYTES)) is not None:
+                stream.write(chunk)
+        finally:
+            self._pool.close_stream(stream)
+
+class LoopLagMonitor:
+    """Measures event-loop responsiveness as the delay of a periodic wakeup."""
+
+    def __init__(self, interval: float = None):
+        self.interval = interval or Config.LOOP_LAG_INTERVAL
+        self.samples = []  # Milliseconds each wakeup fired late
+        self._task = None
+
+    def start(self):
+        """Start probing on the running event loop."""
+        self._task = asyncio.create_task(self._probe())
+
+    async def stop(self) -> dict:
+        """Stop probing and return the lag summary."""
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        return self.summary()
+
+    def summary(self) -> dict:
+        """Return sample count, p50, p95 and max lag in milliseconds."""
+        if not self.samples:
+            return {}
+        return {
+            "samples": len(self.samples),
+            "p50": _percentile(self.samples, 50),
+            "p95": _percentile(self.samples, 95),
+            "max": max(self.samples),
+        }
+
+    async def _probe(self):
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, (time.monotonic() - started - self.interval) * 1000))
+
+class EventProfiler:
+    """Hot-path instrumentation of the response collectors.
+
+    instrument() wraps a live event stream and records, per collector, the
+    time the collector spends handling each event, the event payload size
+    and the gap since the collector asked for it. With Config.PROFILE_DIR set,
+    a cProfile profiler is enabled only while the collector handles an event,
+    so time spent waiting on the network is excluded. cProfile sees every
+    coroutine the loop resumes meanwhile, so only one event is profiled at a
+    time and events that overlap it are counted in `overlapped` instead; main
+    runs profiled sessions one at a time so this stays rare.
+    """
+
+    METRICS = ["handling_us", "size_bytes", "gap_ms"]
+
+    def __init__(self):
+        self.samples = {}   # collector -> metric -> list of samples
+        self.profiles = {}  # collector -> cProfile.Profile
+        self.overlapped = {}  # collector -> events not profiled because another one was
+        self._profiling = False
+
+    @property
+    def enabled(self) -> bool:
+        return Config.PROFILE_EVENTS or bool(Config.PROFILE_DIR)
+
+    def instrument(self, live_events, collector: str):
+        """Return live_events, wrapped for measurement if instrumentation is enabled."""
+        if not self.enabled:
+            return live_events
+        return self._instrument(live_events, collector)
+
+    async def _instrument(self, live_events, collector: str):
+        samples = self.samples.setdefault(collector, {metric: [] for metric in self.METRICS})
+        profile = self.profiles.setdefault(collector, cProfile.Profile()) if Config.PROFILE_DIR else None
+        requested = time.perf_counter()
+        async for event in live_events:
+            arrived = time.perf_counter()
+            samples["gap_ms"].append((arrived - requested) * 1000)
+            samples["size_bytes"].append(_event_size(event))
+            if event.turn_complete:
+                # Collectors stop at turn_complete and close the stream
+                # suspended here, so it is not timed or profiled
+                yield event
+                requested = time.perf_counter()
+                continue
+            profiled = profile is not None and not self._profiling
+            if profiled:
+                self._profiling = True
+                profile.enable()
+            elif profile:
+                self.overlapped[collector] = self.overlapped.get(collector, 0) + 1
+            try:
+                yield event
+            finally:
+                if profiled:
+                    profile.disable()
+                    self._profiling = False
+            requested = time.perf_counter()
+            samples["handling_us"].append((requested - arrived) * 1_000_000)
+
+    def summary(self) -> dict:
+        """Return per-collector event counts, p50/p95/max and log2 histograms of each metric."""
+        summary = {}
+        for collector, samples in self.samples.items():
+            if not samples["gap_ms"]:
+                continue
+            summary[collector] = {"events": len(samples["gap_ms"])}
+            for metric, values in samples.items():
+                if values:
+                    summary[collector][metric] = {
+                        "p50": _percentile(values, 50),
+                        "p95": _percentile(values, 95),
+                        "max": max(values),
+                        "histogram": _log2_histogram(values),
+                    }
+        return summary
+
+    def dump_profiles(self, directory: str, top: int = 15) -> list[str]:
+        """Write one .prof file per collector and print its most expensive functions."""
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for collector, profile in self.profiles.items():
+            path = os.path.join(directory, f"collector_{collector}.prof")
+            profile.dump_stats(path)
+            paths.append(path)
+            print(f"\nProfile of the {collector} collector loop ({path}):")
+            if self.overlapped.get(collector):
+                print(f"{self.overlapped[collector]} events overlapping another profiled event were not profiled")
+            pstats.Stats(profile).sort_stats("cumulative").print_stats(top)
+        return paths
+
+def _event_size(event) -> int:
+    """Return the payload size of a live event in bytes (audio data or UTF-8 text)."""
+    size = 0
+    if event.content and event.content.parts:
+        part = event.content.parts[0]
+        if part.inline_data and part.inline_data.data:
+            size += len(part.inline_data.data)
+        if part.text:
+            size += len(part.text.encode("utf-8"))
+    if event.output_transcription and event.output_transcription.text:
+        size += len(event.output_transcription.text.encode("utf-8"))
+    return size
+
+def _log2_histogram(values: list) -> dict:
+    """Count values in power-of-two buckets keyed by their upper bound."""
+    histogram = {}
+    for value in values:
+        bound = 1 << max(0, math.ceil(math.log2(value))) if value > 1 else 1
+        histogram[bound] = histogram.get(bound, 0) + 1
+    return dict(sorted(histogram.items()))
+
+EVENT_PROFILER = EventProfiler()
+
+class VoiceResourcePool:
+    """Process-wide Speech-to-Text client and PyAudio instance shared by all voice tests.
+
+    Clients are created once (ideally by warm_up() at startup), health-checked,
+    recreated after a reported failure, and released by an explicit shutdown().
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._speech_client = None
+        self._pyaudio = None
+        self.stats = {}     # Warm-up timings in milliseconds
+        self.handouts = 0   # Voice tests served without creating clients
+
+    def speech_client(self) -> "speech.SpeechClient":
+        """Hand the shared Speech-to-Text client to a voice test."""
+        with self._lock:
+            self.handouts += 1
+        return self._get_speech_client()
+
+    def _get_speech_client(self) -> "speech.SpeechClient":
+        """Return the shared Speech-to-Text client, creating it on first use."""
+        with self._lock:
+            if self._speech_client is None:
+                started = time.monotonic()
+                self._speech_client = speech.SpeechClient()
+                self.stats["speech_client_create"] = (time.monotonic() - started) * 1000
+            return self._speech_client
+
+    def report_failure(self, exc: Exception):
+        """Drop the Speech-to-Text client after a failed call so the next test gets a fresh channel.
+
+        The old channel is not closed: concurrent voice tests may still be
+        streaming on it. It is released once their calls finish and the last
+        reference goes away.
+        """
+        print(f"Speech-to-Text call failed ({exc}); recreating client")
+        with self._lock:
+            self._speech_client = None
+
+    def open_output_stream(self):
+        """Open a 24kHz output stream on the shared PyAudio instance."""
+        with self._lock:
+            if self._pyaudio is None:
+                started = time.monotonic()
+                self._pyaudio = pyaudio.PyAudio()
+                self.stats["pyaudio_create"] = (time.monotonic() - started) * 1000
+            return self._pyaudio.open(
+                format=getattr(pyaudio, Config.AUDIO_FORMAT),
+                channels=Config.CHANNELS,
+                rate=Config.OUTPUT_RATE,  # Live API outputs at 24kHz
+                output=True
+            )
+
+    def close_stream(self, stream):
+        """Close a stream opened by open_output_stream()."""
+        with self._lock:
+            stream.stop_stream()
+            stream.close()
+
+    def check_health(self) -> bool:
+        """Send 100ms of silence to Speech-to-Text; also establishes the gRPC channel."""
+        started = time.monotonic()
+        try:
+            self._get_speech_client().recognize(
+                config=speech.RecognitionConfig(
+                    encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+                    sample_rate_hertz=Config.OUTPUT_RATE,
+                    language_code="en-US",
+                ),
+                audio=speech.RecognitionAudio(content=bytes(Config.OUTPUT_RATE // 5)),
+            )
+        except Exception as exc:
+            self.report_failure(exc)
+            return False
+        self.stats["speech_health_check"] = (time.monotonic() - started) * 1000
+        return True
+
+    async def warm_up(self, use_stt: bool = True, playback: bool = True):
+        """Create and health-check the shared clients before the first test."""
+        if use_stt:
+            healthy = await _run_blocking(self.check_health)
+            if not healthy:
+                print("Warning: Speech-to-Text health check failed during warm-up")
+        if playback:
+            stream = await _run_blocking(self.open_output_stream)
+            await _run_blocking(self.close_stream, stream)
+        if self.stats:
+            print("Voice resources warmed up: " + ", ".join(f"{name} {value:.0f}ms" for name, value in self.stats.items()))
+
+    def summary(self) -> dict:
+        """Warm-up timings and reuse count for reports."""
+        return {"stats": dict(self.stats), "handouts": self.handouts}
+
+    def shutdown(self):
+        """Close the Speech-to-Text channel and terminate PyAudio."""
+        with self._lock:
+            client, self._speech_client = self._speech_client, None
+            audio, self._pyaudio = self._pyaudio, None
+        if client is not None:
+            client.transport.close()
+        if audio is not None:
+            audio.terminate()
+
+VOICE_POOL = VoiceResourcePool()
 
 class VoiceHandler:
     """Handles voice input/output for testing."""
 
-    def __init__(self, headless: bool = False):
-        self.stt_client = speech.SpeechClient()
+    def __init__(self, headless: bool = False, use_stt: bool = True):
+        # Speech-to-Text needs Google Cloud credentials; skip it when disabled.
+        # Clients come from VOICE_POOL, so creating a handler is cheap.
+        self.stt_client = VOICE_POOL.speech_client() if use_stt else None
         self.headless = headless
-        # Only initialize PyAudio if not in headless mode
-        if not headless:
-            self.pyaudio_instance = pyaudio.PyAudio()
-        else:
-            self.pyaudio_instance = None
+        self.playback_sink = None
+        if headless:
             print("VoiceHandler initialized in headless mode (audio playback disabled)")
 
-    def load_audio_as_pcm(self, audio_path: str) -> bytes:
-        """Load audio file and convert to PCM format for Live API."""
-        audio = AudioSegment.from_file(audio_path)
-        
-        # Convert to Live API format: 16kHz, mono, 16-bit
-        audio = audio.set_frame_rate(Config.INPUT_RATE)
-        audio = audio.set_channels(Config.CHANNELS)
-        audio = audio.set_sample_width(2)  # 16-bit = 2 bytes
-        
-        print(f"Audio converted - {audio.channels} channel, {audio.frame_rate}Hz, "
-              f"{audio.sample_width * 8}-bit, {len(audio)}ms duration")
-        
-        # Return raw PCM data (little-endian)
-        pcm_data = audio.raw_data
+    async def load_audio_as_pcm(self, audio_path: str) -> memoryview:
+        """Load audio file as PCM for Live API, converting it only on a cache miss."""
+        pcm_data = await _run_blocking(PCM_CACHE.load, audio_path, Config.INPUT_RATE, Config.CHANNELS, 2,
+                                       lambda: self._convert_to_pcm(audio_path))
         print(f"PCM data: {len(pcm_data)} bytes")
         return pcm_data
 
-    def play_audio(self, audio_data: bytes):
-        """Play audio data through speakers (skip in headless mode)."""
+    async def load_prompt(self) -> memoryview:
+        """Load the voice question: the synthetic prompt if one is configured, else Config.AUDIO_FILE."""
+        pcm_data = await _run_blocking(synthetic_prompt)
+        if pcm_data is None:
+            print(f"Loading audio file: {Config.AUDIO_FILE}")
+            return await self.load_audio_as_pcm(Config.AUDIO_FILE)
+        print(f"Synthetic prompt: {len(pcm_data) / (Config.INPUT_RATE * 2):.1f}s, {len(pcm_data)} bytes")
+        return pcm_data
+
+    def _convert_to_pcm(self, audio_path: str) -> bytes:
+        """Convert an audio file to PCM format for Live API (16kHz, mono, 16-bit) with NumPy."""
+        samples, rate = decode_audio(audio_path)
+        pcm_data = to_mono_pcm(samples, rate)
+        print(f"Audio converted - {Config.CHANNELS} channel, {Config.INPUT_RATE}Hz, 16-bit, "
+              f"{len(pcm_data) * 1000 // (Config.INPUT_RATE * 2)}ms duration")
+        return pcm_data
+
+    def start_playback(self):
+        """Open a playback sink for one response (skip in headless mode)."""
         if self.headless:
             print("Skipping audio playback (headless mode)")
             return
+        self.playback_sink = PlaybackSink(VOICE_POOL)
 
-        stream = self.pyaudio_instance.open(
-            format=Config.AUDIO_FORMAT,
-            channels=Config.CHANNELS,
-            rate=Config.OUTPUT_RATE,  # Live API outputs at 24kHz
-            output=True
-        )
-        stream.write(audio_data)
-        stream.stop_stream()
-        stream.close()
+    def play_audio(self, audio_data: bytes | memoryview):
+        """Queue audio data for playback through speakers without blocking."""
+        if self.playback_sink is not None:
+            self.playback_sink.write(audio_data)
+
+    async def finish_playback(self):
+        """Wait until queued audio has been played."""
+        if self.playback_sink is not None:
+            sink, self.playback_sink = self.playback_sink, None
+            await sink.wait_closed()
+            if sink.dropped:
+                print(f"Playback buffer overflow: dropped {sink.dropped} bytes")
 
-    def speech_to_text(self, audio_data: bytes) -> str:
+    async def speech_to_text(self, audio_data: bytes | memoryview) -> str:
         """Convert speech audio to text for verification."""
-        audio = speech.RecognitionAudio(content=audio_data)
+        if self.stt_client is None:
+            return ""
+        try:
+            return await _run_blocking(self._recognize, audio_data)
+        except Exception as exc:
+            VOICE_POOL.report_failure(exc)
+            raise
+
+    def _recognize(self, audio_data: bytes | memoryview) -> str:
+        """Run a blocking Speech-to-Text recognize request."""
+        # The request proto needs bytes; this is the only copy of the response audio
+        audio = speech.RecognitionAudio(content=bytes(audio_data))
         config = speech.RecognitionConfig(
             encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
             sample_rate_hertz=Config.OUTPUT_RATE,  # Use output rate for STT
@@ -128,10 +705,870 @@ class VoiceHandler:
         response = self.stt_client.recognize(config=config, audio=audio)
         return response.results[0].alternatives[0].transcript if response.results else ""
 
-    def __del__(self):
-        """Clean up PyAudio instance."""
-        if hasattr(self, 'pyaudio_instance') and self.pyaudio_instance is not None:
-            self.pyaudio_instance.terminate()
+    def create_recognizer(self, on_transcript=None):
+        """Create the configured recognizer for one response, or None without Speech-to-Text."""
+        if self.stt_client is None:
+            return None
+        return RECOGNIZERS[Config.RECOGNIZER](self, on_transcript)
+
+class StreamingRecognizer(ABC):
+    """Base class for recognizers that transcribe response audio as it arrives.
+
+    feed() is called from the event loop with each audio chunk while the
+    response is still being received; on_transcript is called on the event
+    loop with the running transcript whenever it changes. Local recognizers
+    plug in by subclassing, implementing feed() and finish(), and
+    registering in RECOGNIZERS.
+    """
+
+    def __init__(self, voice_handler: VoiceHandler, on_transcript=None):
+        self.voice_handler = voice_handler
+        self.on_transcript = on_transcript
+
+    @abstractmethod
+    def feed(self, chunk: bytes):
+        """Add a chunk of 24kHz 16-bit mono response audio."""
+
+    @abstractmethod
+    async def finish(self) -> str:
+        """Signal the end of the response and return the final transcript."""
+
+    def close(self):
+        """Signal that no more audio will be fed."""
+
+    async def abort(self):
+        """Stop without a transcript (e.g. after an error); nothing is published afterwards."""
+        self.on_transcript = None
+        self.close()
+
+    def _publish(self, transcript: str):
+        """Report the running transcript."""
+        if self.on_transcript and transcript:
+            self.on_transcript(transcript)
+
+class BatchRecognizer(StreamingRecognizer):
+    """Buffers the whole response and runs one recognize request after the turn."""
+
+    def __init__(self, voice_handler: VoiceHandler, on_transcript=None):
+        super().__init__(voice_handler, on_transcript)
+        self._audio = bytearray()
+
+    def feed(self, chunk: bytes):
+        self._audio += chunk
+
+    async def finish(self) -> str:
+        transcript = await self.voice_handler.speech_to_text(self._audio) if self._audio else ""
+        self._publish(transcript)
+        return transcript
+
+class GoogleStreamingRecognizer(StreamingRecognizer):
+    """Streams response audio to Speech-to-Text streaming_recognize with interim results.
+
+    The blocking gRPC stream runs in a worker thread that is started with the
+    first audio chunk (the API times out streams that stay silent) and fed
+    through a thread-safe queue.
+    """
+
+    MAX_REQUEST_BYTES = 15360  # Stay well below the per-request audio limit
+
+    def __init__(self, voice_handler: VoiceHandler, on_transcript=None):
+        super().__init__(voice_handler, on_transcript)
+        self._chunks = queue.Queue()
+        self._loop = None
+        self._worker = None
+        self._final = []
+        self._interim = ""
+
+    def feed(self, chunk: bytes):
+        if self._worker is None:
+            self._loop = asyncio.get_running_loop()
+            self._worker = self._loop.run_in_executor(voice_executor(), self._recognize)
+        for i in range(0, len(chunk), self.MAX_REQUEST_BYTES):
+            self._chunks.put(bytes(chunk[i:i + self.MAX_REQUEST_BYTES]))
+
+    async def finish(self) -> str:
+        if self._worker is None:
+            return ""
+        self.close()
+        try:
+            await self._worker
+        except Exception as exc:
+            print(f"Streaming recognition failed: {exc}")
+            VOICE_POOL.report_failure(exc)
+        return self._transcript()
+
+    def close(self):
+        self._chunks.put(None)
+
+    async def abort(self):
+        # Wait for the worker so it cannot outlive this attempt and call into the next one
+        await super().abort()
+        if self._worker is not None:
+            with contextlib.suppress(Exception):
+                await self._worker
+
+    def _transcript(self) -> str:
+        """Join final results with the latest interim result."""
+        return " ".join(part.strip() for part in self._final + [self._interim] if part.strip())
+
+    def _requests(self):
+        """Yield streaming requests until close() is called."""
+        while True:
+            chunk = self._chunks.get()
+            if chunk is None:
+                return
+            yield speech.StreamingRecognizeRequest(audio_content=chunk)
+
+    def _recognize(self):
+        """Run the streaming recognition in the worker thread."""
+        config = speech.StreamingRecognitionConfig(
+            config=speech.RecognitionConfig(
+                encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+                sample_rate_hertz=Config.OUTPUT_RATE,  # Use output rate for STT
+                language_code="en-US",
+            ),
+            interim_results=True,
+        )
+        responses = self.voice_handler.stt_client.streaming_recognize(config=config, requests=self._requests())
+        for response in responses:
+            for result in response.results:
+                if not result.alternatives:
+                    continue
+                if result.is_final:
+                    self._final.append(result.alternatives[0].transcript)
+                    self._interim = ""
+                else:
+                    self._interim = result.alternatives[0].transcript
+            self._loop.call_soon_threadsafe(self._publish, self._transcript())
+
+RECOGNIZERS = {
+    "streaming": GoogleStreamingRecognizer,
+    "batch": BatchRecognizer,
+}
+
+TIME_OF_DAY_PATTERN = re.compile(r"(?<![\d:.])(\d{1,2})(?::(\d{2}))?\s*(?:([ap])\.?\s?m\b\.?)?(?![\d:])",
+                                 re.IGNORECASE)
+
+def validate_clock(text: str, now: datetime = None) -> bool | None:
+    """Check spoken times of day against the wall clock.
+
+    Returns True if a time in text ("10:14 a.m.", "3 PM", "15:42") is within
+    Config.CLOCK_TOLERANCE_MINUTES of the current time at an allowed UTC
+    offset, False if times were spoken but none matches, and None if text
+    contains no time of day in digits (e.g. "ten fourteen"). A bare hour is
+    read as hh:00. Without am/pm, both 12-hour readings are tried.
+    """
+    now = now or datetime.now(timezone.utc)
+    utc_minutes = now.hour * 60 + now.minute + now.second / 60
+    if Config.CLOCK_UTC_OFFSETS is None:
+        offsets = range(-12 * 60, 14 * 60 + 1, 15)
+    else:
+        offsets = [round(hours * 60) for hours in Config.CLOCK_UTC_OFFSETS]
+
+    spoken = False
+    for match in TIME_OF_DAY_PATTERN.finditer(text):
+        hour, minute, meridiem = int(match[1]), match[2], match[3]
+        if minute is None and meridiem is None:
+            continue  # A bare number
+        if hour > 23 or (minute and int(minute) > 59) or (meridiem and not 1 <= hour <= 12):
+            continue
+        spoken = True
+        if meridiem:
+            hours = [hour % 12 + (12 if meridiem.lower() == "p" else 0)]
+        else:
+            hours = [hour % 12, hour % 12 + 12] if hour <= 12 else [hour]
+        minutes = int(minute) if minute else 0
+        for candidate in hours:
+            for offset in offsets:
+                difference = (candidate * 60 + minutes - utc_minutes - offset) % 1440
+                if min(difference, 1440 - difference) <= Config.CLOCK_TOLERANCE_MINUTES:
+                    return True
+    return False if spoken else None
+
+VALIDATORS = {
+    "clock": validate_clock,
+}
+
+# am/pm counts as a keyword only after a number ("10 a.m.", "3pm"), never as the word "am"
+MERIDIEM_KEYWORD = r"\d{1,2}(?::\d{2})?\s?[ap]\.?\s?m\b\.?"
+MERIDIEM_KEYWORD_LENGTH = len("12:30 a. m.")
+
+@cache
+def _keyword_pattern(keywords: tuple) -> re.Pattern:
+    """Compile keywords and MERIDIEM_KEYWORD into one alternation matched only at word boundaries."""
+    alternatives = "|".join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True))
+    return re.compile(rf"(?<!\w)(?:{alternatives}|{MERIDIEM_KEYWORD})(?!\w)", re.IGNORECASE)
+
+class ResponseVerifier:
+    """Verifies responses with a word-boundary keyword matcher plus pluggable validators.
+
+    feed() consumes response deltas as they arrive and update() a running
+    transcript; both return True once the partial response is verified, i.e.
+    a keyword matched and every validator confirmed it. verify() judges a
+    complete response the same way, except that a validator that found
+    nothing to check (returned None, e.g. a time spelled out in words) leaves
+    the keyword result standing.
+    """
+
+    def __init__(self, keywords: list = None, validators: list = None):
+        self.pattern = _keyword_pattern(tuple(keywords or Config.TIME_KEYWORDS))
+        self.overlap = max(MERIDIEM_KEYWORD_LENGTH, *(len(keyword) for keyword in keywords or Config.TIME_KEYWORDS))
+        names = Config.RESPONSE_VALIDATORS if validators is None else validators
+        self.validators = {name: VALIDATORS[name] for name in names}
+        self.text = ""
+        self.keyword = None
+        self.confirmed = set()  # Validators that confirmed the partial response
+        self.verified = False
+        self.reason = ""
+
+    def feed(self, delta: str) -> bool:
+        """Append a response delta and return whether the response is verified so far."""
+        if self.verified or not delta:
+            return self.verified
+        # A keyword can straddle deltas; lookbehind still sees text before the start position
+        start = max(0, len(self.text) - self.overlap)
+        self.text += delta
+        return self._check(start)
+
+    def update(self, text: str) -> bool:
+        """Replace the response with a running transcript and return whether it is verified."""
+        if self.verified:
+            return True
+        self.text = text
+        self.keyword = None
+        return self._check(0)
+
+    def _check(self, start: int) -> bool:
+        if self.keyword is None:
+            match = self.pattern.search(self.text, start)
+            if not match:
+                return False
+            self.keyword = match[0]
+        for name, validator in self.validators.items():
+            if name not in self.confirmed and validator(self.text):
+                self.confirmed.add(name)
+        self.verified = len(self.confirmed) == len(self.validators)
+        return self.verified
+
+    def verify(self, text: str = None) -> bool:
+        """Judge a complete response (default: the text fed so far); sets reason on failure."""
+        text = self.text if text is None else text
+        if not self.pattern.search(text):
+            self.reason = "Response does not contain time-related keywords"
+            return False
+        for name, validator in self.validators.items():
+            if validator(text) is False:
+                self.reason = f"Response failed the {name} validator"
+                return False
+        self.reason = ""
+        return True
+
+AUDIO_METRICS = {  # Recorded with the latencies of voice attempts: name -> (report label, unit)
+    "audio_duration": ("Duration", "ms"),
+    "audio_rms": ("RMS", "dBFS"),
+    "audio_peak": ("Peak", "dBFS"),
+    "audio_clipping": ("Clipping", "%"),
+    "audio_silence": ("Silence", "%"),
+    "leading_silence": ("Leading Silence", "ms"),
+    "voiced_segments": ("Voiced Segments", ""),
+    "voiced_duration": ("Voiced", "ms"),
+}
+
+# Metrics that depend on the response length, only meaningful when it was read to turn_complete
+DURATION_AUDIO_METRICS = ("audio_duration", "audio_silence", "voiced_segments", "voiced_duration")
+
+def _dbfs(level: float) -> float:
+    """Convert a 16-bit sample level to dBFS, floored at the quantization level (-90.3 dBFS)."""
+    return 20 * math.log10(max(level, 1.0) / 32768)
+
+def analyze_audio(pcm: bytes | memoryview, rate: int = None, complete: bool = True) -> tuple[dict, list]:
+    """Measure 16-bit mono PCM with NumPy: levels, clipping, silence and energy-based voice activity.
+
+    Returns (metrics, segments): metrics keyed like AUDIO_METRICS, and the
+    voiced segments as (start_ms, end_ms). Frames of Config.VAD_FRAME_MS are
+    voiced above Config.VAD_THRESHOLD_DBFS; pauses shorter than
+    Config.VAD_MIN_GAP_MS are bridged and bursts shorter than
+    Config.VAD_MIN_SEGMENT_MS dropped. For a response cut off before its end
+    (complete=False) the DURATION_AUDIO_METRICS are left out, and leading
+    silence too unless speech was heard.
+    """
+    rate = rate or Config.OUTPUT_RATE
+    samples = np.frombuffer(pcm, dtype="<i2", count=len(pcm) // 2)
+    if not samples.size:
+        return {}, []
+    magnitudes = np.abs(samples.astype(np.int32))
+
+    frame = max(1, rate * Config.VAD_FRAME_MS // 1000)
+    frame_count = max(1, samples.size // frame)
+    frames = samples[:frame_count * frame].astype(np.float64).reshape(frame_count, -1)
+    frame_levels = 20 * np.log10(np.maximum(np.sqrt(np.mean(frames ** 2, axis=1)), 1.0) / 32768)
+    voiced = frame_levels > Config.VAD_THRESHOLD_DBFS
+
+    # Voiced runs from the rising and falling edges of the frame mask
+    edges = np.diff(np.concatenate(([0], voiced.astype(np.int8), [0])))
+    frame_ms = frame * 1000 / rate
+    segments = []
+    for start, end in zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)):
+        start_ms, end_ms = float(start * frame_ms), float(end * frame_ms)
+        if segments and start_ms - segments[-1][1] < Config.VAD_MIN_GAP_MS:
+            segments[-1] = (segments[-1][0], end_ms)
+        else:
+            segments.append((start_ms, end_ms))
+    segments = [(start, end) for start, end in segments if end - start >= Config.VAD_MIN_SEGMENT_MS]
+
+    duration_ms = samples.size * 1000 / rate
+    metrics = {
+        "audio_duration": duration_ms,
+        "audio_rms": _dbfs(math.sqrt(np.mean(samples.astype(np.float64) ** 2))),
+        "audio_peak": _dbfs(float(magnitudes.max())),
+        "audio_clipping": 100 * np.count_nonzero(magnitudes >= Config.CLIPPING_LEVEL) / samples.size,
+        "audio_silence": 100 * np.count_nonzero(frame_levels < Config.SILENCE_THRESHOLD_DBFS) / frame_count,
+        "leading_silence": segments[0][0] if segments else duration_ms,
+        "voiced_segments": len(segments),
+        "voiced_duration": sum(end - start for start, end in segments),
+    }
+    if not complete:
+        for name in DURATION_AUDIO_METRICS + (() if segments else ("leading_silence",)):
+            del metrics[name]
+    return {name: float(value) for name, value in metrics.items()}, segments
+
+def decode_audio(audio_path: str) -> tuple:
+    """Decode an audio file to int16 samples shaped (frames, channels) and its sample rate.
+
+    16-bit WAV files are read in-process with the wave module; anything else
+    goes through pydub/ffmpeg.
+    """
+    if audio_path.lower().endswith(".wav"):
+        with wave.open(audio_path, 'rb') as f:
+            if f.getsampwidth() == 2:
+                channels, rate = f.getnchannels(), f.getframerate()
+                return np.frombuffer(f.readframes(f.getnframes()), dtype="<i2").reshape(-1, channels), rate
+    audio = AudioSegment.from_file(audio_path).set_sample_width(2)
+    return np.frombuffer(audio.raw_data, dtype="<i2").reshape(-1, audio.channels), audio.frame_rate
+
+def to_mono_pcm(samples, rate: int, target_rate: int = None) -> bytes:
+    """Mix (frames, channels) samples down to mono and resample them to 16-bit PCM with NumPy.
+
+    Downsampling first low-passes with a Blackman-windowed sinc FIR
+    (np.convolve) cut off at 0.45 of the output rate, so content above the
+    new Nyquist frequency is attenuated instead of aliased; the filtered
+    signal (or, when upsampling, the input) is then interpolated linearly
+    at the output sample positions.
+    """
+    target_rate = target_rate or Config.INPUT_RATE
+    samples = samples.reshape(samples.shape[0], -1)
+    # Summing channel columns is much faster than a mean across each strided row
+    mono = samples[:, 0].astype(np.float64)
+    for channel in range(1, samples.shape[1]):
+        mono += samples[:, channel]
+    mono /= samples.shape[1]
+
+    if rate != target_rate and mono.size:
+        ratio = rate / target_rate
+        if ratio > 1:
+            mono = np.convolve(mono, _lowpass_kernel(ratio), mode="same")
+        positions = np.arange(int(mono.size / ratio)) * ratio
+        mono = np.interp(positions, np.arange(mono.size), mono)
+    return np.clip(np.rint(mono), -32768, 32767).astype("<i2").tobytes()
+
+@cache
+def _lowpass_kernel(ratio: float):
+    """Blackman-windowed sinc anti-aliasing filter for downsampling by `ratio`, unity gain at DC."""
+    half = math.ceil(16 * ratio)
+    taps = np.arange(-half, half + 1)
+    kernel = np.sinc(0.9 / ratio * taps) * np.blackman(taps.size)
+    return kernel / kernel.sum()
+
+@cache
+def synthesize_prompt(utterances: tuple, duration: float = None, fill: str = "silence", lead_silence: float = 0.0,
+                      gap: float = 0.5, noise_dbfs: float = None, seed: int = 0) -> memoryview:
+    """Build a voice prompt as 16-bit mono PCM at Config.INPUT_RATE, cached per arguments.
+
+    The utterances are concatenated with `gap` seconds of silence between them
+    after `lead_silence`. A prompt shorter than `duration` seconds is padded
+    ahead of the utterances, with silence or, for fill="repeat", with the
+    utterances cycled, so the question is always heard last. noise_dbfs
+    overlays seeded white noise at that RMS level over the whole prompt.
+    """
+    rate = Config.INPUT_RATE
+    gap_samples = np.zeros(int(gap * rate), dtype=np.int16)
+    parts = []
+    for path in utterances:
+        parts += [np.frombuffer(to_mono_pcm(*decode_audio(path), rate), dtype="<i2"), gap_samples]
+    cycle = np.concatenate(parts)
+    speech = cycle[:cycle.size - gap_samples.size]
+    lead = np.zeros(int(lead_silence * rate), dtype=np.int16)
+
+    padding = max(0, int((duration or 0) * rate) - lead.size - speech.size)
+    if fill == "repeat" and cycle.size:
+        # Whole cycles end right before the final utterances; only the first one is cut short
+        repeats = padding // cycle.size + 1
+        filler = np.tile(cycle, repeats)[repeats * cycle.size - padding:]
+    else:
+        filler = np.zeros(padding, dtype=np.int16)
+    prompt = np.concatenate((lead, filler, speech))
+
+    if noise_dbfs is not None:
+        noise = np.random.default_rng(seed).normal(0.0, 32768 * 10 ** (noise_dbfs / 20), prompt.size)
+        prompt = np.clip(np.rint(prompt + noise), -32768, 32767)
+    return memoryview(prompt.astype("<i2").tobytes())
+
+def synthetic_prompt() -> memoryview | None:
+    """The synthetic voice prompt configured by Config.PROMPT_*, or None to send Config.AUDIO_FILE as is."""
+    if (Config.PROMPT_DURATION is None and Config.PROMPT_UTTERANCES is None
+            and Config.PROMPT_NOISE_DBFS is None and not Config.PROMPT_LEAD_SILENCE):
+        return None
+    return synthesize_prompt(tuple(Config.PROMPT_UTTERANCES or [Config.AUDIO_FILE]), Config.PROMPT_DURATION,
+                             Config.PROMPT_FILL, Config.PROMPT_LEAD_SILENCE, Config.PROMPT_GAP,
+                             Config.PROMPT_NOISE_DBFS, Config.PROMPT_SEED)
+
+class PhaseTimeout(TimeoutError):
+    """A session phase exceeded its budget in Config.DEADLINES."""
+
+    def __init__(self, phase: str, limit: float):
+        super().__init__(f"Timed out in {phase} phase after {limit:g}s")
+        self.phase = phase
+        self.limit = limit
+
+@contextlib.asynccontextmanager
+async def phase_deadline(phase: str):
+    """Bound the enclosed code by Config.DEADLINES[phase], raising PhaseTimeout when it expires."""
+    limit = Config.DEADLINES[phase]
+    timeout = asyncio.timeout(limit)
+    try:
+        async with timeout:
+            yield
+    except TimeoutError:
+        if timeout.expired():
+            raise PhaseTimeout(phase, limit) from None
+        raise
+
+def _timeout_phase_from_reason(failure_reason: str) -> str:
+    """Return the phase named by a PhaseTimeout failure reason, or ""."""
+    match = re.match(r"Timed out in (\w+) phase", failure_reason or "")
+    return match.group(1) if match else ""
+
+# SessionTimer of the session running in the current task; run_live connects inside it
+CURRENT_TIMER = contextvars.ContextVar("current_timer", default=None)
+
+class SessionTimer:
+    """Records monotonic timestamps for the phases of one live session."""
+
+    # Reported latencies: (name, start mark, end mark)
+    LATENCY_METRICS = [
+        ("setup", "setup_start", "session_created"),
+        ("connect", "connect_start", "connected"),
+        ("voice_setup", "voice_setup_start", "voice_ready"),
+        ("upload", "upload_start", "last_audio_sent"),
+        ("first_event", "request_sent", "first_event"),
+        ("first_text", "request_sent", "first_text"),
+        ("first_audio", "request_sent", "first_audio"),
+        ("turn_complete", "request_sent", "turn_complete"),
+        ("verified", "request_sent", "verified"),
+    ]
+
+    # Reported values recorded directly in milliseconds
+    RECORDED_METRICS = ["upload_jitter"]
+
+    def __init__(self):
+        self.marks = {}
+        self.recorded = {}
+
+    @classmethod
+    def start(cls) -> "SessionTimer":
+        """Create a timer and make it the current task's, so PlatformGemini.connect marks the live connect on it."""
+        timer = cls()
+        CURRENT_TIMER.set(timer)
+        return timer
+
+    @classmethod
+    def metric_names(cls) -> list:
+        """Names of all reported metrics, in report column order."""
+        return [name for name, _, _ in cls.LATENCY_METRICS] + cls.RECORDED_METRICS
+
+    def record(self, name: str, value_ms: float):
+        """Record a metric measured outside the phase marks."""
+        self.recorded[name] = value_ms
+
+    def mark(self, name: str):
+        """Record the first occurrence of a named point in the session."""
+        if name not in self.marks:
+            self.marks[name] = time.monotonic()
+
+    def latencies(self) -> dict:
+        """Return latencies in milliseconds for every metric whose marks were recorded."""
+        latencies = {}
+        for name, start, end in self.LATENCY_METRICS:
+            if start in self.marks and end in self.marks:
+                latencies[name] = (self.marks[end] - self.marks[start]) * 1000
+        latencies.update(self.recorded)
+        return latencies
+
+class UploadPacer:
+    """Paces audio chunk uploads.
+
+    Modes:
+        fixed: Config.FIXED_CHUNK_DELAY between chunks
+        realtime: chunks leave at the rate they would be captured by a microphone
+        accelerated: real-time schedule sped up by `speed`
+        burst: no delay between chunks
+    Realtime and accelerated schedules are computed from the upload start on a
+    monotonic clock, so sleep overshoot does not accumulate as drift.
+    """
+
+    def __init__(self, mode: str = None, speed: float = None):
+        self.mode = mode or Config.UPLOAD_PACING
+        self.speed = 1.0 if self.mode == "realtime" else (speed or Config.UPLOAD_SPEED)
+        self.bytes_per_second = Config.INPUT_RATE * Config.CHANNELS * 2  # 16-bit samples
+        self.start = None
+        self.last_sent = None
+        self.lateness = []  # Milliseconds each chunk left after its scheduled time
+
+    def _scheduled_time(self, offset: int) -> float:
+        """Monotonic time at which the chunk starting at byte `offset` is due."""
+        if self.mode == "fixed":
+            return self.last_sent + Config.FIXED_CHUNK_DELAY
+        return self.start + offset / self.bytes_per_second / self.speed
+
+    async def wait(self, offset: int):
+        """Wait until the chunk starting at byte `offset` is due."""
+        now = time.monotonic()
+        if self.start is None or self.mode == "burst":
+            self.start = self.start or now
+            self.last_sent = now
+            return
+
+        scheduled = self._scheduled_time(offset)
+        if scheduled > now:
+            await asyncio.sleep(scheduled - now)
+        self.last_sent = time.monotonic()
+        self.lateness.append((self.last_sent - scheduled) * 1000)
+
+    def jitter(self) -> float:
+        """Mean lateness of chunks against their schedule in milliseconds."""
+        return sum(self.lateness) / len(self.lateness) if self.lateness else 0.0
+
+@cache
+def platform_gemini() -> type:
+    """Return the PlatformGemini model class, importing google.adk on first use."""
+    from google.adk.models import Gemini
+
+    class PlatformGemini(Gemini):
+        """Gemini model that marks its live connect on the current SessionTimer.
+
+        Platform credentials go in the public client_kwargs field and the mock
+        server endpoint in base_url, instead of GOOGLE_GENAI_USE_VERTEXAI and
+        related environment variables, so sessions on different platforms run
+        concurrently in one process.
+        """
+
+        @contextlib.asynccontextmanager
+        async def connect(self, llm_request):
+            """Open the live connection within Config.DEADLINES["connect"], marking its start and end
+            on the current SessionTimer."""
+            timer = CURRENT_TIMER.get()
+            if timer:
+                timer.mark("connect_start")
+            async with contextlib.AsyncExitStack() as stack:
+                async with phase_deadline("connect"):
+                    connection = await stack.enter_async_context(super().connect(llm_request))
+                if timer:
+                    timer.mark("connected")
+                yield connection
+
+    return PlatformGemini
+
+def preload_dependencies(voice: bool = False):
+    """Import ADK (and the voice stack) up front so first use does not stall a running event loop.
+
+    pydub is only imported when a voice prompt file is not WAV, the one
+    case decode_audio and the PCM conversion hand to it.
+    """
+    for module in (InMemoryRunner, Agent, LiveRequestQueue, RunConfig, Content, types):
+        module._resolve()
+    platform_gemini()
+    from google.adk.tools import google_search  # noqa: F401
+    if voice:
+        np._resolve()
+        if any(not path.lower().endswith(".wav") for path in Config.PROMPT_UTTERANCES or [Config.AUDIO_FILE]):
+            AudioSegment._resolve()
+
+class RunnerCache:
+    """Agents and InMemoryRunners built once per (platform, model, region).
+
+    Every attempt still creates its own session on the cached runner, so tests
+    keep isolated conversation state while skipping agent and client setup.
+    """
+
+    def __init__(self):
+        self._runners = {}
+        self.builds = 0
+        self.hits = 0
+
+    def get(self, platform: str, model: str, region: str, client_options: dict) -> InMemoryRunner:
+        """Return the runner for this target, building it on first use."""
+        key = (platform, model, region)
+        runner = self._runners.get(key)
+        if runner is not None:
+            self.hits += 1
+            return runner
+
+        from google.adk.tools import google_search
+        agent = Agent(
+            name="time_query_agent",
+            model=platform_gemini()(model=model, client_kwargs=client_options, base_url=Config.MOCK_SERVER_URL),
+            description="Agent to answer time queries using Google Search",
+            instruction=f"Answer the question '{Config.TEST_QUESTION}' using the Google Search tool. "
+                       "Provide the current time information.",
+            tools=[google_search],
+        )
+        runner = InMemoryRunner(app_name="agents", agent=agent)
+        self._runners[key] = runner
+        self.builds += 1
+        return runner
+
+    def clear(self):
+        """Drop all cached runners."""
+        self._runners.clear()
+
+RUNNER_CACHE = RunnerCache()
+
+def _update_json_file(path: str, entries: dict) -> dict:
+    """Write entries over the JSON object in path and return the merged object.
+
+    The read-merge-replace runs under an exclusive flock on `path`.lock, so
+    entries written concurrently by other processes (shard workers) are
+    kept, and the file is replaced atomically so readers never see a
+    partial file.
+    """
+    with open(f"{path}.lock", 'a') as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        merged = {}
+        with contextlib.suppress(FileNotFoundError, json.JSONDecodeError):
+            with open(path, 'r', encoding='utf-8') as f:
+                merged = json.load(f)
+        merged.update(entries)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(merged, f, indent=2)
+        os.replace(tmp_path, path)
+    return merged
+
+class CapabilityCache:
+    """Probed response modalities and transcription support per model, on disk with a TTL.
+
+    Entries are keyed by ADK version, endpoint, platform, model and region, so
+    an ADK upgrade, a mock server run or another region (which may serve a
+    different model build) never reuses another setup's probe.
+    """
+
+    def __init__(self, path: str, ttl: float = None):
+        self.path = path
+        self.ttl = Config.CAPABILITY_TTL if ttl is None else ttl
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._entries = {}
+
+    @staticmethod
+    def _key(platform: str, model: str, region: str = None) -> str:
+        key = f"{get_adk_version()}/{Config.MOCK_SERVER_URL or 'live'}/{platform}/{model}"
+        return f"{key}@{region}" if region else key
+
+    def get(self, platform: str, model: str, region: str = None) -> dict | None:
+        """Return {"modalities": [...], "transcription": bool}, or None if unknown or expired."""
+        entry = self._entries.get(self._key(platform, model, region))
+        if entry is None or time.time() - entry["probed_at"] > self.ttl:
+            return None
+        return entry
+
+    def put(self, platform: str, model: str, capabilities: dict, region: str = None):
+        """Store probe results and write the cache file."""
+        entry = {**capabilities, "probed_at": time.time()}
+        self._entries = _update_json_file(self.path, {self._key(platform, model, region): entry})
+
+    def clear(self):
+        """Forget every probe result."""
+        self._entries = {}
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.path)
+
+CAPABILITIES = CapabilityCache(Config.CAPABILITY_CACHE_FILE)
+
+def text_uses_audio(platform: str, model: str, region: str = None) -> bool:
+    """Whether a model's text test must use AUDIO modality with transcription.
+
+    Uses the probed capabilities when cached, and the model name otherwise.
+    """
+    capabilities = CAPABILITIES.get(platform, model, region)
+    if capabilities and capabilities["modalities"]:
+        return "TEXT" not in capabilities["modalities"]
+    return "native-audio" in model.lower()
+
+async def probe_capabilities(targets: list, region: str = None, max_concurrency: int = None):
+    """Probe every (platform, model) target that has no fresh capability cache entry."""
+    missing = [target for target in dict.fromkeys(targets) if CAPABILITIES.get(*target, region) is None]
+    if not missing:
+        return
+    print(f"Probing capabilities of {len(missing)} model(s)...")
+    slots = asyncio.Semaphore(max_concurrency or Config.MAX_CONCURRENCY)
+    started = time.monotonic()
+
+    async def probe(platform: str, model: str):
+        async with slots:
+            tester = ADKStreamingTester(platform, model, region, headless=True)
+            try:
+                capabilities = await tester.probe_capabilities()
+            except Exception as exc:
+                print(f"Probe {platform} {model} failed: {exc}")
+                return
+            if capabilities:
+                CAPABILITIES.put(platform, model, capabilities, region)
+                print(f"Probe {platform} {model}: modalities {capabilities['modalities']}, "
+                      f"transcription {capabilities['transcription']}")
+
+    await asyncio.gather(*(probe(platform, model) for platform, model in missing))
+    print(f"Capability probes finished in {time.monotonic() - started:.1f}s")
+
+class EventRecorder:
+    """Records a run_live event stream as a JSONL trace plus a side blob file for audio.
+
+    The first line is a header. Every event line holds its offset in seconds
+    from the start of the recording (monotonic clock), turn_complete and
+    partial flags, text, transcription, and the [offset, length, mime_type]
+    of its audio payload in the blob file. "mark" lines record when a
+    request was sent, so replays reproduce response latencies.
+    """
+
+    def __init__(self, path_prefix: str, collector: str, marks=None, **metadata):
+        self.trace_path = path_prefix + ".jsonl"
+        self.blob_path = path_prefix + ".blob"
+        self.header = {"trace": 1, "collector": collector, "blob": os.path.basename(self.blob_path), **metadata}
+        self._marks = marks  # Callable returning the current SessionTimer marks
+        self._start = time.monotonic()
+        self._blob_offset = 0
+        self._request_sent = None
+
+    async def record(self, live_events):
+        """Yield live events unchanged while writing them to the trace."""
+        with open(self.trace_path, 'w', encoding='utf-8') as trace, open(self.blob_path, 'wb') as blob:
+            trace.write(json.dumps(self.header) + "\n")
+            async for event in live_events:
+                request_sent = self._marks().get("request_sent") if self._marks else None
+                if request_sent is not None and request_sent != self._request_sent:
+                    self._request_sent = request_sent
+                    trace.write(json.dumps({"t": round(request_sent - self._start, 6), "mark": "request_sent"}) + "\n")
+                trace.write(json.dumps(self._encode(event, blob), ensure_ascii=False) + "\n")
+                # Flush per event so a trace survives an abandoned stream
+                trace.flush()
+                blob.flush()
+                yield event
+
+    def _encode(self, event, blob) -> dict:
+        record = {"t": round(time.monotonic() - self._start, 6), "turn_complete": bool(event.turn_complete),
+                  "partial": bool(event.partial)}
+        if event.content and event.content.parts:
+            part = event.content.parts[0]
+            record["content"] = True
+            if part.text:
+                record["text"] = part.text
+            if part.inline_data and part.inline_data.data:
+                data = part.inline_data.data
+                blob.write(data)
+                record["audio"] = [self._blob_offset, len(data), part.inline_data.mime_type]
+                self._blob_offset += len(data)
+        if event.output_transcription and event.output_transcription.text:
+            record["transcription"] = event.output_transcription.text
+        return record
+
+def load_trace(trace_path: str) -> tuple[dict, list, bytes]:
+    """Read a trace; returns (header, records, blob) with the blob memory-mapped.
+
+    The caller closes the blob when it is an mmap (see _close_blob).
+    """
+    with open(trace_path, 'r', encoding='utf-8') as f:
+        header = json.loads(f.readline())
+        records = [json.loads(line) for line in f if line.strip()]
+    blob_path = os.path.join(os.path.dirname(trace_path), header["blob"])
+    with open(blob_path, 'rb') as f:
+        blob = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(f.fileno()).st_size else b""
+    return header, records, blob
+
+def _close_blob(blob):
+    """Unmap a blob returned by load_trace."""
+    if isinstance(blob, mmap.mmap):
+        blob.close()
+
+def _replay_event(record: dict, blob: bytes) -> SimpleNamespace:
+    """Rebuild a live event with the attributes the collectors read."""
+    content = None
+    if record.get("content"):
+        inline_data = None
+        if "audio" in record:
+            offset, length, mime_type = record["audio"]
+            inline_data = SimpleNamespace(mime_type=mime_type, data=blob[offset:offset + length])
+        content = SimpleNamespace(parts=[SimpleNamespace(text=record.get("text"), inline_data=inline_data)])
+    transcription = SimpleNamespace(text=record["transcription"]) if "transcription" in record else None
+    return SimpleNamespace(turn_complete=record["turn_complete"], partial=record["partial"], content=content,
+                           output_transcription=transcription)
+
+async def replay_trace(trace_path: str, speed: float = 1.0, on_mark=None):
+    """Yield a recorded trace as live events.
+
+    speed 1.0 replays with the original timing, 2.0 twice as fast, and 0 as
+    fast as possible. on_mark, if given, is called with each mark name
+    (e.g. "request_sent") at its recorded time.
+    """
+    _, records, blob = load_trace(trace_path)
+    try:
+        async for event in _replay_records(records, blob, speed, on_mark):
+            yield event
+    finally:
+        _close_blob(blob)
+
+async def _replay_records(records: list, blob: bytes, speed: float, on_mark):
+    """Yield loaded trace records as live events; see replay_trace."""
+    started = time.monotonic()
+    for record in records:
+        if speed:
+            delay = started + record["t"] / speed - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        if "mark" in record:
+            if on_mark:
+                on_mark(record["mark"])
+            continue
+        yield _replay_event(record, blob)
+
+async def replay_session(trace_path: str, speed: float = 1.0, collector: str = None) -> list[dict]:
+    """Feed a trace through the collector that recorded it, one turn at a time.
+
+    Each turn is verified as it streams and, if the recorded session stopped
+    at verification (stop_on_verified in the header), stops there too.
+    Returns the latencies of each replayed turn.
+    """
+    header, records, blob = load_trace(trace_path)
+    try:
+        tester = ADKStreamingTester(header.get("platform", "replay"), header.get("model", "replay"), headless=True)
+        collect = {
+            "text": tester._collect_text_response,
+            "transcription": tester._collect_audio_transcription_response,
+            "audio": tester._collect_audio_response,
+        }[collector or header["collector"]]
+        stop_on_verified = header.get("stop_on_verified", False)
+
+        events = _replay_records(records, blob, speed, on_mark=lambda name: tester.timer.mark(name))
+        turns = max(1, sum(1 for record in records if record.get("turn_complete")))
+        turn_latencies = []
+        for _ in range(turns):
+            tester.timer = SessionTimer()
+            await collect(events, verifier=ResponseVerifier(), stop_on_verified=stop_on_verified)
+            turn_latencies.append(tester.timer.latencies())
+        return turn_latencies
+    finally:
+        _close_blob(blob)
 
 class ADKStreamingTester:
     """Tests ADK bidirectional streaming functionality."""
@@ -143,66 +1580,195 @@ class ADKStreamingTester:
         self.headless = headless
         self.runner = None
         self.session = None
+        self.client_options = {}  # genai.Client credentials for this platform
         self.transcription_result = ""  # Store transcription for reporting
         self.error_trace = ""  # Store error details for reporting
         self.failure_reason = ""  # Store failure reason for reporting
+        self.modality = None  # Response modality of the latest attempt ("TEXT" or "AUDIO")
+        self.timer = SessionTimer()  # Phase timestamps of the latest attempt
 
     def _is_native_audio_model(self) -> bool:
         """Check if the model is a native-audio model."""
         return "native-audio" in self.model.lower()
 
+    async def _deadline_events(self, live_events):
+        """Yield live events, raising PhaseTimeout when the first_event, idle or turn budget runs out.
+
+        Budgets count from the request_sent mark of the current timer, so a
+        stream reused across turns (soak) gets fresh budgets for every turn,
+        or from the connected mark if the connection opened later. run_live
+        connects on the first read, under the connect budget enforced by
+        PlatformGemini.connect; until then that budget is added to these.
+        Expiry cancels the pending read, which closes the run_live stream.
+        """
+        events = aiter(live_events)
+        started = last_event = time.monotonic()
+        while True:
+            marks = self.timer.marks
+            turn_started = max(marks.get("request_sent", started), marks.get("connected", started))
+            if "connected" not in marks:
+                turn_started += Config.DEADLINES["connect"]
+            if "first_event" in marks:
+                phase, deadline = "idle", last_event + Config.DEADLINES["idle"]
+            else:
+                phase, deadline = "first_event", turn_started + Config.DEADLINES["first_event"]
+            if turn_started + Config.DEADLINES["turn"] < deadline:
+                phase, deadline = "turn", turn_started + Config.DEADLINES["turn"]
+
+            timeout = asyncio.timeout(deadline - time.monotonic())
+            try:
+                async with timeout:
+                    event = await anext(events)
+            except StopAsyncIteration:
+                return
+            except TimeoutError:
+                if timeout.expired():
+                    raise PhaseTimeout(phase, Config.DEADLINES[phase]) from None
+                raise
+            last_event = time.monotonic()
+            yield event
+
+    def _record(self, live_events, collector: str, stop_on_verified: bool):
+        """Record live events to a trace in Config.TRACE_DIR, if set.
+
+        collector names the collector that consumes the stream and
+        stop_on_verified whether it stops at verification, so replays can
+        feed the trace to the same collector in the same way.
+        """
+        if not Config.TRACE_DIR:
+            return live_events
+        os.makedirs(Config.TRACE_DIR, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        prefix = os.path.join(Config.TRACE_DIR, f"{self.platform}_{self.model}_{collector}_{timestamp}")
+        recorder = EventRecorder(prefix, collector, marks=lambda: self.timer.marks, platform=self.platform,
+                                 model=self.model, adk_version=get_adk_version(), stop_on_verified=stop_on_verified)
+        print(f"Recording events to {recorder.trace_path}")
+        return recorder.record(live_events)
+
+    def _text_uses_audio(self) -> bool:
+        """Whether text tests need AUDIO modality with transcription."""
+        return text_uses_audio(self.platform, self.model, self.region)
+
+    async def probe_capabilities(self) -> dict | None:
+        """Detect supported response modalities and output transcription.
+
+        Opens one minimal session per modality and stops at the first model
+        output. Returns None if a probe was inconclusive (timeout or a
+        non-permanent error), so nothing is cached from it.
+        """
+        await self.setup_environment()
+        capabilities = {"modalities": [], "transcription": False}
+        for modality in ("TEXT", "AUDIO"):
+            accepted, transcription = await self._probe_modality(modality)
+            if accepted is None:
+                return None
+            if accepted:
+                capabilities["modalities"].append(modality)
+            capabilities["transcription"] |= transcription
+        return capabilities
+
+    async def _probe_modality(self, modality: str) -> tuple[bool | None, bool]:
+        """Open a session with one response modality.
+
+        Returns (accepted, transcription); accepted is None when inconclusive.
+        """
+        await self.create_agent_session()
+        live_request_queue = LiveRequestQueue()
+        if modality == "AUDIO":
+            run_config = RunConfig(
+                response_modalities=["AUDIO"],
+                output_audio_transcription=types.AudioTranscriptionConfig()
+            )
+        else:
+            run_config = RunConfig(response_modalities=["TEXT"])
+        live_events = self.runner.run_live(
+            user_id="test_user",
+            session_id=self.session.id,
+            live_request_queue=live_request_queue,
+            run_config=run_config,
+        )
+        live_request_queue.send_content(content=Content(role="user", parts=[Part.from_text(text=Config.PROBE_PROMPT)]))
+
+        accepted = None
+        transcription = False
+        try:
+            async with asyncio.timeout(Config.CAPABILITY_PROBE_TIMEOUT):
+                async for event in live_events:
+                    if event.output_transcription and event.output_transcription.text:
+                        transcription = True
+                    if event.turn_complete or event.content or event.output_transcription:
+                        accepted = True
+                    # TEXT needs one output; AUDIO waits for a transcription or the end of the turn
+                    if event.turn_complete or (accepted and (modality == "TEXT" or transcription)):
+                        break
+        except TimeoutError:
+            print(f"Probe {self.model} {modality}: timed out")
+        except Exception as exc:
+            if classify_failure(f"Exception: {exc}") == "permanent":
+                accepted = False
+            print(f"Probe {self.model} {modality}: {exc}")
+        finally:
+            live_request_queue.close()
+        return accepted, transcription
+
     async def setup_environment(self):
-        """Configure environment variables for the platform."""
-        if self.platform == "google-ai-studio":
-            os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = "FALSE"
+        """Resolve explicit client credentials for the platform.
+
+        Nothing is written to os.environ, so testers for different platforms
+        can run side by side.
+        """
+        if Config.MOCK_SERVER_URL:
+            # The mock server speaks the Gemini API protocol for every platform
+            self.client_options = {"vertexai": False, "api_key": os.getenv("GOOGLE_API_KEY")}
+            print(f"Using mock Live API server: {Config.MOCK_SERVER_URL}")
+        elif self.platform == "google-ai-studio":
             if not os.getenv("GOOGLE_API_KEY"):
                 raise ValueError("GOOGLE_API_KEY not found in environment")
+            self.client_options = {"vertexai": False, "api_key": os.getenv("GOOGLE_API_KEY")}
         else:  # vertex-ai
-            os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = "TRUE"
             if not os.getenv("GOOGLE_CLOUD_PROJECT"):
                 raise ValueError("GOOGLE_CLOUD_PROJECT required for Vertex AI")
 
             # Use provided region or fall back to environment variable or default
             if self.region:
-                os.environ["GOOGLE_CLOUD_LOCATION"] = self.region
+                location = self.region
                 print(f"Using region: {self.region}")
             elif os.getenv("GOOGLE_CLOUD_LOCATION"):
-                print(f"Using region from environment: {os.getenv('GOOGLE_CLOUD_LOCATION')}")
+                location = os.getenv("GOOGLE_CLOUD_LOCATION")
+                print(f"Using region from environment: {location}")
             else:
-                os.environ["GOOGLE_CLOUD_LOCATION"] = "us-central1"
+                location = "us-central1"
                 print("Using default region: us-central1")
+            self.client_options = {"vertexai": True, "project": os.getenv("GOOGLE_CLOUD_PROJECT"),
+                                   "location": location}
 
     async def create_agent_session(self):
-        """Create ADK agent and session."""
-        agent = Agent(
-            name="time_query_agent",
-            model=self.model,
-            description="Agent to answer time queries using Google Search",
-            instruction=f"Answer the question '{Config.TEST_QUESTION}' using the Google Search tool. "
-                       "Provide the current time information.",
-            tools=[google_search],
-        )
-
-        self.runner = InMemoryRunner(app_name="agents", agent=agent)
+        """Get the cached runner for this model and create a fresh session on it."""
+        self.runner = RUNNER_CACHE.get(self.platform, self.model, self.region, self.client_options)
         self.session = await self.runner.session_service.create_session(
             app_name="agents", user_id="test_user"
         )
-        return agent
+        return self.runner.agent
 
     async def test_text_chat(self) -> bool:
         """Test text chat functionality."""
         self._print_test_header("TEXT CHAT")
+        self.timer = SessionTimer.start()
 
         try:
             await self.setup_environment()
+            self.timer.mark("setup_start")
             await self.create_agent_session()
+            self.timer.mark("session_created")
 
             # Setup live streaming based on model type
             live_request_queue = LiveRequestQueue()
 
-            # Native-audio models require AUDIO modality with transcription
-            if self._is_native_audio_model():
-                print("Native-audio model detected - using AUDIO modality with transcription")
+            # Models without TEXT output (e.g. native-audio) use AUDIO modality with transcription
+            text_uses_audio = self._text_uses_audio()
+            self.modality = "AUDIO" if text_uses_audio else "TEXT"
+            if text_uses_audio:
+                print("Model does not support TEXT modality - using AUDIO modality with transcription")
                 run_config = RunConfig(
                     response_modalities=["AUDIO"],
                     output_audio_transcription=types.AudioTranscriptionConfig()
@@ -210,41 +1776,139 @@ class ADKStreamingTester:
             else:
                 run_config = RunConfig(response_modalities=["TEXT"])
 
+            self.timer.mark("run_live_start")
             live_events = self.runner.run_live(
                 user_id="test_user",
                 session_id=self.session.id,
                 live_request_queue=live_request_queue,
                 run_config=run_config,
             )
+            live_events = self._record(live_events, "transcription" if text_uses_audio else "text",
+                                       Config.CLOSE_ON_VERIFIED)
 
-            # Send question and collect response
-            content = Content(role="user", parts=[Part.from_text(text=Config.TEST_QUESTION)])
-            live_request_queue.send_content(content=content)
+            try:
+                # Send question and collect response
+                content = Content(role="user", parts=[Part.from_text(text=Config.TEST_QUESTION)])
+                live_request_queue.send_content(content=content)
+                self.timer.mark("request_sent")
 
-            print(f"Question: {Config.TEST_QUESTION}")
-            print("Response: ", end="", flush=True)
+                print(f"Question: {Config.TEST_QUESTION}")
+                print("Response: ", end="", flush=True)
 
-            # Collect response based on model type
-            if self._is_native_audio_model():
-                full_response = await self._collect_audio_transcription_response(live_events)
-            else:
-                full_response = await self._collect_text_response(live_events)
-
-            live_request_queue.close()
+                # Collect response based on modality, verifying it as it streams
+                verifier = ResponseVerifier()
+                collect = self._collect_audio_transcription_response if text_uses_audio else self._collect_text_response
+                full_response = await collect(live_events, verifier, stop_on_verified=Config.CLOSE_ON_VERIFIED)
+            finally:
+                live_request_queue.close()
 
             # Verify response
-            success = self._verify_time_response(full_response)
+            success = verifier.verified or verifier.verify(full_response)
             if not success:
                 if not full_response or full_response.strip() == "":
                     self.failure_reason = "Empty response received"
                 else:
-                    self.failure_reason = "Response does not contain time-related keywords"
+                    self.failure_reason = verifier.reason
             self._print_test_result(success, "Response contains time-related information")
+            self._print_latencies()
             return success
 
         except Exception as exc:
             return self._handle_test_exception(exc)
     
+    async def soak_session(self, turns: int, script: list, interval: float = 0.0,
+                           on_turn=None) -> list[dict]:
+        """Send scripted turns over one run_live stream and measure each turn.
+
+        Returns one record per turn with its latencies, the client's RSS and
+        traced Python memory, and the number of events in the ADK session.
+        on_turn, if given, receives each record as soon as it is taken.
+        Stops early if a turn times out or raises, since the stream is then
+        unusable; the failing turn is recorded as failed, its error becomes
+        failure_reason and the records gathered so far are returned.
+        """
+        self._print_test_header("SOAK")
+        await self.setup_environment()
+        await self.create_agent_session()
+
+        # One stream has one response modality; audio turns need AUDIO with transcription
+        audio_modality = "audio" in script or self._text_uses_audio()
+        if audio_modality:
+            run_config = RunConfig(
+                response_modalities=["AUDIO"],
+                output_audio_transcription=types.AudioTranscriptionConfig()
+            )
+        else:
+            run_config = RunConfig(response_modalities=["TEXT"])
+        question_pcm = None
+        if "audio" in script:
+            question_pcm = await VoiceHandler(headless=True, use_stt=False).load_prompt()
+
+        live_request_queue = LiveRequestQueue()
+        live_events = self.runner.run_live(
+            user_id="test_user",
+            session_id=self.session.id,
+            live_request_queue=live_request_queue,
+            run_config=run_config,
+        )
+        live_events = self._record(live_events, "transcription" if audio_modality else "text", False)
+
+        records = []
+        try:
+            for turn in range(1, turns + 1):
+                kind = script[(turn - 1) % len(script)]
+                connected = self.timer.marks.get("connected")
+                self.timer = SessionTimer.start()
+                if connected is not None:
+                    # The connection stays open, so later turns get no connect allowance in _deadline_events
+                    self.timer.marks["connected"] = connected
+                print(f"\n--- Turn {turn}/{turns} ({kind}) ---")
+                failure = None
+                verifier = ResponseVerifier()
+                try:
+                    if kind == "audio":
+                        async with phase_deadline("upload"):
+                            await self._send_audio_chunks(question_pcm, live_request_queue, "question")
+                    else:
+                        content = Content(role="user", parts=[Part.from_text(text=Config.TEST_QUESTION)])
+                        live_request_queue.send_content(content=content)
+                        self.timer.mark("request_sent")
+
+                    # The stream is reused, so every turn is read up to turn_complete
+                    if audio_modality:
+                        response = await self._collect_audio_transcription_response(live_events, verifier)
+                    else:
+                        response = await self._collect_text_response(live_events, verifier)
+                except Exception as exc:
+                    print(f"Turn {turn}: {exc}")
+                    response = ""
+                    failure = str(exc) if isinstance(exc, PhaseTimeout) else \
+                        f"Exception: {str(exc) or type(exc).__name__}"
+
+                session = await self.runner.session_service.get_session(
+                    app_name="agents", user_id="test_user", session_id=self.session.id
+                )
+                traced, _ = tracemalloc.get_traced_memory()
+                records.append({
+                    "turn": turn,
+                    "kind": kind,
+                    "success": not failure and (verifier.verified or verifier.verify(response)),
+                    "latencies": self.timer.latencies(),
+                    "rss_mb": _current_rss_mb(),
+                    "traced_mb": traced / 2**20,
+                    "session_events": len(session.events),
+                })
+                if on_turn:
+                    on_turn(records[-1])
+                if failure:
+                    self.failure_reason = f"{failure} (turn {turn})"
+                    break
+                if interval:
+                    await asyncio.sleep(interval)
+        finally:
+            live_request_queue.close()
+        return records
+
     def _print_test_header(self, test_type: str):
         """Print test header."""
         print(f"\n{'='*60}")
@@ -258,231 +1922,888 @@ class ADKStreamingTester:
         print(f"Test Result: {status}")
         print(f"{icon} {message}")
     
+    def _print_latencies(self):
+        """Print latencies of the latest attempt."""
+        latencies = self.timer.latencies()
+        if latencies:
+            print("Latency: " + ", ".join(f"{name} {value:.0f}ms" for name, value in latencies.items()))
+
     def _print_test_error(self, error_msg: str):
         """Print test error."""
         print("Test Result: ERROR")
         print(f"✗ Error: {error_msg}")
     
-    def _verify_time_response(self, response: str) -> bool:
-        """Verify if response contains time-related information."""
-        return any(keyword in response.lower() for keyword in Config.TIME_KEYWORDS)
+    def _verify_partial(self, verifier: ResponseVerifier, delta: str) -> bool:
+        """Feed a response delta to verifier and mark the response verified once it is."""
+        if verifier is None or "verified" in self.timer.marks:
+            return "verified" in self.timer.marks
+        if verifier.feed(delta):
+            self.timer.mark("verified")
+            return True
+        return False
     
     def _handle_test_exception(self, exc: Exception) -> bool:
         """Handle test exceptions consistently."""
         import traceback
         self.error_trace = traceback.format_exc()
-        self.failure_reason = f"Exception: {str(exc)}"
+        if isinstance(exc, PhaseTimeout):
+            self.failure_reason = str(exc)
+        else:
+            self.failure_reason = f"Exception: {str(exc) or type(exc).__name__}"
         self._print_test_error(str(exc))
         return False
     
-    async def _collect_text_response(self, live_events) -> str:
-        """Collect text response from live events."""
-        full_response = ""
-        async for event in live_events:
-            if event.turn_complete:
-                break
-            if event.content and event.content.parts:
-                part = event.content.parts[0]
-                if part.text and event.partial:
-                    print(part.text, end="", flush=True)
-                    full_response += part.text
+    async def _collect_text_response(self, live_events, verifier: ResponseVerifier = None,
+                                     stop_on_verified: bool = False) -> str:
+        """Collect text response from live events.
+
+        Partial text is fed to verifier as it arrives; with stop_on_verified
+        collection ends as soon as the response is verified.
+        """
+        response_chunks = []
+        live_events = EVENT_PROFILER.instrument(self._deadline_events(live_events), "text")
+        # Closed even when collection stops early, so no instrumented read stays suspended
+        async with contextlib.aclosing(live_events):
+            async for event in live_events:
+                self.timer.mark("first_event")
+                if event.turn_complete:
+                    self.timer.mark("turn_complete")
+                    break
+                if event.content and event.content.parts:
+                    part = event.content.parts[0]
+                    if part.text and event.partial:
+                        self.timer.mark("first_text")
+                        print(part.text, end="", flush=True)
+                        response_chunks.append(part.text)
+                        if self._verify_partial(verifier, part.text) and stop_on_verified:
+                            break
         print("\n")
-        return full_response
+        return "".join(response_chunks)
 
-    async def _collect_audio_transcription_response(self, live_events) -> str:
-        """Collect audio transcription response from live events."""
-        full_response = ""
-        async for event in live_events:
-            if event.turn_complete:
-                break
-            if event.output_transcription and event.output_transcription.text:
-                transcript_text = event.output_transcription.text
-                print(transcript_text, end="", flush=True)
-                full_response += transcript_text
+    async def _collect_audio_transcription_response(self, live_events, verifier: ResponseVerifier = None,
+                                                    stop_on_verified: bool = False) -> str:
+        """Collect audio transcription response from live events.
+
+        Transcription deltas are verified as in _collect_text_response.
+        """
+        response_chunks = []
+        live_events = EVENT_PROFILER.instrument(self._deadline_events(live_events), "transcription")
+        async with contextlib.aclosing(live_events):
+            async for event in live_events:
+                self.timer.mark("first_event")
+                if event.turn_complete:
+                    self.timer.mark("turn_complete")
+                    break
+                if event.content and event.content.parts:
+                    part = event.content.parts[0]
+                    if part.inline_data and part.inline_data.data:
+                        self.timer.mark("first_audio")
+                if event.output_transcription and event.output_transcription.text:
+                    self.timer.mark("first_text")
+                    transcript_text = event.output_transcription.text
+                    print(transcript_text, end="", flush=True)
+                    response_chunks.append(transcript_text)
+                    if self._verify_partial(verifier, transcript_text) and stop_on_verified:
+                        break
         print("\n")
-        return full_response
+        return "".join(response_chunks)
 
-    async def _send_audio_chunks(self, pcm_data: bytes, live_request_queue, label: str):
-        """Send audio data in chunks for streaming."""
+    async def _send_audio_chunks(self, pcm_data: bytes | memoryview, live_request_queue, label: str):
+        """Send audio data in chunks for streaming, paced by Config.UPLOAD_PACING."""
         total_chunks = (len(pcm_data) + Config.CHUNK_SIZE - 1) // Config.CHUNK_SIZE
-        print(f"Sending {label} audio in {total_chunks} chunks ({len(pcm_data)} bytes)")
-        
+        pacer = UploadPacer()
+        print(f"Sending {label} audio in {total_chunks} chunks ({len(pcm_data)} bytes, {pacer.mode} pacing)")
+
+        self.timer.mark("upload_start")
         for i in range(0, len(pcm_data), Config.CHUNK_SIZE):
+            await pacer.wait(i)
             chunk = pcm_data[i:i+Config.CHUNK_SIZE]
-            blob = Blob(data=chunk, mime_type="audio/pcm;rate=16000")
+            blob = Blob(data=bytes(chunk), mime_type="audio/pcm;rate=16000")
             live_request_queue.send_realtime(blob)
-            await asyncio.sleep(0.01)  # Small delay for streaming
-        
+
+        self.timer.mark("last_audio_sent")
+        self.timer.record("upload_jitter", pacer.jitter())
+        self.timer.mark("request_sent")
         print(f"Sent all {total_chunks} {label} chunks")
 
     async def test_voice_chat(self) -> bool:
         """Test voice chat functionality."""
         self._print_test_header("VOICE CHAT")
+        self.timer = SessionTimer.start()
+        self.modality = "AUDIO"
 
         try:
             await self.setup_environment()
+            self.timer.mark("setup_start")
             await self.create_agent_session()
+            self.timer.mark("session_created")
+
+            self.timer.mark("voice_setup_start")
+            voice_handler = VoiceHandler(headless=self.headless, use_stt=not Config.MOCK_SERVER_URL)
+            self.timer.mark("voice_ready")
 
-            voice_handler = VoiceHandler(headless=self.headless)
-            
             # Setup live streaming for audio
             live_request_queue = LiveRequestQueue()
             run_config = RunConfig(response_modalities=["AUDIO"])
+            self.timer.mark("run_live_start")
             live_events = self.runner.run_live(
                 user_id="test_user",
                 session_id=self.session.id,
                 live_request_queue=live_request_queue,
                 run_config=run_config,
             )
-            
-            # Load and send audio question
-            print(f"Loading audio file: {Config.AUDIO_FILE}")
-            question_pcm = voice_handler.load_audio_as_pcm(Config.AUDIO_FILE)
-            await self._send_audio_chunks(question_pcm, live_request_queue, "question")
-            
-            # Collect audio response
-            audio_response, text_response = await self._collect_audio_response(live_events)
-            live_request_queue.close()
-            
+            live_events = self._record(live_events, "audio", Config.CLOSE_ON_VERIFIED)
+
+            try:
+                # Load and send audio question
+                question_pcm = await voice_handler.load_prompt()
+                async with phase_deadline("upload"):
+                    await self._send_audio_chunks(question_pcm, live_request_queue, "question")
+
+                # Bound to this attempt's timer, so a late transcript cannot verify a retry
+                timer = self.timer
+                recognizer = voice_handler.create_recognizer(lambda transcript: self._on_transcript(transcript, timer))
+
+                def on_audio(chunk):
+                    voice_handler.play_audio(chunk)
+                    if recognizer:
+                        recognizer.feed(chunk)
+
+                # Collect audio response while it is played and transcribed
+                voice_handler.start_playback()
+                try:
+                    audio_response, text_response = await self._collect_audio_response(
+                        live_events, on_audio, ResponseVerifier(), stop_on_verified=Config.CLOSE_ON_VERIFIED)
+                except BaseException:
+                    if recognizer:
+                        await recognizer.abort()
+                    await voice_handler.finish_playback()
+                    raise
+            finally:
+                live_request_queue.close()
+
             # Process and verify response
-            success = await self._process_voice_response(voice_handler, audio_response, text_response)
+            success = await self._process_voice_response(voice_handler, recognizer, audio_response, text_response)
             self._print_test_result(success, "Voice response contains time-related information")
+            self._print_latencies()
             return success
             
         except Exception as exc:
             return self._handle_test_exception(exc)
     
-    async def _collect_audio_response(self, live_events):
-        """Collect audio response from live events."""
+    async def _collect_audio_response(self, live_events, on_audio=None, verifier: ResponseVerifier = None,
+                                      stop_on_verified: bool = False) -> tuple[memoryview, str]:
+        """Collect audio response from live events.
+
+        Audio is appended to a bytearray (amortized O(n)) and returned as a
+        zero-copy memoryview over it. on_audio, if given, receives each audio
+        chunk as it arrives. Text parts are fed to verifier; with
+        stop_on_verified collection ends once the response is verified from
+        them or from a running transcript (_on_transcript).
+        """
         print("Waiting for voice response...")
-        audio_data = b""
-        text_data = ""
+        audio_buffer = bytearray()
+        text_chunks = []
         event_count = 0
-        
-        try:
-            async with asyncio.timeout(Config.TIMEOUT):
-                async for event in live_events:
-                    event_count += 1
-                    
-                    if event.turn_complete:
-                        print(f"Turn complete after {event_count} events")
-                        break
-                    
-                    if event.content and event.content.parts:
-                        part = event.content.parts[0]
-                        
-                        # Handle audio response
-                        if (part.inline_data and part.inline_data.mime_type and 
-                            part.inline_data.mime_type.startswith("audio/")):
-                            audio_data += part.inline_data.data
-                            print(f"Received {len(part.inline_data.data)} bytes of audio")
-                        
-                        # Handle text response (for verification)
-                        elif part.text:
-                            text_data += part.text
-                            print(f"Received text: {part.text}")
-                    
-                    # Progress indicator
-                    if event_count % 10 == 0:
-                        print(f"Processed {event_count} events...")
-                        
-        except asyncio.TimeoutError:
-            print(f"Audio test timed out after {Config.TIMEOUT} seconds")
-        
-        return audio_data, text_data
+        live_events = EVENT_PROFILER.instrument(self._deadline_events(live_events), "audio")
+        async with contextlib.aclosing(live_events):
+            async for event in live_events:
+                event_count += 1
+                self.timer.mark("first_event")
+
+                if event.turn_complete:
+                    self.timer.mark("turn_complete")
+                    print(f"Turn complete after {event_count} events")
+                    break
+
+                if event.content and event.content.parts:
+                    part = event.content.parts[0]
+
+                    # Handle audio response
+                    if (part.inline_data and part.inline_data.mime_type and 
+                        part.inline_data.mime_type.startswith("audio/")):
+                        self.timer.mark("first_audio")
+                        audio_buffer += part.inline_data.data
+                        if on_audio:
+                            on_audio(part.inline_data.data)
+                        print(f"Received {len(part.inline_data.data)} bytes of audio")
+
+                    # Handle text response (for verification)
+                    elif part.text:
+                        self.timer.mark("first_text")
+                        text_chunks.append(part.text)
+                        print(f"Received text: {part.text}")
+                        self._verify_partial(verifier, part.text)
+
+                # Progress indicator
+                if event_count % 10 == 0:
+                    print(f"Processed {event_count} events...")
+
+                if stop_on_verified and "verified" in self.timer.marks:
+                    print(f"Response verified after {event_count} events")
+                    break
+
+        return memoryview(audio_buffer), "".join(text_chunks)
     
-    async def _process_voice_response(self, voice_handler: VoiceHandler, audio_data: bytes, text_data: str) -> bool:
+    def _on_transcript(self, transcript: str, timer: SessionTimer):
+        """Mark the response verified on timer as soon as a running transcript is verified."""
+        if "verified" not in timer.marks and ResponseVerifier().update(transcript):
+            timer.mark("verified")
+            print(f"Verified from transcript: '{transcript}'")
+
+    async def _process_voice_response(self, voice_handler: VoiceHandler, recognizer: StreamingRecognizer,
+                                      audio_data: memoryview, text_data: str) -> bool:
         """Process voice response and verify it contains time information."""
+        # Let queued audio finish playing while the transcript is finalized
+        playback = asyncio.create_task(voice_handler.finish_playback())
         if not audio_data:
+            if recognizer:
+                await recognizer.abort()
+            await playback
             print("No audio response received")
             self.transcription_result = "No audio response received"
             self.failure_reason = "No audio response received"
             return False
 
-        print("Playing voice response...")
-        voice_handler.play_audio(audio_data)
+        # Local analysis catches silent responses without a Speech-to-Text round trip
+        # A session closed on verification stops mid-response, so its length says nothing
+        truncated = "turn_complete" not in self.timer.marks
+        metrics, segments = analyze_audio(audio_data, complete=not truncated)
+        for name, value in metrics.items():
+            self.timer.record(name, value)
+        self.timer.record("audio_truncated", float(truncated))
+        if truncated:
+            print(f"Response audio (truncated at verification): RMS {metrics['audio_rms']:.1f} dBFS, "
+                  f"peak {metrics['audio_peak']:.1f} dBFS")
+        else:
+            print(f"Response audio: {metrics['audio_duration']:.0f}ms, RMS {metrics['audio_rms']:.1f} dBFS, "
+                  f"peak {metrics['audio_peak']:.1f} dBFS, {metrics['audio_silence']:.0f}% silence, "
+                  f"{len(segments)} voiced segment(s) starting at {metrics['leading_silence']:.0f}ms")
+        if not segments:
+            if recognizer:
+                await recognizer.abort()
+            await playback
+            self.transcription_result = "Audio response is silent"
+            self.failure_reason = f"Audio response is silent (peak {metrics['audio_peak']:.1f} dBFS)"
+            return False
 
-        # Transcribe for verification
-        response_text = voice_handler.speech_to_text(audio_data)
+        # Final transcript; the recognizer has been transcribing since the first chunk
+        response_text = await recognizer.finish() if recognizer else ""
+        await playback
         self.transcription_result = response_text or text_data or "No transcription available"
         print(f"Voice response (transcribed): '{response_text}'")
 
-        # Verify response contains time information
+        # Verify response contains time information, either already from a
+        # partial transcript or from the final one
         verification_text = response_text or text_data
-        success = self._verify_time_response(verification_text)
+        verifier = ResponseVerifier()
+        success = "verified" in self.timer.marks or verifier.verify(verification_text)
         if not success:
             if not verification_text or verification_text.strip() == "":
                 self.failure_reason = "No transcribable content in audio response"
             else:
-                self.failure_reason = "Voice response does not contain time-related keywords"
+                self.failure_reason = f"Voice {verifier.reason[0].lower()}{verifier.reason[1:]}"
         return success
 
-async def run_all_tests(region: str = None, headless: bool = False) -> tuple[dict, dict, dict, dict, dict]:
-    """Run combined text and voice tests for all platform and model combinations."""
+async def run_all_tests(region: str = None, headless: bool = False,
+                        max_concurrency: int = None, platform_limits: dict = None,
+                        shard: tuple[int, int] = None, run_id: str = None) -> tuple[dict, dict, dict, dict, dict, dict, dict]:
+    """Run combined text and voice tests for all platform and model combinations.
+
+    With shard=(index, count) only that shard of the matrix runs (worker
+    mode): its records are stored under run_id for a coordinator to merge,
+    and no report is rendered.
+    """
     print("Starting ADK Bidirectional Streaming Tests (COMBINED)")
     if headless:
         print("Running in HEADLESS mode - audio playback disabled")
     print("=" * 60)
 
-    results = {}
-    transcriptions = {}
-    error_traces = {}
-    retry_counts = {}
-    failure_reasons = {}
+    scheduler = MatrixScheduler(max_concurrency, platform_limits)
+    matrix = _build_test_matrix()
+    if shard:
+        matrix = shard_matrix(matrix, *shard)
+        print(f"Worker for shard {shard[0]}/{shard[1]}")
+    print(f"Scheduling {len(matrix)} tests (max {scheduler.max_concurrency} concurrent sessions, "
+          f"per platform: {scheduler.platform_limits})")
+
+    # A shard may hold text tests only; then the voice stack is never loaded
+    voice = any(test_type == "voice" for _, _, test_type in matrix)
+    preload_dependencies(voice=voice)
+    await probe_capabilities([(platform, model) for platform, model, _ in matrix], region, scheduler.max_concurrency)
+    if voice:
+        await VOICE_POOL.warm_up(use_stt=not Config.MOCK_SERVER_URL, playback=not headless)
+    lag_monitor = LoopLagMonitor()
+    lag_monitor.start()
+    started = time.monotonic()
+    try:
+        results, transcriptions, error_traces, retry_counts, failure_reasons, timings, modalities = \
+            await scheduler.run(matrix, region, headless)
+    finally:
+        VOICE_POOL.shutdown()
+    elapsed = time.monotonic() - started
+    loop_lag = await lag_monitor.stop()
+    _print_loop_lag(loop_lag)
+
+    # Print summary, store the results and render the report from the store
+    _print_test_summary(results)
+    run_id = run_id or _generate_run_id(region)
+    store = ResultStore(Config.RESULTS_STORE)
+    records = build_run_records(run_id, region, matrix, results, transcriptions, error_traces, retry_counts,
+                                failure_reasons, timings, modalities, loop_lag, VOICE_POOL.summary(),
+                                EVENT_PROFILER.summary())
+    if shard:
+        records[0]["workers"] = [{"shard": f"{shard[0]}/{shard[1]}", "tests": len(results), "elapsed": elapsed,
+                                  "loop_lag": loop_lag}]
+    store.append(records)
+    if shard:
+        print(f"\nShard {shard[0]}/{shard[1]} results stored in {Config.RESULTS_STORE} (run {run_id})")
+        return results, transcriptions, error_traces, retry_counts, failure_reasons, timings, modalities
+    report_filename = _generate_report_filename(run_id=run_id)
+    render_test_report(store.load(run_id), report_filename)
+    print(f"\nTest report generated: {report_filename}")
+
+    return results, transcriptions, error_traces, retry_counts, failure_reasons, timings, modalities
+
+async def run_region_sweep(regions: list, headless: bool = False, max_concurrency: int = None,
+                           platform_limits: dict = None, model: str = None) -> dict:
+    """Run the Vertex AI matrix in every region concurrently and write one region comparison report.
+
+    Each region gets its own MatrixScheduler, so concurrency limits apply per
+    regional quota, and its testers build region-specific clients, runners and
+    permanent failure memory; nothing is shared through os.environ. Every
+    region is stored as a separate run in the result store.
+
+    Returns:
+        {region: run_id}
+    """
+    print(f"Starting ADK Bidirectional Streaming Region Sweep: {', '.join(regions)}")
+    print("=" * 60)
+
+    matrix = [(platform, name, test_type) for platform, name, test_type in _build_test_matrix()
+              if platform == "vertex-ai" and (not model or name == model)]
+    schedulers = {region: MatrixScheduler(max_concurrency, platform_limits) for region in regions}
+    print(f"Scheduling {len(matrix)} tests in each of {len(regions)} regions "
+          f"(max {schedulers[regions[0]].max_concurrency} concurrent sessions per region)")
 
-    # Test Google AI Studio
-    print("\nTesting Google AI Studio Platform")
-    print("-" * 40)
+    voice = any(test_type == "voice" for _, _, test_type in matrix)
+    preload_dependencies(voice=voice)
+    # Regions may serve different builds of a model, so each region is probed
+    targets = sorted({(platform, name) for platform, name, _ in matrix})
+    await asyncio.gather(*(probe_capabilities(targets, region) for region in regions))
+    if voice:
+        await VOICE_POOL.warm_up(use_stt=not Config.MOCK_SERVER_URL, playback=not headless)
+    lag_monitor = LoopLagMonitor()
+    lag_monitor.start()
+    try:
+        outcomes = await asyncio.gather(*(schedulers[region].run(matrix, region, headless) for region in regions))
+    finally:
+        VOICE_POOL.shutdown()
+    loop_lag = await lag_monitor.stop()
+    _print_loop_lag(loop_lag)
 
-    # Run both text and voice tests for Google AI Studio
-    studio_text_results, studio_text_transcriptions, studio_text_errors, studio_text_retries, studio_text_failures = await _test_platform(
-        "google-ai-studio", Config.GOOGLE_AI_STUDIO_MODELS, "text", region, headless
-    )
-    studio_voice_results, studio_voice_transcriptions, studio_voice_errors, studio_voice_retries, studio_voice_failures = await _test_platform(
-        "google-ai-studio", Config.GOOGLE_AI_STUDIO_MODELS, "voice", region, headless
-    )
+    store = ResultStore(Config.RESULTS_STORE)
+    run_ids = {}
+    for region, outcome in zip(regions, outcomes):
+        print(f"\nRegion {region}:")
+        _print_test_summary(outcome[0])
+        run_ids[region] = _generate_run_id(region)
+        store.append(build_run_records(run_ids[region], region, matrix, *outcome, loop_lag, VOICE_POOL.summary(),
+                                       EVENT_PROFILER.summary()))
 
-    results.update(studio_text_results)
-    results.update(studio_voice_results)
-    transcriptions.update(studio_text_transcriptions)
-    transcriptions.update(studio_voice_transcriptions)
-    error_traces.update(studio_text_errors)
-    error_traces.update(studio_voice_errors)
-    retry_counts.update(studio_text_retries)
-    retry_counts.update(studio_voice_retries)
-    failure_reasons.update(studio_text_failures)
-    failure_reasons.update(studio_voice_failures)
-
-    # Test Vertex AI
-    print("\nTesting Google Cloud Vertex AI Platform")
-    print("-" * 40)
-
-    # Run both text and voice tests for Vertex AI
-    vertex_text_results, vertex_text_transcriptions, vertex_text_errors, vertex_text_retries, vertex_text_failures = await _test_platform(
-        "vertex-ai", Config.VERTEX_AI_MODELS, "text", region, headless
-    )
-    vertex_voice_results, vertex_voice_transcriptions, vertex_voice_errors, vertex_voice_retries, vertex_voice_failures = await _test_platform(
-        "vertex-ai", Config.VERTEX_AI_MODELS, "voice", region, headless
+    report_filename = f"region_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+    render_region_report({region: store.load(run_id) for region, run_id in run_ids.items()}, report_filename)
+    print(f"\nRegion report generated: {report_filename}")
+    return run_ids
+
+# Options the coordinator sets per worker, or applies once for all of them, instead of passing them on:
+# option -> whether it takes a value. The coordinator clears the shared caches before probing; workers must not
+COORDINATOR_OPTIONS = {"--workers": True, "--shard": True, "--run-id": True, "--results-store": True,
+                       "--concurrency": True, "--studio-concurrency": True, "--vertex-concurrency": True,
+                       "--reprobe": False, "--recheck-permanent": False}
+
+def _worker_argv(argv: list) -> list:
+    """The coordinator's command-line arguments without COORDINATOR_OPTIONS."""
+    passed = []
+    skip_value = False
+    for arg in argv:
+        if skip_value:
+            skip_value = False
+        elif arg.split("=", 1)[0] in COORDINATOR_OPTIONS:
+            skip_value = COORDINATOR_OPTIONS[arg.split("=", 1)[0]] and "=" not in arg
+        else:
+            passed.append(arg)
+    return passed
+
+async def _run_worker(label: str, command: list) -> int:
+    """Run one worker process, printing its output prefixed with label, and return its exit code."""
+    process = await asyncio.create_subprocess_exec(*command, stdout=asyncio.subprocess.PIPE,
+                                                   stderr=asyncio.subprocess.STDOUT, limit=1 << 20,
+                                                   env={**os.environ, "PYTHONUNBUFFERED": "1"})
+    async for line in process.stdout:
+        print(f"[{label}] {line.decode(errors='replace').rstrip()}")
+    return await process.wait()
+
+async def run_sharded_tests(workers: int, worker_args: list, region: str = None, max_concurrency: int = None,
+                            platform_limits: dict = None) -> str:
+    """Run the test matrix in `workers` local processes, one shard each, and merge them into one report.
+
+    Each worker is this script in shard mode with worker_args, storing its
+    records in Config.SHARD_DIR under a shared run id, with its own event
+    loop, voice resources and genai clients. Session limits are divided among
+    the workers so their sum equals the platform quotas (ValueError if there
+    are more workers than the smallest limit), and capabilities are probed
+    here first so workers only read the cache.
+
+    Returns:
+        The report filename
+    """
+    limits = {"concurrency": max_concurrency or Config.MAX_CONCURRENCY,
+              **Config.PLATFORM_CONCURRENCY, **(platform_limits or {})}
+    name, smallest = min(limits.items(), key=lambda item: item[1])
+    if workers > smallest:
+        raise ValueError(f"--workers {workers} exceeds the {name} limit of {smallest} sessions; "
+                         f"every worker needs at least one")
+    # Floor shares with the remainder going to the first workers, so each limit's shares sum to it exactly
+    per_worker = [{name: limit // workers + (index < limit % workers) for name, limit in limits.items()}
+                  for index in range(workers)]
+
+    run_id = _generate_run_id(region)
+    matrix = _build_test_matrix()
+    preload_dependencies()
+    await probe_capabilities(sorted({(platform, model) for platform, model, _ in matrix}), region, max_concurrency)
+
+    os.makedirs(Config.SHARD_DIR, exist_ok=True)
+    paths = [os.path.join(Config.SHARD_DIR, f"{run_id}_shard{index}.jsonl") for index in range(1, workers + 1)]
+    print(f"Starting {workers} workers for run {run_id}: {len(matrix)} tests, per worker limits {per_worker}")
+
+    exit_codes = await asyncio.gather(*(
+        _run_worker(f"shard {index}/{workers}", [
+            sys.executable, os.path.abspath(__file__), *worker_args,
+            "--shard", f"{index}/{workers}", "--run-id", run_id, "--results-store", path,
+            "--concurrency", str(shares["concurrency"]),
+            "--studio-concurrency", str(shares["google-ai-studio"]),
+            "--vertex-concurrency", str(shares["vertex-ai"]),
+        ])
+        for index, (path, shares) in enumerate(zip(paths, per_worker), 1)
+    ))
+    return merge_shards(paths, run_id, exit_codes)
+
+def _merge_run_records(run_records: list, run_id: str) -> dict:
+    """Combine shard run records into one.
+
+    Loop lag is that of the worst worker (by p95), voice warm-up costs the
+    slowest worker's, and collector histograms are summed; their percentiles
+    cannot be combined exactly, so the highest worker value is kept.
+    """
+    lags = [record["loop_lag"] for record in run_records if record["loop_lag"]]
+    stats = {}
+    profile = {}
+    for record in run_records:
+        for name, value in record["voice_resources"].get("stats", {}).items():
+            stats[name] = max(stats.get(name, 0), value)
+        for collector, summary in record.get("event_profile", {}).items():
+            merged = profile.setdefault(collector, {"events": 0})
+            merged["events"] += summary["events"]
+            for metric, values in summary.items():
+                if metric == "events":
+                    continue
+                target = merged.setdefault(metric, {"p50": 0, "p95": 0, "max": 0, "histogram": {}})
+                for key in ("p50", "p95", "max"):
+                    target[key] = max(target[key], values[key])
+                for bound, count in values["histogram"].items():
+                    target["histogram"][bound] = target["histogram"].get(bound, 0) + count
+                target["histogram"] = dict(sorted(target["histogram"].items(), key=lambda item: int(item[0])))
+
+    return {
+        **run_records[0],
+        "run_id": run_id,
+        "loop_lag": max(lags, key=lambda lag: lag["p95"]) if lags else {},
+        "voice_resources": {"stats": stats,
+                            "handouts": sum(record["voice_resources"].get("handouts", 0) for record in run_records)},
+        "event_profile": profile,
+        "workers": [worker for record in run_records for worker in record.get("workers", [])],
+    }
+
+def merge_shards(paths: list, run_id: str = None, exit_codes: list = None) -> str:
+    """Merge shard runs into one run in Config.RESULTS_STORE and render its report.
+
+    Each file contributes its run `run_id` (default: its latest run). Matrix
+    entries that no shard reported, e.g. because a worker crashed, are stored
+    as failed tests so the report still covers the whole matrix.
+
+    Returns:
+        The report filename
+    """
+    run_records, tests = [], {}
+    crashed = []
+    for index, path in enumerate(paths):
+        store = ResultStore(path)
+        shard_run_id = run_id or (store.run_ids() or [None])[-1]
+        records = store.load(shard_run_id) if shard_run_id else []
+        exit_code = exit_codes[index] if exit_codes else 0
+        if not records or exit_code:
+            crashed.append(f"{path} (exit code {exit_code})" if exit_codes else path)
+        run_records += [record for record in records if record["record"] == "run"]
+        tests.update((record["test_key"], record) for record in records if record["record"] == "test")
+    if not run_records:
+        raise ValueError(f"No shard results found in {', '.join(paths)}")
+    for shard in crashed:
+        print(f"Warning: shard {shard} did not complete")
+
+    run_id = run_id or run_records[0]["run_id"]
+    matrix = _build_test_matrix()
+    missing = [entry for entry in matrix if "-".join(entry) not in tests]
+    if missing:
+        reason = "Exception: no worker reported this test"
+        keys = ["-".join(entry) for entry in missing]
+        missing_records = build_run_records(run_id, run_records[0]["region"], missing, dict.fromkeys(keys, False),
+                                            {}, {}, {}, dict.fromkeys(keys, reason), {}, {})
+        tests.update((record["test_key"], record) for record in missing_records[1:])
+
+    merged = [_merge_run_records(run_records, run_id)]
+    merged += [{**tests[key], "run_id": run_id} for key in ("-".join(entry) for entry in matrix) if key in tests]
+    _print_test_summary({record["test_key"]: record["success"] for record in merged[1:]})
+
+    store = ResultStore(Config.RESULTS_STORE)
+    store.append(merged)
+    report_filename = _generate_report_filename(run_id=run_id)
+    render_test_report(store.load(run_id), report_filename)
+    print(f"\nMerged {len(run_records)} shard(s) into run {run_id}; test report generated: {report_filename}")
+    return report_filename
+
+class ResultStore:
+    """Append-only JSONL store of test results.
+
+    Every run appends one "run" record (date, ADK version, environment and
+    run-wide measurements) followed by one "test" record per test key, so
+    results can be queried across runs without parsing Markdown reports.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def append(self, records: list[dict]):
+        """Append records, one JSON object per line."""
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def load(self, run_id: str = None) -> list[dict]:
+        """Return all records, or only those of one run."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                records = [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+        if run_id:
+            records = [record for record in records if record["run_id"] == run_id]
+        return records
+
+    def run_ids(self) -> list[str]:
+        """Return run ids in the order they were stored."""
+        return [record["run_id"] for record in self.load() if record["record"] == "run"]
+
+def build_run_records(run_id: str, region: str, matrix: list, results: dict, transcriptions: dict,
+                      error_traces: dict, retry_counts: dict, failure_reasons: dict, timings: dict,
+                      modalities: dict, loop_lag: dict = None, voice_resources: dict = None, event_profile: dict = None) -> list[dict]:
+    """Build the run record and one test record per matrix entry for the result store."""
+    common = {
+        "run_id": run_id,
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "adk_version": get_adk_version(),
+        "region": region or os.getenv("GOOGLE_CLOUD_LOCATION", "Not configured"),
+    }
+    records = [{
+        "record": "run",
+        **common,
+        "project": os.getenv("GOOGLE_CLOUD_PROJECT", "Not configured"),
+        "loop_lag": loop_lag or {},
+        "voice_resources": voice_resources or {},
+        "event_profile": event_profile or {},
+    }]
+    for platform, model, test_type in matrix:
+        test_key = f"{platform}-{model}-{test_type}"
+        if test_key not in results:
+            continue
+        failure_reason = failure_reasons.get(test_key, "")
+        records.append({
+            "record": "test",
+            **common,
+            "test_key": test_key,
+            "platform": platform,
+            "model": model,
+            "test_type": test_type,
+            "success": results[test_key],
+            "retry_count": retry_counts.get(test_key, 0),
+            "failure_reason": failure_reason,
+            "close_code": _close_code_from_reason(failure_reason),
+            "failure_class": classify_failure(failure_reason),
+            "timeout_phase": _timeout_phase_from_reason(failure_reason),
+            "transcription": transcriptions.get(test_key),
+            "error_trace": error_traces.get(test_key, ""),
+            "timings": timings.get(test_key, []),
+            "modality": modalities.get(test_key),
+        })
+    return records
+
+def render_test_report(records: list[dict], output_file: str) -> str:
+    """Render the Markdown test report for one run from its stored records."""
+    run_info = next(record for record in records if record["record"] == "run")
+    tests = [record for record in records if record["record"] == "test"]
+    return generate_test_report(
+        {test["test_key"]: test["success"] for test in tests},
+        "both",
+        output_file=output_file,
+        transcriptions={test["test_key"]: test["transcription"] for test in tests if test["test_type"] == "voice"},
+        error_traces={test["test_key"]: test["error_trace"] for test in tests if test["error_trace"]},
+        retry_counts={test["test_key"]: test["retry_count"] for test in tests},
+        failure_reasons={test["test_key"]: test["failure_reason"] for test in tests
+                         if not test["success"] and test["failure_reason"]},
+        timings={test["test_key"]: test["timings"] for test in tests},
+        modalities={test["test_key"]: test.get("modality") for test in tests},
+        loop_lag=run_info["loop_lag"],
+        voice_resources=run_info["voice_resources"],
+        run_info=run_info,
+        event_profile=run_info.get("event_profile", {}),
     )
 
-    results.update(vertex_text_results)
-    results.update(vertex_voice_results)
-    transcriptions.update(vertex_text_transcriptions)
-    transcriptions.update(vertex_voice_transcriptions)
-    error_traces.update(vertex_text_errors)
-    error_traces.update(vertex_voice_errors)
-    retry_counts.update(vertex_text_retries)
-    retry_counts.update(vertex_voice_retries)
-    failure_reasons.update(vertex_text_failures)
-    failure_reasons.update(vertex_voice_failures)
-
-    # Print summary and generate report
-    _print_test_summary(results)
-    report_filename = _generate_report_filename(region)
-    generate_test_report(results, "both", output_file=report_filename, transcriptions=transcriptions, error_traces=error_traces, retry_counts=retry_counts, failure_reasons=failure_reasons)
-    print(f"\nTest report generated: {report_filename}")
+REGION_METRICS = [("connect", "Connect Latency"), ("first_audio", "Time to First Audio")]
+
+def _attempt_samples(tests: list[dict], metric: str) -> list:
+    """Values of one latency metric over every attempt of the given test records."""
+    return [attempt[metric] for test in tests for attempt in test["timings"] if metric in attempt]
+
+def render_region_report(runs: dict, output_file: str) -> str:
+    """Render one Markdown report comparing stored runs of the same matrix in several regions.
+
+    Args:
+        runs: {region: stored records of that region's run}
+    """
+    tests = {region: [record for record in records if record["record"] == "test"] for region, records in runs.items()}
+    run_info = {region: next(record for record in records if record["record"] == "run")
+                for region, records in runs.items()}
+    first = next(iter(run_info.values()))
+    entries = list(dict.fromkeys((test["model"], test["test_type"]) for region_tests in tests.values()
+                                 for test in region_tests))
+
+    summaries = []
+    for region, region_tests in tests.items():
+        passed = sum(1 for test in region_tests if test["success"])
+        first_audio = _attempt_samples(region_tests, "first_audio")
+        summaries.append({
+            "region": region,
+            "passed": passed,
+            "total": len(region_tests),
+            "availability": passed / len(region_tests) * 100 if region_tests else 0,
+            "retries": sum(test["retry_count"] for test in region_tests),
+            "rank_latency": _percentile(first_audio, 50) if first_audio else float("inf"),
+        })
+    summaries.sort(key=lambda summary: (-summary["availability"], summary["rank_latency"]))
 
-    return results, transcriptions, error_traces, retry_counts, failure_reasons
+    content = f"""# ADK Bidirectional Streaming Region Comparison Report
+
+## Sweep Summary
+- **Test Date**: {first["timestamp"]}
+- **Google ADK Version**: {first["adk_version"]}
+- **Platform**: {_get_platform_display_name("vertex-ai")}
+- **Google Cloud Project**: {first["project"]}
+- **Regions**: {", ".join(runs)}
+- **Tests per Region**: {len(entries)}
+
+## Region Comparison
+
+Regions ranked by availability, then by p50 time to first audio. Latencies are p50 / p95 in milliseconds over all attempts.
+
+| Region | Passed | Availability | Retries | """ + " | ".join(label for _, label in REGION_METRICS) + """ | Run ID |
+|""" + "---|" * (len(REGION_METRICS) + 5) + "\n"
+    for summary in summaries:
+        region = summary["region"]
+        cells = [_format_latency_cell(_attempt_samples(tests[region], metric)) for metric, _ in REGION_METRICS]
+        content += (f"| {region} | {summary['passed']}/{summary['total']} | {summary['availability']:.1f}% | "
+                    f"{summary['retries']} | " + " | ".join(cells) + f" | {run_info[region]['run_id']} |\n")
+
+    ranked = [summary["region"] for summary in summaries]
+    by_entry = {region: {(test["model"], test["test_type"]): test for test in tests[region]} for region in ranked}
+    columns = "| Model | Test | " + " | ".join(ranked) + " |\n|" + "---|" * (len(ranked) + 2) + "\n"
+
+    content += "\n## Availability by Model\n\n" + columns
+    for model, test_type in entries:
+        cells = []
+        for region in ranked:
+            test = by_entry[region].get((model, test_type))
+            if test is None:
+                cells.append("-")
+                continue
+            icon, _ = _format_test_result(test["success"])
+            cells.append(icon if test["success"] else f"{icon} {test['failure_class']}")
+        content += f"| {model} | {test_type} | " + " | ".join(cells) + " |\n"
+
+    for metric, label in REGION_METRICS:
+        content += f"\n## {label} by Model\n\nValues are p50 / p95 in milliseconds.\n\n" + columns
+        for model, test_type in entries:
+            cells = [_format_latency_cell(_attempt_samples([by_entry[region][(model, test_type)]], metric))
+                     if (model, test_type) in by_entry[region] else "-" for region in ranked]
+            content += f"| {model} | {test_type} | " + " | ".join(cells) + " |\n"
+
+    failures = [(region, test) for region in ranked for test in tests[region] if not test["success"]]
+    if failures:
+        content += "\n## Failures\n\n| Region | Model | Test | Reason |\n|---|---|---|---|\n"
+        for region, test in failures:
+            reason = (test["failure_reason"] or "-").replace("|", "\\|").replace("\n", " ")
+            content += f"| {region} | {test['model']} | {test['test_type']} | {reason} |\n"
+
+    content += """
+---
+*Report generated by ADK Bidirectional Streaming Test Tool*
+"""
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return output_file
+
+def _build_test_matrix() -> list[tuple[str, str, str]]:
+    """Build the (platform, model, test_type) matrix in report order."""
+    matrix = []
+    for platform, models in [("google-ai-studio", Config.GOOGLE_AI_STUDIO_MODELS),
+                             ("vertex-ai", Config.VERTEX_AI_MODELS)]:
+        for test_type in ["text", "voice"]:
+            for model in models:
+                matrix.append((platform, model, test_type))
+    return matrix
+
+def shard_matrix(matrix: list, index: int, count: int) -> list:
+    """Return shard `index` (1-based) of `count`: every count-th entry, so platforms and test types spread evenly."""
+    return matrix[index - 1::count]
+
+class MatrixScheduler:
+    """Runs ADKStreamingTester sessions concurrently within global and per-platform limits."""
+
+    def __init__(self, max_concurrency: int = None, platform_limits: dict = None):
+        self.max_concurrency = max_concurrency or Config.MAX_CONCURRENCY
+        self.platform_limits = {**Config.PLATFORM_CONCURRENCY, **(platform_limits or {})}
+        self._global_slots = asyncio.Semaphore(self.max_concurrency)
+        self._platform_slots = {platform: asyncio.Semaphore(limit)
+                                for platform, limit in self.platform_limits.items()}
+
+    async def _run_test(self, platform: str, model: str, test_type: str, region: str, headless: bool) -> tuple:
+        """Run one matrix entry once a platform slot and a global slot are free."""
+        platform_slots = self._platform_slots.setdefault(platform, asyncio.Semaphore(self.max_concurrency))
+        async with platform_slots, self._global_slots:
+            return await _test_model(platform, model, test_type, region, headless)
+
+    async def run(self, matrix: list, region: str = None, headless: bool = False) -> tuple[dict, dict, dict, dict, dict, dict, dict]:
+        """Run every (platform, model, test_type) entry and merge results in matrix order."""
+        results = {}
+        transcriptions = {}
+        error_traces = {}
+        retry_counts = {}
+        failure_reasons = {}
+        timings = {}
+        modalities = {}
+
+        outcomes = await asyncio.gather(*(
+            self._run_test(platform, model, test_type, region, headless)
+            for platform, model, test_type in matrix
+        ))
+
+        for (platform, model, test_type), outcome in zip(matrix, outcomes):
+            test_key = f"{platform}-{model}-{test_type}"
+            success, transcription, retry_count, failure_reason, error_trace, attempt_timings, modality = outcome
+            results[test_key] = success
+            retry_counts[test_key] = retry_count
+            timings[test_key] = attempt_timings
+            if modality:
+                modalities[test_key] = modality
+            if test_type == "voice":
+                transcriptions[test_key] = transcription
+            if not success and failure_reason:
+                failure_reasons[test_key] = failure_reason
+            if error_trace:
+                error_traces[test_key] = error_trace
+
+        return results, transcriptions, error_traces, retry_counts, failure_reasons, timings, modalities
+
+FAILURE_PATTERNS = [  # First match wins; anything unmatched is "transient"
+    ("permanent", re.compile(r"^Exception: 100[78]\b|not found in environment|required for Vertex AI")),
+    ("quota", re.compile(r"\b429\b|RESOURCE_EXHAUSTED|quota|^Exception: 1013\b", re.IGNORECASE)),
+    ("timeout", re.compile(r"timed? ?out|TimeoutError", re.IGNORECASE)),
+    ("empty", re.compile(r"^Empty response received|^No audio response received|^Audio response is silent")),
+]
+
+# Permanent failures caused by credentials are fixed outside the tool, so they are not remembered
+CREDENTIAL_FAILURE = re.compile(r"API key|credential|permission|not found in environment|required for Vertex AI",
+                                re.IGNORECASE)
+
+def classify_failure(failure_reason: str) -> str:
+    """Classify a failure reason as permanent, quota, timeout, empty or transient."""
+    if not failure_reason:
+        return ""
+    for failure_class, pattern in FAILURE_PATTERNS:
+        if pattern.search(failure_reason):
+            return failure_class
+    return "transient"
+
+class RetryPolicy:
+    """Decides whether and when to retry, per failure class.
+
+    Backoff is exponential from the class's base delay with full jitter
+    (a uniform draw between 0 and the capped exponential delay), so tests
+    that failed together do not retry in lockstep.
+    """
+
+    def __init__(self, policy: dict = None, max_delay: float = None):
+        self.policy = policy or Config.RETRY_POLICY
+        self.max_delay = Config.RETRY_MAX_DELAY if max_delay is None else max_delay
+
+    def should_retry(self, failure_class: str, attempts: int) -> bool:
+        """Whether another attempt is allowed after `attempts` failed attempts."""
+        max_attempts, _ = self.policy.get(failure_class, self.policy["transient"])
+        return attempts < max_attempts
+
+    def delay(self, failure_class: str, attempts: int) -> float:
+        """Seconds to wait before the next attempt."""
+        _, base_delay = self.policy.get(failure_class, self.policy["transient"])
+        return random.uniform(0, min(self.max_delay, base_delay * 2 ** (attempts - 1)))
+
+class PermanentFailureMemory:
+    """Remembers permanent failures per (platform, model, test type, ADK version) across runs.
+
+    A model that rejects a modality or does not exist keeps failing until
+    either the model list or the ADK version changes, so later runs report
+    the stored failure instead of opening a session. Failures in an explicit
+    region are kept apart, since a model may be served in some regions only.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self._failures = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._failures = {}
+
+    @staticmethod
+    def _key(platform: str, model: str, test_type: str, region: str = None) -> str:
+        key = f"{get_adk_version()}/{platform}/{model}/{test_type}"
+        return f"{key}@{region}" if region else key
+
+    def get(self, platform: str, model: str, test_type: str, region: str = None) -> str:
+        """Return the remembered failure reason, or an empty string."""
+        return self._failures.get(self._key(platform, model, test_type, region), "")
+
+    def remember(self, platform: str, model: str, test_type: str, failure_reason: str, region: str = None):
+        """Store a permanent failure unless it is caused by credentials."""
+        if CREDENTIAL_FAILURE.search(failure_reason):
+            return
+        self._failures = _update_json_file(self.path, {self._key(platform, model, test_type, region): failure_reason})
+
+    def clear(self):
+        """Forget every remembered failure."""
+        self._failures = {}
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.path)
+
+PERMANENT_FAILURES = PermanentFailureMemory(Config.PERMANENT_FAILURES_FILE)
 
 def _handle_test_error(exc: Exception, platform: str, model: str, test_type: str) -> tuple[bool, str, str]:
     """Handle test errors consistently."""
@@ -492,83 +2813,77 @@ def _handle_test_error(exc: Exception, platform: str, model: str, test_type: str
     transcription = f"Error: {str(exc)}" if test_type == "voice" else ""
     return False, error_trace, transcription
 
-async def _run_single_test(tester: ADKStreamingTester, test_type: str) -> tuple[bool, str, str]:
-    """Run a single test and return success status, transcription, and failure reason."""
+async def _run_single_test(tester: ADKStreamingTester, test_type: str) -> tuple[bool, str, str, dict]:
+    """Run a single test and return success status, transcription, failure reason, and latencies."""
     if test_type == "voice":
         success = await tester.test_voice_chat()
-        return success, tester.transcription_result, tester.failure_reason
+        return success, tester.transcription_result, tester.failure_reason, tester.timer.latencies()
     else:
         success = await tester.test_text_chat()
-        return success, "", tester.failure_reason
+        return success, "", tester.failure_reason, tester.timer.latencies()
 
-async def _run_single_test_with_retry(tester: ADKStreamingTester, test_type: str, max_retries: int = 3) -> tuple[bool, str, int, str]:
-    """Run a single test with retry logic.
+async def _run_single_test_with_retry(tester: ADKStreamingTester, test_type: str,
+                                      policy: RetryPolicy = None) -> tuple[bool, str, int, str, list]:
+    """Run a single test, retrying failures as the retry policy allows for their class.
 
     Args:
         tester: The ADKStreamingTester instance
         test_type: Type of test ("text" or "voice")
-        max_retries: Maximum number of retry attempts (default: 3)
+        policy: Retry policy (default: RetryPolicy() from Config.RETRY_POLICY)
 
     Returns:
-        Tuple of (success, transcription, retry_count, failure_reason)
+        Tuple of (success, transcription, retry_count, failure_reason, attempt_timings)
         retry_count is 0 for first attempt success, 1+ for retries
+        attempt_timings holds the latencies (ms) of every attempt
     """
-    failure_reason = ""
-    transcription = ""
-
-    for attempt in range(max_retries):
-        if attempt > 0:
-            print(f"\nRetrying test (attempt {attempt + 1}/{max_retries})...")
-            await asyncio.sleep(2)  # Brief delay before retry
+    policy = policy or RetryPolicy()
+    attempt_timings = []
+    attempts = 0
 
-        success, transcription, failure_reason = await _run_single_test(tester, test_type)
-
-        if success:
-            return success, transcription, attempt, ""
+    while True:
+        tester.failure_reason = ""
+        success, transcription, failure_reason, latencies = await _run_single_test(tester, test_type)
+        attempt_timings.append(latencies)
+        attempts += 1
 
-    # All retries exhausted
-    return False, transcription, max_retries - 1, failure_reason
-
-async def _test_platform(platform: str, models: list, test_type: str, region: str = None, headless: bool = False) -> tuple[dict, dict, dict, dict, dict]:
-    """Test all models for a specific platform."""
-    results = {}
-    transcriptions = {}
-    error_traces = {}
-    retry_counts = {}
-    failure_reasons = {}
-
-    for model in models:
-        test_key = f"{platform}-{model}-{test_type}"
-        tester = ADKStreamingTester(platform, model, region, headless)
-
-        try:
-            success, transcription, retry_count, failure_reason = await _run_single_test_with_retry(tester, test_type)
-            results[test_key] = success
-            retry_counts[test_key] = retry_count
+        if success:
+            return success, transcription, attempts - 1, "", attempt_timings
 
-            if test_type == "voice":
-                transcriptions[test_key] = transcription
+        failure_class = classify_failure(failure_reason)
+        if not policy.should_retry(failure_class, attempts):
+            print(f"Not retrying {failure_class} failure after {attempts} attempt(s)")
+            return False, transcription, attempts - 1, failure_reason, attempt_timings
 
-            # Store failure reason if test failed
-            if not success and failure_reason:
-                failure_reasons[test_key] = failure_reason
+        delay = policy.delay(failure_class, attempts)
+        print(f"\nRetrying {failure_class} failure in {delay:.1f}s (attempt {attempts + 1})...")
+        await asyncio.sleep(delay)
 
-            # Store error trace if there was an error during testing
-            if tester.error_trace:
-                error_traces[test_key] = tester.error_trace
+async def _test_model(platform: str, model: str, test_type: str, region: str = None, headless: bool = False) -> tuple[bool, str, int, str, str, list, str]:
+    """Test one model on one platform.
 
-        except Exception as exc:
-            success, error_trace, transcription = _handle_test_error(exc, platform, model, test_type)
-            results[test_key] = success
-            retry_counts[test_key] = 2  # Mark as max retries on exception
-            error_traces[test_key] = error_trace
-            failure_reasons[test_key] = f"Exception: {str(exc)}"
-            if test_type == "voice":
-                transcriptions[test_key] = transcription
+    Returns:
+        Tuple of (success, transcription, retry_count, failure_reason, error_trace, attempt_timings, modality)
+        modality is the response modality the last attempt used, or None if it never got that far
+    """
+    # Mock server failures say nothing about the real endpoints
+    remember_failures = not Config.MOCK_SERVER_URL
+    known_failure = PERMANENT_FAILURES.get(platform, model, test_type, region) if remember_failures else ""
+    if known_failure:
+        print(f"Skipping {platform} {model} {test_type}: known permanent failure on ADK {get_adk_version()}")
+        transcription = "Not run (known permanent failure)" if test_type == "voice" else ""
+        return False, transcription, 0, known_failure, "", [], None
+
+    tester = ADKStreamingTester(platform, model, region, headless)
 
-        await asyncio.sleep(1)  # Brief delay between tests
+    try:
+        success, transcription, retry_count, failure_reason, attempt_timings = await _run_single_test_with_retry(tester, test_type)
+        if remember_failures and not success and classify_failure(failure_reason) == "permanent":
+            PERMANENT_FAILURES.remember(platform, model, test_type, failure_reason, region)
+        return success, transcription, retry_count, failure_reason, tester.error_trace, attempt_timings, tester.modality
 
-    return results, transcriptions, error_traces, retry_counts, failure_reasons
+    except Exception as exc:
+        success, error_trace, transcription = _handle_test_error(exc, platform, model, test_type)
+        return success, transcription, 2, f"Exception: {str(exc)}", error_trace, [], tester.modality  # Mark as max retries on exception
 
 def _parse_test_name(test_name: str) -> tuple[str, str, str]:
     """Parse test name into platform, model, and test type.
@@ -624,12 +2939,19 @@ def _print_test_summary(results: dict):
     
     print(f"\nOverall: {passed_tests}/{total_tests} tests passed")
 
-def _generate_report_header(results: dict, retry_counts: dict = None) -> str:
+def _print_loop_lag(loop_lag: dict):
+    """Print event-loop lag summary."""
+    if loop_lag:
+        print(f"Event loop lag: p50 {loop_lag['p50']:.1f}ms, p95 {loop_lag['p95']:.1f}ms, "
+              f"max {loop_lag['max']:.1f}ms over {loop_lag['samples']} samples")
+
+def _generate_report_header(results: dict, retry_counts: dict = None, run_info: dict = None) -> str:
     """Generate the header section of the test report."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    google_project = os.getenv("GOOGLE_CLOUD_PROJECT", "Not configured")
-    google_location = os.getenv("GOOGLE_CLOUD_LOCATION", "Not configured")
-    adk_version = get_adk_version()
+    run_info = run_info or {}
+    timestamp = run_info.get("timestamp") or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    google_project = run_info.get("project") or os.getenv("GOOGLE_CLOUD_PROJECT", "Not configured")
+    google_location = run_info.get("region") or os.getenv("GOOGLE_CLOUD_LOCATION", "Not configured")
+    adk_version = run_info.get("adk_version") or get_adk_version()
 
     total_tests = len(results)
     passed_tests = sum(1 for success in results.values() if success)
@@ -676,8 +2998,12 @@ def _generate_report_header(results: dict, retry_counts: dict = None) -> str:
 
 """
 
-def _generate_detailed_results(results: dict, retry_counts: dict = None, failure_reasons: dict = None) -> str:
-    """Generate the detailed results section for combined tests."""
+def _generate_detailed_results(results: dict, retry_counts: dict = None, failure_reasons: dict = None,
+                               modalities: dict = None) -> str:
+    """Generate the detailed results section for combined tests.
+
+    modalities maps test names to the response modality recorded for the run.
+    """
     content = """
 **Note**: The following model list includes both officially supported models and deprecated models. To see a list of the currently supported models, see:
 - **Gemini Live API**: Check the [Get started with Live API](https://ai.google.dev/gemini-api/docs/live#audio-generation)
@@ -699,7 +3025,8 @@ def _generate_detailed_results(results: dict, retry_counts: dict = None, failure
 
         retry_count = retry_counts.get(test_name, 0) if retry_counts else 0
         failure_reason = failure_reasons.get(test_name, "") if failure_reasons else ""
-        platforms[platform][model][current_test_type] = (success, retry_count, failure_reason)
+        modality = modalities.get(test_name) if modalities else None
+        platforms[platform][model][current_test_type] = (success, retry_count, failure_reason, modality)
 
     # Generate platform sections
     for platform, models in platforms.items():
@@ -709,10 +3036,10 @@ def _generate_detailed_results(results: dict, retry_counts: dict = None, failure
             content += f"**{model}**:\n"
             for test_t in ["text", "voice"]:
                 if test_t in tests:
-                    success, retry_count, failure_reason = tests[test_t]
+                    success, retry_count, failure_reason, modality = tests[test_t]
                     icon, status = _format_test_result(success)
-                    # Check if model is native-audio and this is a text test
-                    if test_t == "text" and "native-audio" in model.lower():
+                    # Check if this text test ran with AUDIO modality and transcription
+                    if test_t == "text" and modality == "AUDIO":
                         label = "Text (audio transcript)"
                     else:
                         label = test_t.title()
@@ -729,6 +3056,34 @@ def _generate_detailed_results(results: dict, retry_counts: dict = None, failure
 
     return content
 
+def _generate_audio_metrics_section(timings: dict) -> str:
+    """Generate the response audio analysis section (p50 over voice attempts)."""
+    rows = []
+    for test_name, attempt_timings in timings.items():
+        platform, model, test_type = _parse_test_name(test_name)
+        samples = [t for t in attempt_timings if "audio_rms" in t]
+        if platform and samples:
+            rows.append((platform, model, samples))
+    if not rows:
+        return ""
+
+    content = "## Response Audio Analysis\n\n"
+    content += ("Values are p50 over voice attempts, measured locally on the 24kHz response "
+                f"(voiced: frame RMS above {Config.VAD_THRESHOLD_DBFS:g} dBFS). Responses closed on "
+                "verification are truncated: they count under Truncated and are left out of the "
+                "duration, silence and voiced columns (use `--wait-for-turn-complete` to measure them).\n\n")
+    content += "| Platform | Model | Truncated | " + " | ".join(
+        f"{label} ({unit})" if unit else label for label, unit in AUDIO_METRICS.values()) + " |\n"
+    content += "|" + "---|" * (len(AUDIO_METRICS) + 3) + "\n"
+    for platform, model, samples in rows:
+        truncated = sum(1 for t in samples if t.get("audio_truncated"))
+        cells = [f"{truncated}/{len(samples)}"]
+        for name in AUDIO_METRICS:
+            values = [t[name] for t in samples if name in t]
+            cells.append(f"{_percentile(values, 50):.1f}" if values else "-")
+        content += f"| {_get_platform_display_name(platform)} | {model} | " + " | ".join(cells) + " |\n"
+    return content + "\n"
+
 def _generate_transcription_results(transcriptions: dict) -> str:
     """Generate voice transcription results section."""
     if not transcriptions:
@@ -784,6 +3139,149 @@ def _generate_error_traces(error_traces: dict) -> str:
     
     return content
 
+def _percentile(values: list, pct: float) -> float:
+    """Return the pct-th percentile of values using linear interpolation."""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+def _format_latency_cell(values: list) -> str:
+    """Format latency samples as "p50 / p95" milliseconds."""
+    if not values:
+        return "-"
+    return f"{_percentile(values, 50):.0f} / {_percentile(values, 95):.0f}"
+
+def _generate_latency_results(timings: dict) -> str:
+    """Generate latency section with p50/p95 tables per platform and model."""
+    if not timings or not any(timings.values()):
+        return ""
+
+    metric_names = SessionTimer.metric_names()
+    content = "## Latency Results\n\n"
+    content += "Values are p50 / p95 in milliseconds over all attempts. "
+    content += "Response latencies are measured from the moment the question was fully sent.\n\n"
+
+    # Group latency samples by platform
+    platforms = {}
+    for test_name, attempt_timings in timings.items():
+        platform, model, test_type = _parse_test_name(test_name)
+        if not platform or not attempt_timings:
+            continue
+        platforms.setdefault(platform, []).append((model, test_type, attempt_timings))
+
+    header = "| Model | Test | Samples | " + " | ".join(name.replace("_", " ").title() for name in metric_names) + " |\n"
+    separator = "|" + "---|" * (len(metric_names) + 3) + "\n"
+    for platform, model_timings in platforms.items():
+        platform_name = _get_platform_display_name(platform)
+        content += f"### {platform_name}\n\n"
+        content += header + separator
+        for model, test_type, attempt_timings in model_timings:
+            cells = [_format_latency_cell([t[name] for t in attempt_timings if name in t]) for name in metric_names]
+            content += f"| {model} | {test_type} | {len(attempt_timings)} | " + " | ".join(cells) + " |\n"
+        content += "\n"
+
+    return content
+
+def _generate_timeout_section(failure_reasons: dict) -> str:
+    """Generate the section listing which session phase each timed-out test exceeded."""
+    timeouts = {test: _timeout_phase_from_reason(reason) for test, reason in failure_reasons.items()}
+    timeouts = {test: phase for test, phase in timeouts.items() if phase}
+    if not timeouts:
+        return ""
+    content = "## Deadline Timeouts\n"
+    content += "Budgets: " + ", ".join(f"{phase} {limit:g}s" for phase, limit in Config.DEADLINES.items()) + "\n\n"
+    content += "| Test | Phase |\n|------|-------|\n"
+    for test, phase in timeouts.items():
+        content += f"| {test} | {phase} |\n"
+    return content + "\n"
+
+def _generate_loop_lag_section(loop_lag: dict) -> str:
+    """Generate event-loop responsiveness section."""
+    if not loop_lag:
+        return ""
+    return f"""## Event Loop Responsiveness
+- **Probe Interval**: {Config.LOOP_LAG_INTERVAL * 1000:.0f}ms
+- **Samples**: {loop_lag['samples']}
+- **Lag p50 / p95 / max**: {loop_lag['p50']:.1f} / {loop_lag['p95']:.1f} / {loop_lag['max']:.1f} ms
+
+"""
+
+def _generate_event_profile_section(event_profile: dict) -> str:
+    """Generate per-event hot-path section of the response collectors."""
+    if not event_profile:
+        return ""
+    labels = {"handling_us": ("Handling time", "µs"), "size_bytes": ("Event size", "bytes"),
+              "gap_ms": ("Inter-arrival gap", "ms")}
+    content = "## Collector Event Profile\n"
+    content += "| Collector | Events | Metric | p50 | p95 | Max | Histogram (≤ bucket: count) |\n"
+    content += "|-----------|--------|--------|-----|-----|-----|-----------------------------|\n"
+    for collector, profile in event_profile.items():
+        for metric, (label, unit) in labels.items():
+            if metric not in profile:
+                continue
+            stats = profile[metric]
+            histogram = ", ".join(f"{bound}: {count}" for bound, count in stats["histogram"].items())
+            content += (f"| {collector} | {profile['events']} | {label} ({unit}) | {stats['p50']:.1f} | "
+                        f"{stats['p95']:.1f} | {stats['max']:.1f} | {histogram} |\n")
+    return content + "\n"
+
+def _print_event_profile(event_profile: dict):
+    """Print a one-line hot-path summary per collector."""
+    for collector, profile in event_profile.items():
+        line = f"{collector} collector: {profile['events']} events"
+        if "handling_us" in profile:
+            line += f", handling p50 {profile['handling_us']['p50']:.1f}µs p95 {profile['handling_us']['p95']:.1f}µs"
+        line += f", gap p50 {profile['gap_ms']['p50']:.1f}ms p95 {profile['gap_ms']['p95']:.1f}ms"
+        print(line)
+
+def _generate_workers_section(workers: list) -> str:
+    """Generate the per-worker section of a run merged from shards."""
+    if not workers:
+        return ""
+    content = "## Workers\n"
+    content += "Shards of the matrix ran in separate worker processes; event-loop lag above is the worst worker's.\n\n"
+    content += "| Shard | Tests | Elapsed | Loop Lag p95 / max |\n|---|---|---|---|\n"
+    for worker in workers:
+        lag = worker.get("loop_lag")
+        lag_cell = f"{lag['p95']:.1f} / {lag['max']:.1f} ms" if lag else "-"
+        content += f"| {worker['shard']} | {worker['tests']} | {worker['elapsed']:.1f}s | {lag_cell} |\n"
+    return content + "\n"
+
+def _generate_voice_resources_section(voice_resources: dict) -> str:
+    """Generate shared voice resources section with one-time warm-up costs."""
+    if not voice_resources.get("stats"):
+        return ""
+    content = "## Shared Voice Resources\n"
+    content += f"- **Voice Tests Served**: {voice_resources['handouts']} (clients created once per run)\n"
+    labels = {
+        "speech_client_create": "Speech-to-Text Client Creation",
+        "speech_health_check": "Speech-to-Text Warm-up Request",
+        "pyaudio_create": "PyAudio Initialization",
+    }
+    for name, value in voice_resources["stats"].items():
+        content += f"- **{labels.get(name, name)}**: {value:.0f}ms\n"
+    return content + "\n"
+
+def _describe_retry_policy() -> str:
+    """Methodology lines for the attempts and backoff of each failure class, from Config.RETRY_POLICY."""
+    policy = RetryPolicy()
+    retried = {name: rule for name, rule in policy.policy.items() if rule[0] > 1}
+    single = [name for name in policy.policy if name not in retried]
+    attempts = (f"- {_join_words([name.title() for name in single])} failures are not retried; "
+                f"{_join_words(list(retried))} failures are tried up to "
+                f"{_join_words([str(max_attempts) for max_attempts, _ in retried.values()])} times")
+    bases = ", ".join(f"{base:g}s for {name}" for name, (_, base) in retried.items())
+    return (attempts + f"\n- Retries wait with exponential backoff and full jitter "
+            f"(base delay {bases}; doubled per attempt, capped at {policy.max_delay:g}s)")
+
+def _join_words(words: list) -> str:
+    """Join words as "a", "a and b" or "a, b and c"."""
+    return " and ".join(filter(None, [", ".join(words[:-1]), words[-1]])) if words else ""
+
 def _generate_methodology_section() -> str:
     """Generate test methodology section."""
     return """## Test Methodology
@@ -793,19 +3291,50 @@ def _generate_methodology_section() -> str:
 - **Expected Response**: Agent responds with current time information using Google Search tool
 
 ### Success Criteria
-- Response contains time-related keywords (time, clock, hour, minute, am, pm, utc, gmt)
+- Response contains a time-related keyword (time, clock, hour, minute, utc, gmt, o'clock) as a whole word, or am/pm right after a number ("3 PM"), so neither "game" nor "I am" matches
+- With `--validators clock`, a time of day in digits ("10:14 a.m.", "3 PM") must match the wall clock within a few minutes at an allowed UTC offset; a time spelled out in words is judged on the keyword alone
+- Responses are verified from partial deltas as they stream; the session is closed as soon as the answer is verified, and the `verified` latency records when
 - Agent successfully uses Google Search tool for real-time information
 - Bidirectional streaming communication works correctly
 
+### Latency Measurement
+- Each attempt records monotonic timestamps for session setup, `run_live` start, the last audio chunk sent, the first event, the first text or transcription delta, the first audio byte and `turn_complete`
+- Response latencies are measured from the moment the question (text or last audio chunk) was sent
+- Upload is the time from the first to the last audio chunk; Upload Jitter is the mean delay of chunks behind their pacing schedule
+- Connect is the time ADK takes to open the live connection (websocket handshake and setup) once `run_live` starts streaming
+- Reported as p50 / p95 over all attempts per model and platform
+
+### Event Loop Responsiveness
+- Playback, audio decoding and Speech-to-Text run in a bounded thread pool, never on the event loop
+- A probe wakes every 50ms during the run; its lateness is reported as event-loop lag
+
+### Scheduling
+- Tests run concurrently, limited by a global session limit and per-platform limits
+- Platforms run side by side: each model's genai clients get explicit credentials instead of process environment variables
+- Agents and runners are built once per platform, model and region; each attempt creates a fresh session on the cached runner
+- With `--workers`, shards of the matrix run in separate processes with divided session limits and are merged into one run
+
+### Capability Probes
+- Before testing, each model without a fresh cache entry gets one minimal TEXT session and one AUDIO session with transcription
+- Supported modalities and transcription support are cached for 24 hours per ADK version, endpoint (live or mock server), platform, model and region
+- Text tests use TEXT modality when supported, otherwise AUDIO modality with output transcription
+
+### Deadlines
+- Every session phase has a budget: connect, upload, first event, idle gap between events and the whole turn
+- An expired budget cancels the pending read, closes the `LiveRequestQueue` and fails the test as a timeout naming the phase
+
 ### Retry Logic
-- Each test is automatically retried up to 3 times if it fails
-- A 2-second delay is applied between retry attempts
+- Failures are classified as permanent (1007/1008 configuration errors), quota (429), transient, timeout or empty response
+""" + _describe_retry_policy() + """
+- Permanent failures are remembered per platform, model, test type, region and ADK version and are not re-run until the ADK version changes
 - Tests succeed on first attempt show 0 retries
 - Failed tests show the number of retry attempts made
 
 ### Platform Configuration
-- **Google AI Studio**: Uses GOOGLE_API_KEY with GOOGLE_GENAI_USE_VERTEXAI=FALSE
-- **Vertex AI**: Uses GOOGLE_CLOUD_PROJECT and GOOGLE_CLOUD_LOCATION with GOOGLE_GENAI_USE_VERTEXAI=TRUE
+- Each runner's Gemini model gets its own genai client built from the platform's credentials (`client_kwargs`); no environment variables are switched between platforms
+- **Mock Server** (`--mock-server`): All platforms use the Gemini API protocol against the local mock server (`base_url`); Speech-to-Text is skipped and voice responses are verified from the streamed text parts
+- **Google AI Studio**: Client with `vertexai=False` and GOOGLE_API_KEY
+- **Vertex AI**: Client with `vertexai=True`, GOOGLE_CLOUD_PROJECT and the test's region (`--region`, else GOOGLE_CLOUD_LOCATION, else us-central1)
 
 ### Text Chat Testing
 - Sends text query via ADK streaming API
@@ -814,34 +3343,47 @@ def _generate_methodology_section() -> str:
 
 ### Voice Chat Testing
 - Uses M4A audio file containing "What time is it now?"
-- Converts to 16kHz, mono, 16-bit PCM format
-- Sends audio to ADK streaming API in 1KB chunks
+- Converts to 16kHz, mono, 16-bit PCM format once per source file (cached in .pcm_cache)
+- Sends audio to ADK streaming API in 1KB chunks (configurable), paced with a fixed delay, in real time, N-times accelerated or as a burst
 - Receives audio response from model at 24kHz
-- Plays audio response using PyAudio
-- Transcribes response using Google Cloud Speech-to-Text for validation
+- Reuses one process-wide Speech-to-Text client and PyAudio instance, created and health-checked at startup
+- Plays audio response using PyAudio as it arrives, through a ring buffer drained by a worker thread
+- Transcribes response with Google Cloud Speech-to-Text streaming recognition while it is still arriving
+- Passes as soon as a partial transcript contains time information
 
 """
 
-def _generate_report_filename(region: str = None) -> str:
-    """Generate report filename with region and timestamp suffix."""
-    from datetime import datetime
-    import os
-    
+def _generate_run_id(region: str = None) -> str:
+    """Generate a run id from region and timestamp, e.g. us-central1_20260818_011827."""
     # Get current region from environment if not provided
     if not region:
         region = os.getenv("GOOGLE_CLOUD_LOCATION", "unknown")
     
     # Generate timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    # Create filename with region and timestamp
-    return f"test_report_{region}_{timestamp}.md"
+    return f"{region}_{timestamp}"
 
-def generate_test_report(results, test_type, output_file="test_report.md", transcriptions=None, error_traces=None, retry_counts=None, failure_reasons=None):
-    """Generate a comprehensive test report file for combined tests."""
+def _generate_report_filename(region: str = None, run_id: str = None) -> str:
+    """Generate report filename with region and timestamp suffix."""
+    return f"test_report_{run_id or _generate_run_id(region)}.md"
+
+def generate_test_report(results, test_type, output_file="test_report.md", transcriptions=None, error_traces=None, retry_counts=None, failure_reasons=None, timings=None, loop_lag=None, voice_resources=None, run_info=None, event_profile=None, modalities=None):
+    """Generate a comprehensive test report file for combined tests.
+
+    run_info, if given, is the run record from the result store and supplies the
+    date, ADK version and environment instead of the current process.
+    """
+    run_info = run_info or {}
     # Build report content using helper functions
-    report_content = _generate_report_header(results, retry_counts)
-    report_content += _generate_detailed_results(results, retry_counts, failure_reasons)
+    report_content = _generate_report_header(results, retry_counts, run_info)
+    report_content += _generate_detailed_results(results, retry_counts, failure_reasons, modalities)
+    report_content += _generate_latency_results(timings or {})
+    report_content += _generate_timeout_section(failure_reasons or {})
+    report_content += _generate_audio_metrics_section(timings or {})
+    report_content += _generate_loop_lag_section(loop_lag or {})
+    report_content += _generate_workers_section(run_info.get("workers", []))
+    report_content += _generate_voice_resources_section(voice_resources or VOICE_POOL.summary())
+    report_content += _generate_event_profile_section(event_profile or {})
     report_content += _generate_transcription_results(transcriptions or {})
     report_content += _generate_error_traces(error_traces or {})
     report_content += _generate_methodology_section()
@@ -870,7 +3412,7 @@ def generate_test_report(results, test_type, output_file="test_report.md", trans
         report_content += "\n"
 
     # Add environment and usage information
-    adk_version = get_adk_version()
+    adk_version = run_info.get("adk_version") or get_adk_version()
     report_content += f"""## Environment Information
 - **ADK Version**: {adk_version}
 - **Python Dependencies**: google-adk, google-cloud-speech, pyaudio, pydub, python-dotenv
@@ -908,16 +3450,715 @@ python test_tool.py --platform vertex-ai --model gemini-2.0-flash-exp --region e
 
 async def test_single_model_combined(platform: str, model: str, region: str = None, headless: bool = False) -> tuple[bool, bool]:
     """Test a single platform and model combination with both text and voice tests."""
+    preload_dependencies(voice=True)
+    await probe_capabilities([(platform, model)], region)
     tester = ADKStreamingTester(platform, model, region, headless)
 
     print(f"Testing text chat for {model}:")
     text_success = await tester.test_text_chat()
 
     print(f"\nTesting voice chat for {model}:")
-    voice_success = await tester.test_voice_chat()
+    await VOICE_POOL.warm_up(use_stt=not Config.MOCK_SERVER_URL, playback=not headless)
+    try:
+        voice_success = await tester.test_voice_chat()
+    finally:
+        VOICE_POOL.shutdown()
 
     return text_success, voice_success
 
+def _close_code_from_reason(failure_reason: str) -> str:
+    """Classify a failure reason by websocket close code (e.g. "1007"), or "other"."""
+    if not failure_reason:
+        return ""
+    match = re.match(r"Exception: (\d{4})\b", failure_reason)
+    if match:
+        return match.group(1)
+    if _timeout_phase_from_reason(failure_reason):
+        return "timeout"
+    return "other" if failure_reason.startswith("Exception:") else "verification"
+
+async def _run_load_session(platform: str, model: str, test_type: str, region: str = None) -> dict:
+    """Run one live session without retries and return its outcome."""
+    tester = ADKStreamingTester(platform, model, region, headless=True)
+    try:
+        success, _, failure_reason, latencies = await _run_single_test(tester, test_type)
+    except Exception as exc:
+        success, failure_reason, latencies = False, f"Exception: {str(exc)}", tester.timer.latencies()
+    return {
+        "success": success,
+        "error": "" if success else _close_code_from_reason(failure_reason) or "verification",
+        "latencies": latencies,
+    }
+
+async def _run_stepped_load(platform: str, model: str, test_type: str, region: str,
+                            concurrency: int, duration: float) -> list[dict]:
+    """Keep `concurrency` sessions in flight until `duration` seconds have passed."""
+    deadline = time.monotonic() + duration
+    sessions = []
+
+    async def worker():
+        while time.monotonic() < deadline:
+            sessions.append(await _run_load_session(platform, model, test_type, region))
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return sessions
+
+async def _run_arrival_load(platform: str, model: str, test_type: str, region: str,
+                            rate: float, duration: float) -> list[dict]:
+    """Start sessions at a constant arrival rate for `duration` seconds, regardless of completions."""
+    start = time.monotonic()
+    tasks = []
+    while time.monotonic() - start < duration:
+        tasks.append(asyncio.create_task(_run_load_session(platform, model, test_type, region)))
+        # Schedule against the start time so slow task creation does not lower the rate
+        next_start = start + len(tasks) / rate
+        await asyncio.sleep(max(0, next_start - time.monotonic()))
+    return list(await asyncio.gather(*tasks))
+
+def _summarize_load_step(step: float, sessions: list, elapsed: float) -> dict:
+    """Aggregate throughput, errors by close code and latency distribution for one step."""
+    errors = {}
+    for session in sessions:
+        if session["error"]:
+            errors[session["error"]] = errors.get(session["error"], 0) + 1
+
+    latencies = {}
+    for name in SessionTimer.metric_names():
+        values = [session["latencies"][name] for session in sessions if name in session["latencies"]]
+        if values:
+            latencies[name] = (_percentile(values, 50), _percentile(values, 95), _percentile(values, 99))
+
+    total = len(sessions)
+    failed = sum(errors.values())
+    return {
+        "step": step,
+        "sessions": total,
+        "elapsed": elapsed,
+        "sessions_per_sec": total / elapsed if elapsed > 0 else 0,
+        "error_rate": failed / total * 100 if total else 0,
+        "errors": errors,
+        "latencies": latencies,
+    }
+
+async def run_load_test(platform: str, model: str, test_type: str = "text", region: str = None,
+                        mode: str = "stepped", steps: list = None,
+                        duration: float = None) -> list[dict]:
+    """Ramp up live sessions for one model and return per-step summaries.
+
+    Args:
+        mode: "stepped" runs each step with that many concurrent sessions,
+              "arrival" starts sessions at that many sessions per second
+        steps: Load levels to ramp through (default: Config.LOAD_STEPS)
+        duration: Seconds each step keeps starting sessions (default: Config.LOAD_STEP_DURATION)
+    """
+    steps = steps or Config.LOAD_STEPS
+    duration = duration or Config.LOAD_STEP_DURATION
+
+    preload_dependencies(voice=test_type == "voice")
+    if test_type == "voice":
+        await VOICE_POOL.warm_up(use_stt=not Config.MOCK_SERVER_URL, playback=False)
+    else:
+        await probe_capabilities([(platform, model)], region)
+    try:
+        summaries = await _run_load_steps(platform, model, test_type, region, mode, steps, duration)
+    finally:
+        VOICE_POOL.shutdown()
+    return summaries
+
+async def _run_load_steps(platform: str, model: str, test_type: str, region: str,
+                          mode: str, steps: list, duration: float) -> list[dict]:
+    """Run each load step in turn and summarize it."""
+    unit = "concurrent sessions" if mode == "stepped" else "sessions/sec"
+    summaries = []
+
+    for step in steps:
+        print(f"\n{'='*60}")
+        print(f"LOAD STEP: {step} {unit} for {duration}s ({platform}, {model}, {test_type})")
+        print(f"{'='*60}")
+
+        lag_monitor = LoopLagMonitor()
+        lag_monitor.start()
+        started = time.monotonic()
+        if mode == "stepped":
+            sessions = await _run_stepped_load(platform, model, test_type, region, int(step), duration)
+        else:
+            sessions = await _run_arrival_load(platform, model, test_type, region, step, duration)
+        summary = _summarize_load_step(step, sessions, time.monotonic() - started)
+        summary["loop_lag"] = await lag_monitor.stop()
+        summaries.append(summary)
+
+        print(f"Step {step}: {summary['sessions']} sessions, {summary['sessions_per_sec']:.2f} sessions/sec, "
+              f"error rate {summary['error_rate']:.1f}% {summary['errors'] or ''}")
+
+    return summaries
+
+def generate_load_report(platform: str, model: str, test_type: str, mode: str, summaries: list,
+                         output_file: str) -> str:
+    """Generate a load test report with throughput, errors and latency per step."""
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    unit = "Concurrent Sessions" if mode == "stepped" else "Arrival Rate (sessions/sec)"
+
+    content = f"""# ADK Bidirectional Streaming Load Test Report
+
+## Load Test Summary
+- **Test Date**: {timestamp}
+- **Google ADK Version**: {get_adk_version()}
+- **Platform**: {_get_platform_display_name(platform)}
+- **Model**: {model}
+- **Test Type**: {test_type.title()}
+- **Load Mode**: {mode}
+- **Google Cloud Location**: {os.getenv("GOOGLE_CLOUD_LOCATION", "Not configured")}
+
+## Throughput and Errors
+
+| {unit} | Sessions | Sessions/sec | Error Rate | Errors by Close Code | Loop Lag p95 |
+|---|---|---|---|---|---|
+"""
+    for summary in summaries:
+        errors = ", ".join(f"{code}: {count}" for code, count in sorted(summary["errors"].items())) or "-"
+        loop_lag = summary.get("loop_lag")
+        lag = f"{loop_lag['p95']:.1f}ms" if loop_lag else "-"
+        content += (f"| {summary['step']} | {summary['sessions']} | {summary['sessions_per_sec']:.2f} | "
+                    f"{summary['error_rate']:.1f}% | {errors} | {lag} |\n")
+
+    content += "\n## Latency Distribution\n\nValues are p50 / p95 / p99 in milliseconds.\n\n"
+    metric_names = SessionTimer.metric_names()
+    content += f"| {unit} | " + " | ".join(name.replace("_", " ").title() for name in metric_names) + " |\n"
+    content += "|" + "---|" * (len(metric_names) + 1) + "\n"
+    for summary in summaries:
+        cells = []
+        for name in metric_names:
+            if name in summary["latencies"]:
+                cells.append(" / ".join(f"{value:.0f}" for value in summary["latencies"][name]))
+            else:
+                cells.append("-")
+        content += f"| {summary['step']} | " + " | ".join(cells) + " |\n"
+
+    content += """
+---
+*Report generated by ADK Bidirectional Streaming Test Tool*
+"""
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+    print(f"\n📄 Load test report saved to: {output_file}")
+    return output_file
+
+SCALING_METRICS = ["upload", "first_event", "first_audio", "turn_complete", "verified"]
+
+async def run_scaling_test(platform: str, model: str, region: str = None, durations: list = None,
+                           sessions: int = None) -> list[dict]:
+    """Run voice sessions with synthetic prompts of increasing length and return per-length summaries.
+
+    Each length is a Config.PROMPT_DURATION for synthetic_prompt; the prompt is
+    built before its sessions start, and the upload deadline is extended by its
+    duration so long prompts are not cut off at upload.
+    """
+    durations = durations or Config.SCALING_DURATIONS
+    sessions = Config.SCALING_SESSIONS if sessions is None else sessions
+    prompt_duration, upload_deadline = Config.PROMPT_DURATION, Config.DEADLINES["upload"]
+    close_on_verified = Config.CLOSE_ON_VERIFIED
+    # Turn-complete latency is one of the scaled metrics, so every response is read to the end
+    Config.CLOSE_ON_VERIFIED = False
+
+    preload_dependencies(voice=True)
+    await VOICE_POOL.warm_up(use_stt=not Config.MOCK_SERVER_URL, playback=False)
+    summaries = []
+    try:
+        for duration in durations:
+            Config.PROMPT_DURATION = duration
+            started = time.monotonic()
+            prompt = await _run_blocking(synthetic_prompt)
+            synthesis_ms = (time.monotonic() - started) * 1000
+            prompt_seconds = len(prompt) / (Config.INPUT_RATE * 2)
+            Config.DEADLINES["upload"] = upload_deadline + prompt_seconds
+
+            print(f"\n{'='*60}")
+            print(f"PROMPT LENGTH: {prompt_seconds:.1f}s, {sessions} sessions ({platform}, {model})")
+            print(f"{'='*60}")
+            started = time.monotonic()
+            results = [await _run_load_session(platform, model, "voice", region) for _ in range(sessions)]
+            summary = _summarize_load_step(duration, results, time.monotonic() - started)
+            summary.update(prompt_seconds=prompt_seconds, prompt_bytes=len(prompt), synthesis_ms=synthesis_ms)
+            summaries.append(summary)
+            print(f"Prompt {prompt_seconds:.1f}s: error rate {summary['error_rate']:.1f}% {summary['errors'] or ''}")
+    finally:
+        Config.PROMPT_DURATION, Config.DEADLINES["upload"] = prompt_duration, upload_deadline
+        Config.CLOSE_ON_VERIFIED = close_on_verified
+        VOICE_POOL.shutdown()
+    return summaries
+
+def _linear_fit(xs: list, ys: list) -> tuple[float, float]:
+    """Least-squares (slope, intercept) of ys against xs."""
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if not spread:
+        return 0.0, mean_y
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+    return slope, mean_y - slope * mean_x
+
+def generate_scaling_report(platform: str, model: str, summaries: list, output_file: str) -> str:
+    """Generate an input-length scaling report: latency and upload cost per prompt length, with linear fits."""
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    utterances = ", ".join(Config.PROMPT_UTTERANCES or [Config.AUDIO_FILE])
+    noise = f"{Config.PROMPT_NOISE_DBFS:g} dBFS white noise" if Config.PROMPT_NOISE_DBFS is not None else "none"
+
+    content = f"""# ADK Bidirectional Streaming Input-Length Scaling Report
+
+## Scaling Test Summary
+- **Test Date**: {timestamp}
+- **Google ADK Version**: {get_adk_version()}
+- **Platform**: {_get_platform_display_name(platform)}
+- **Model**: {model}
+- **Utterances**: {utterances} (padding: {Config.PROMPT_FILL}, gap {Config.PROMPT_GAP:g}s)
+- **Noise Overlay**: {noise}
+- **Upload Pacing**: {Config.UPLOAD_PACING} ({Config.CHUNK_SIZE}-byte chunks)
+- **Google Cloud Location**: {os.getenv("GOOGLE_CLOUD_LOCATION", "Not configured")}
+
+## Latency by Prompt Length
+
+Values are p50 / p95 in milliseconds.
+
+| Prompt | PCM Bytes | Synthesis | Sessions | Error Rate | """
+    content += " | ".join(name.replace("_", " ").title() for name in SCALING_METRICS) + " |\n"
+    content += "|" + "---|" * (len(SCALING_METRICS) + 5) + "\n"
+    for summary in summaries:
+        cells = []
+        for name in SCALING_METRICS:
+            values = summary["latencies"].get(name)
+            cells.append(f"{values[0]:.0f} / {values[1]:.0f}" if values else "-")
+        content += (f"| {summary['prompt_seconds']:.1f}s | {summary['prompt_bytes']:,} | "
+                    f"{summary['synthesis_ms']:.0f}ms | {summary['sessions']} | {summary['error_rate']:.1f}% | "
+                    + " | ".join(cells) + " |\n")
+
+    content += "\n## Scaling\n\nLeast-squares fit of p50 latency against prompt length.\n\n"
+    content += "| Metric | ms per Prompt Second | Intercept (ms) |\n|---|---|---|\n"
+    for name in SCALING_METRICS:
+        points = [(summary["prompt_seconds"], summary["latencies"][name][0])
+                  for summary in summaries if name in summary["latencies"]]
+        if len(points) >= 2:
+            slope, intercept = _linear_fit(*zip(*points))
+            content += f"| {name.replace('_', ' ').title()} | {slope:.1f} | {intercept:.0f} |\n"
+
+    content += """
+---
+*Report generated by ADK Bidirectional Streaming Test Tool*
+"""
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+    print(f"\n📄 Scaling report saved to: {output_file}")
+    return output_file
+
+def _current_rss_mb() -> float:
+    """Resident set size of this process in MB (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+def _slope(values: list) -> float:
+    """Least-squares slope of values against their index (change per turn)."""
+    count = len(values)
+    if count < 2:
+        return 0.0
+    mean_x = (count - 1) / 2
+    mean_y = sum(values) / count
+    numerator = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+    return numerator / sum((x - mean_x) ** 2 for x in range(count))
+
+async def run_soak_test(platform: str, model: str, region: str = None, turns: int = None,
+                        script: list = None, interval: float = None) -> dict:
+    """Run a multi-turn soak session and return per-turn records and memory growth.
+
+    tracemalloc runs for the whole session; allocation growth is measured from
+    the end of the first turn (after warm-up) to the end of the last.
+    """
+    turns = Config.SOAK_TURNS if turns is None else turns
+    script = script or Config.SOAK_SCRIPT
+    interval = Config.SOAK_TURN_INTERVAL if interval is None else interval
+    preload_dependencies(voice="audio" in script)
+    await probe_capabilities([(platform, model)], region)
+    tester = ADKStreamingTester(platform, model, region, headless=True)
+    snapshots = []
+
+    def on_turn(record):
+        if record["turn"] == 1:
+            snapshots.append(tracemalloc.take_snapshot())
+        print(f"Turn {record['turn']}: RSS {record['rss_mb']:.1f}MB, traced {record['traced_mb']:.1f}MB, "
+              f"{record['session_events']} session events")
+
+    tracemalloc.start()
+    try:
+        records = await tester.soak_session(turns, script, interval, on_turn)
+        snapshots.append(tracemalloc.take_snapshot())
+    finally:
+        tracemalloc.stop()
+
+    growth = []
+    if len(snapshots) == 2:
+        ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        first, last = (snapshot.filter_traces(ignore) for snapshot in snapshots)
+        for stat in last.compare_to(first, "lineno")[:Config.SOAK_TOP_ALLOCATIONS]:
+            frame = stat.traceback[0]
+            growth.append({"site": f"{frame.filename}:{frame.lineno}", "size_kb": stat.size_diff / 1024,
+                           "count": stat.count_diff})
+    return {"records": records, "growth": growth, "failure_reason": tester.failure_reason}
+
+def _summarize_soak_drift(records: list) -> list[tuple[str, float, float, float]]:
+    """Compare the first and last tenth of the turns for each tracked series.
+
+    Returns (name, first window mean, last window mean, slope per turn) rows.
+    """
+    window = max(1, len(records) // 10)
+    series = {name: [record["latencies"][name] for record in records if name in record["latencies"]]
+              for name in ("first_event", "turn_complete")}
+    series["rss_mb"] = [record["rss_mb"] for record in records]
+    series["traced_mb"] = [record["traced_mb"] for record in records]
+    series["session_events"] = [record["session_events"] for record in records]
+
+    rows = []
+    for name, values in series.items():
+        if values:
+            first = sum(values[:window]) / len(values[:window])
+            last = sum(values[-window:]) / len(values[-window:])
+            rows.append((name, first, last, _slope(values)))
+    return rows
+
+def generate_soak_report(platform: str, model: str, script: list, soak: dict, output_file: str) -> str:
+    """Generate a soak test report with per-turn drift and memory growth."""
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    records = soak["records"]
+    passed = sum(1 for record in records if record["success"])
+    units = {"first_event": "ms", "turn_complete": "ms", "rss_mb": "MB", "traced_mb": "MB", "session_events": ""}
+    labels = {"first_event": "First Event Latency", "turn_complete": "Turn Complete Latency",
+              "rss_mb": "Client RSS", "traced_mb": "Traced Python Memory", "session_events": "Session Events"}
+
+    content = f"""# ADK Bidirectional Streaming Soak Test Report
+
+## Soak Test Summary
+- **Test Date**: {timestamp}
+- **Google ADK Version**: {get_adk_version()}
+- **Platform**: {_get_platform_display_name(platform)}
+- **Model**: {model}
+- **Turn Script**: {", ".join(script)}
+- **Turns Completed**: {len(records)}
+- **Turns Passed**: {passed}
+"""
+    if soak["failure_reason"]:
+        content += f"- **Stopped**: {soak['failure_reason']}\n"
+
+    content += """
+## Drift
+
+First and last windows are the mean of the first and last 10% of turns; the slope is a least-squares fit per turn.
+
+| Metric | First Window | Last Window | Slope per Turn |
+|---|---|---|---|
+"""
+    for name, first, last, slope in _summarize_soak_drift(records):
+        unit = units[name]
+        content += f"| {labels[name]} | {first:.1f}{unit} | {last:.1f}{unit} | {slope:+.3f}{unit} |\n"
+
+    if soak["growth"]:
+        content += "\n## Memory Growth by Allocation Site\n\nFrom the end of turn 1 to the end of the last turn.\n\n"
+        content += "| Allocation Site | Size Change | Block Change |\n|---|---|---|\n"
+        for entry in soak["growth"]:
+            content += f"| `{entry['site']}` | {entry['size_kb']:+.1f}KB | {entry['count']:+d} |\n"
+
+    content += "\n## Per-Turn Measurements\n\n"
+    content += "| Turn | Type | Result | First Event | Turn Complete | RSS | Traced | Session Events |\n"
+    content += "|---|---|---|---|---|---|---|---|\n"
+    for record in records:
+        status = "✅ PASS" if record["success"] else "❌ FAIL"
+        latencies = record["latencies"]
+        first_event = f"{latencies['first_event']:.0f}ms" if "first_event" in latencies else "-"
+        turn_complete = f"{latencies['turn_complete']:.0f}ms" if "turn_complete" in latencies else "-"
+        content += (f"| {record['turn']} | {record['kind'].title()} | {status} | {first_event} | {turn_complete} | "
+                    f"{record['rss_mb']:.1f}MB | {record['traced_mb']:.1f}MB | {record['session_events']} |\n")
+
+    content += """
+---
+*Report generated by ADK Bidirectional Streaming Test Tool*
+"""
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+    print(f"\n📄 Soak test report saved to: {output_file}")
+    return output_file
+
+def parse_markdown_report(path: str) -> list[dict]:
+    """Parse a Markdown test report into result store records.
+
+    Reports only carry p50 / p95 latencies, so imported test records get a
+    "latency_summary" ({metric: [p50, p95]}) instead of per-attempt timings.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    def field(label: str) -> str:
+        match = re.search(rf"- \*\*{re.escape(label)}\*\*: (.+)", text)
+        return match.group(1).strip() if match else ""
+
+    filename = os.path.basename(path)
+    common = {
+        "run_id": filename[len("test_report_"):-len(".md")],
+        "timestamp": field("Test Date"),
+        "adk_version": field("Google ADK Version"),
+        "region": field("Google Cloud Location"),
+    }
+    records = [{"record": "run", **common, "project": field("Google Cloud Project"),
+                "loop_lag": {}, "voice_resources": {}, "source": "markdown"}]
+
+    platform_ids = {_get_platform_display_name(platform): platform for platform in ("google-ai-studio", "vertex-ai")}
+    tests = {}
+    section = platform = model = None
+    metric_names = []
+    for line in text.splitlines():
+        if line.startswith("## "):
+            section, platform = line[3:].strip(), None
+        elif line.startswith("### "):
+            platform = platform_ids.get(line[4:].strip())
+        elif not platform:
+            continue
+        elif section == "Detailed Results":
+            if match := re.match(r"\*\*(.+)\*\*:$", line):
+                model = match.group(1)
+            elif match := re.match(r"  - (Text|Voice)([^:]*): (✅ PASS|❌ FAIL)(?: \(retries: (\d+)\))?(?: - Reason: (.*))?$", line):
+                tests[(platform, model, match.group(1).lower())] = {
+                    "modality": "AUDIO" if match.group(1) == "Voice" or "audio transcript" in match.group(2) else "TEXT",
+                    "success": match.group(3) == "✅ PASS",
+                    "retry_count": int(match.group(4) or 0),
+                    "failure_reason": match.group(5) or "",
+                }
+        elif section == "Voice Transcription Results":
+            if (match := re.match(r'\*\*(.+)\*\*: "(.*)"$', line)) and (platform, match.group(1), "voice") in tests:
+                tests[(platform, match.group(1), "voice")]["transcription"] = match.group(2)
+        elif section == "Latency Results" and line.startswith("| "):
+            cells = [cell.strip() for cell in line.strip("|").split("|")]
+            if cells[0] == "Model":
+                metric_names = [cell.lower().replace(" ", "_") for cell in cells[3:]]
+            elif (platform, cells[0], cells[1]) in tests:
+                tests[(platform, cells[0], cells[1])]["latency_summary"] = {
+                    name: [float(value) for value in cell.split(" / ")]
+                    for name, cell in zip(metric_names, cells[3:]) if cell != "-"
+                }
+
+    for (platform, model, test_type), test in tests.items():
+        records.append({
+            "record": "test",
+            **common,
+            "test_key": f"{platform}-{model}-{test_type}",
+            "platform": platform,
+            "model": model,
+            "test_type": test_type,
+            "success": test["success"],
+            "retry_count": test["retry_count"],
+            "failure_reason": test["failure_reason"],
+            "close_code": _close_code_from_reason(test["failure_reason"]),
+            "timeout_phase": _timeout_phase_from_reason(test["failure_reason"]),
+            "transcription": test.get("transcription"),
+            "error_trace": "",
+            "timings": [],
+            "modality": test["modality"],
+            "latency_summary": test.get("latency_summary", {}),
+        })
+    return records
+
+def ingest_markdown_reports(store: ResultStore, pattern: str = "test_report_*.md") -> int:
+    """Import Markdown reports whose run is not in the store yet; return the number imported."""
+    known = set(store.run_ids())
+    imported = 0
+    for path in sorted(glob.glob(pattern)):
+        records = parse_markdown_report(path)
+        if records[0]["run_id"] in known or not records[0]["adk_version"]:
+            continue
+        store.append(records)
+        imported += 1
+    return imported
+
+def _latency_samples(record: dict, metric: str) -> list:
+    """Per-attempt samples of a metric, or the run's p50 for records imported from Markdown."""
+    if record["timings"]:
+        return [timing[metric] for timing in record["timings"] if metric in timing]
+    summary = record.get("latency_summary", {})
+    return [summary[metric][0]] if metric in summary else []
+
+def _fisher_exact_greater(new_failures: int, new_total: int, base_failures: int, base_total: int) -> float:
+    """One-sided Fisher exact p-value that new runs fail more often than the baseline."""
+    failures = new_failures + base_failures
+    total = new_total + base_total
+    tail = sum(math.comb(new_total, k) * math.comb(base_total, failures - k)
+               for k in range(new_failures, min(new_total, failures) + 1))
+    return tail / math.comb(total, failures)
+
+def _mann_whitney_greater(new: list, base: list) -> float:
+    """One-sided Mann-Whitney U p-value (normal approximation) that new samples are larger."""
+    combined = sorted([(value, True) for value in new] + [(value, False) for value in base])
+    count = len(combined)
+    rank_sum = 0.0
+    tie_term = 0
+    i = 0
+    while i < count:
+        j = i
+        while j + 1 < count and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        average_rank = (i + j) / 2 + 1
+        rank_sum += average_rank * sum(1 for _, is_new in combined[i:j + 1] if is_new)
+        tie_term += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+
+    n_new, n_base = len(new), len(base)
+    u = rank_sum - n_new * (n_new + 1) / 2
+    variance = n_new * n_base / 12 * ((count + 1) - tie_term / (count * (count - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n_new * n_base / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+def analyze_history(records: list) -> dict:
+    """Index stored runs by test and ADK version, and test the latest version for regressions.
+
+    The latest ADK version (that of the most recent run) is compared with the
+    most recent Config.HISTORY_BASELINE_RUNS runs of earlier versions: pass
+    rate with a one-sided Fisher exact test, latencies with a one-sided
+    Mann-Whitney U test plus a minimum relative increase of the median.
+
+    A version usually gets a single run, too few for either test to reach
+    significance, so absolute rules also apply: a test that passed in each of
+    the last Config.HISTORY_BREAK_RUNS baseline runs and fails in every latest
+    run has regressed, and so has a latency whose latest samples all exceed
+    the slowest baseline sample and whose median rose by the threshold.
+    These regressions have no p-value.
+    """
+    runs = sorted((record for record in records if record["record"] == "run"), key=lambda run: run["timestamp"])
+    run_order = {run["run_id"]: position for position, run in enumerate(runs)}
+    versions = list(dict.fromkeys(run["adk_version"] for run in runs))
+    latest_version = versions[-1] if versions else None
+
+    # (platform, model, test_type) -> ADK version -> test records in run order
+    index = {}
+    for record in sorted((record for record in records if record["record"] == "test" and record["run_id"] in run_order),
+                         key=lambda record: run_order[record["run_id"]]):
+        key = (record["platform"], record["model"], record["test_type"])
+        index.setdefault(key, {}).setdefault(record["adk_version"], []).append(record)
+
+    trends = {}
+    regressions = []
+    for key, by_version in index.items():
+        trends[key] = []
+        for version in versions:
+            tests = by_version.get(version)
+            if not tests:
+                continue
+            medians = {}
+            for metric in Config.HISTORY_METRICS:
+                samples = [sample for test in tests for sample in _latency_samples(test, metric)]
+                if samples:
+                    medians[metric] = _percentile(samples, 50)
+            passed = sum(1 for test in tests if test["success"])
+            trends[key].append({"version": version, "runs": len(tests), "passed": passed, "medians": medians})
+
+        current = by_version.get(latest_version, [])
+        baseline = [test for version, tests in by_version.items() if version != latest_version
+                    for test in tests][-Config.HISTORY_BASELINE_RUNS:]
+        if not current or not baseline:
+            continue
+
+        current_failures = sum(1 for test in current if not test["success"])
+        baseline_failures = sum(1 for test in baseline if not test["success"])
+        p_value = _fisher_exact_greater(current_failures, len(current), baseline_failures, len(baseline))
+        recent = baseline[-Config.HISTORY_BREAK_RUNS:]
+        broken = (current_failures == len(current) and len(recent) == Config.HISTORY_BREAK_RUNS
+                  and all(test["success"] for test in recent))
+        if p_value < Config.REGRESSION_ALPHA or broken:
+            regressions.append({
+                "key": key, "metric": "pass_rate", "p_value": p_value if p_value < Config.REGRESSION_ALPHA else None,
+                "baseline": (len(baseline) - baseline_failures) / len(baseline) * 100,
+                "current": (len(current) - current_failures) / len(current) * 100,
+            })
+
+        for metric in Config.HISTORY_METRICS:
+            current_samples = [sample for test in current for sample in _latency_samples(test, metric)]
+            baseline_samples = [sample for test in baseline for sample in _latency_samples(test, metric)]
+            if not current_samples or len(baseline_samples) < Config.HISTORY_MIN_SAMPLES:
+                continue
+            current_median = _percentile(current_samples, 50)
+            baseline_median = _percentile(baseline_samples, 50)
+            if current_median <= baseline_median * (1 + Config.LATENCY_REGRESSION_THRESHOLD):
+                continue
+            p_value = None
+            if len(current_samples) >= Config.HISTORY_MIN_SAMPLES:
+                p_value = _mann_whitney_greater(current_samples, baseline_samples)
+            if p_value is not None and p_value < Config.REGRESSION_ALPHA:
+                regressions.append({"key": key, "metric": metric, "p_value": p_value,
+                                    "baseline": baseline_median, "current": current_median})
+            elif min(current_samples) > max(baseline_samples):
+                regressions.append({"key": key, "metric": metric, "p_value": None,
+                                    "baseline": baseline_median, "current": current_median})
+
+    return {"runs": len(runs), "versions": versions, "latest_version": latest_version,
+            "trends": trends, "regressions": regressions}
+
+def generate_history_report(history: dict, output_file: str) -> str:
+    """Generate the trend and regression report across ADK versions."""
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    metric_titles = [name.replace("_", " ").title() for name in Config.HISTORY_METRICS]
+
+    content = f"""# ADK Bidirectional Streaming History Report
+
+## History Summary
+- **Generated**: {timestamp}
+- **Stored Runs**: {history['runs']}
+- **ADK Versions**: {len(history['versions'])} ({history['versions'][0] if history['versions'] else '-'} to {history['latest_version'] or '-'})
+- **Latest ADK Version**: {history['latest_version'] or '-'}
+- **Regressions Detected**: {len(history['regressions'])}
+
+## Regressions in ADK {history['latest_version'] or '-'}
+
+The latest version is compared with the last {Config.HISTORY_BASELINE_RUNS} runs of earlier versions (one-sided, alpha {Config.REGRESSION_ALPHA}). Pass rates use Fisher's exact test; latencies use the Mann-Whitney U test and must also rise by at least {Config.LATENCY_REGRESSION_THRESHOLD:.0%} at the median. Without a p-value, a test failed in every latest run after passing the last {Config.HISTORY_BREAK_RUNS} baseline runs, or every latest latency sample exceeded the slowest baseline sample with the same rise of the median.
+
+"""
+    if history["regressions"]:
+        content += "| Platform | Model | Test | Metric | Baseline | Latest | p-value |\n|---|---|---|---|---|---|---|\n"
+        for regression in history["regressions"]:
+            platform, model, test_type = regression["key"]
+            unit = "%" if regression["metric"] == "pass_rate" else "ms"
+            content += (f"| {_get_platform_display_name(platform)} | {model} | {test_type} | "
+                        f"{regression['metric'].replace('_', ' ').title()} | {regression['baseline']:.0f}{unit} | "
+                        f"{regression['current']:.0f}{unit} | "
+                        f"{'-' if regression['p_value'] is None else format(regression['p_value'], '.3f')} |\n")
+    else:
+        content += "No regressions.\n"
+
+    content += "\n## Trends by ADK Version\n\nLatencies are medians in milliseconds; runs imported from Markdown reports contribute their p50.\n\n"
+    platforms = {}
+    for key, rows in history["trends"].items():
+        platforms.setdefault(key[0], []).append((key, rows))
+    for platform, entries in platforms.items():
+        content += f"### {_get_platform_display_name(platform)}\n\n"
+        content += "| Model | Test | ADK Version | Runs | Pass Rate | " + " | ".join(metric_titles) + " |\n"
+        content += "|" + "---|" * (len(metric_titles) + 5) + "\n"
+        for (_, model, test_type), rows in entries:
+            for row in rows:
+                cells = [f"{row['medians'][metric]:.0f}" if metric in row["medians"] else "-"
+                         for metric in Config.HISTORY_METRICS]
+                content += (f"| {model} | {test_type} | {row['version']} | {row['runs']} | "
+                            f"{row['passed'] / row['runs'] * 100:.0f}% | " + " | ".join(cells) + " |\n")
+        content += "\n"
+
+    content += """---
+*Report generated by ADK Bidirectional Streaming Test Tool*
+"""
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+    print(f"\n📄 History report saved to: {output_file}")
+    return output_file
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="ADK Bidirectional Streaming Test Tool - Combined Text and Voice Testing")
@@ -925,8 +4166,108 @@ def main():
                        default="all", help="Platform to test")
     parser.add_argument("--model", help="Specific model to test")
     parser.add_argument("--region", help="Google Cloud region to use (overrides GOOGLE_CLOUD_LOCATION env var)")
+    parser.add_argument("--regions", type=lambda value: [region.strip() for region in value.split(",")],
+                       help="Run the Vertex AI matrix in these regions concurrently and compare them in one report, "
+                            "e.g. us-central1,europe-west4,asia-northeast1")
     parser.add_argument("--headless", action="store_true",
                        help="Run in headless mode (skip audio playback for CI environments)")
+    parser.add_argument("--concurrency", type=_positive_int, default=Config.MAX_CONCURRENCY,
+                       help=f"Maximum concurrent live sessions (default: {Config.MAX_CONCURRENCY})")
+    parser.add_argument("--studio-concurrency", type=_positive_int,
+                       default=Config.PLATFORM_CONCURRENCY["google-ai-studio"],
+                       help="Maximum concurrent Google AI Studio sessions")
+    parser.add_argument("--vertex-concurrency", type=_positive_int,
+                       default=Config.PLATFORM_CONCURRENCY["vertex-ai"],
+                       help="Maximum concurrent Vertex AI sessions")
+    parser.add_argument("--upload-pacing", choices=["fixed", "realtime", "accelerated", "burst"],
+                       default=Config.UPLOAD_PACING, help="Pacing of voice prompt audio chunks")
+    parser.add_argument("--upload-speed", type=float, default=Config.UPLOAD_SPEED,
+                       help="Real-time multiple for accelerated pacing")
+    parser.add_argument("--chunk-size", type=_parse_chunk_size, default=Config.CHUNK_SIZE,
+                       help="Audio chunk size in bytes for voice prompt upload (positive and even)")
+    parser.add_argument("--recognizer", choices=sorted(RECOGNIZERS), default=Config.RECOGNIZER,
+                       help="Speech-to-Text mode for voice responses (streaming while audio arrives, or batch after the turn)")
+    parser.add_argument("--mock-server",
+                       help="Run against a local mock Live API server (e.g. https://localhost:8765) instead of real endpoints")
+    parser.add_argument("--mock-ca", help="CA certificate for the mock server (e.g. mock_live_server_cert.pem)")
+    parser.add_argument("--load", action="store_true",
+                       help="Run a load test against --platform and --model instead of the test matrix")
+    parser.add_argument("--load-mode", choices=["stepped", "arrival"], default="stepped",
+                       help="Ramp concurrent sessions (stepped) or session arrival rate (arrival)")
+    parser.add_argument("--load-steps", type=_parse_load_steps,
+                       default=Config.LOAD_STEPS,
+                       help="Comma-separated load levels, e.g. 1,2,4,8 (sessions, or sessions/sec in arrival mode)")
+    parser.add_argument("--load-duration", type=float, default=Config.LOAD_STEP_DURATION,
+                       help=f"Seconds per load step (default: {Config.LOAD_STEP_DURATION})")
+    parser.add_argument("--load-test-type", choices=["text", "voice"], default="text",
+                       help="Session type used for load testing")
+    parser.add_argument("--results-store", default=Config.RESULTS_STORE,
+                       help=f"JSONL file that test results are appended to (default: {Config.RESULTS_STORE})")
+    parser.add_argument("--record-traces", metavar="DIR",
+                       help="Record every run_live event stream as a JSONL trace and audio blob in DIR")
+    parser.add_argument("--replay", metavar="TRACE",
+                       help="Replay a recorded trace (.jsonl) through the response collectors instead of testing")
+    parser.add_argument("--replay-speed", type=float, default=1.0,
+                       help="Replay speed: 1 for original timing, 2 for twice as fast, 0 for maximum speed")
+    parser.add_argument("--replay-collector", choices=["text", "transcription", "audio"],
+                       help="Collector to replay into (default: the one that recorded the trace)")
+    parser.add_argument("--deadlines", type=_parse_deadlines, default={},
+                       help=f"Per-phase budgets in seconds, e.g. connect=20,idle=10 (phases: {', '.join(Config.DEADLINES)})")
+    parser.add_argument("--validators", type=_parse_validators, default=Config.RESPONSE_VALIDATORS,
+                       help=f"Comma-separated response validators ({', '.join(VALIDATORS)}) to apply after the keyword match; "
+                            "default: keywords only")
+    parser.add_argument("--clock-offsets", type=lambda value: [float(hours) for hours in value.split(",")],
+                       help="UTC offsets in hours the spoken time may use for the clock validator, e.g. 9 or -8,-7")
+    parser.add_argument("--wait-for-turn-complete", action="store_true",
+                       help="Read every response to turn_complete instead of closing the session once it is verified")
+    parser.add_argument("--profile-events", action="store_true",
+                       help="Histogram per-event handling time, event sizes and inter-arrival gaps in the collectors")
+    parser.add_argument("--profile-dir", metavar="DIR",
+                       help="Profile the collector loops with cProfile and write collector_<name>.prof files to DIR "
+                            "(runs one session at a time)")
+    parser.add_argument("--reprobe", action="store_true",
+                       help="Ignore cached model capabilities and probe every model again")
+    parser.add_argument("--recheck-permanent", action="store_true",
+                       help="Forget remembered permanent failures and run those tests again")
+    parser.add_argument("--render-report", nargs="?", const="latest", metavar="RUN_ID",
+                       help="Render the Markdown report of a stored run (default: latest) without running tests")
+    parser.add_argument("--history", action="store_true",
+                       help="Import past Markdown reports into the result store, report trends by ADK version "
+                            "and exit with status 1 if the latest version regressed")
+    parser.add_argument("--workers", type=_positive_int,
+                       help="Run the test matrix in this many worker processes, one shard each, and merge their results")
+    parser.add_argument("--shard", type=_parse_shard, metavar="INDEX/COUNT",
+                       help="Worker mode: run only this shard of the test matrix, e.g. 2/4, and store its results "
+                            "without a report")
+    parser.add_argument("--run-id", help="Run id shared by the shards of one run (worker mode and --merge-shards)")
+    parser.add_argument("--merge-shards", metavar="GLOB",
+                       help="Merge shard result stores (e.g. copied from remote hosts) into one run and report")
+    parser.add_argument("--soak", action="store_true",
+                       help="Run a multi-turn soak session against --platform and --model instead of the test matrix")
+    parser.add_argument("--soak-turns", type=_positive_int, default=Config.SOAK_TURNS,
+                       help=f"Turns sent over the soak session (default: {Config.SOAK_TURNS})")
+    parser.add_argument("--soak-script", type=_parse_soak_script, default=Config.SOAK_SCRIPT,
+                       help="Comma-separated turn kinds cycled in order, e.g. text,audio")
+    parser.add_argument("--soak-interval", type=float, default=Config.SOAK_TURN_INTERVAL,
+                       help=f"Seconds between soak turns (default: {Config.SOAK_TURN_INTERVAL})")
+    parser.add_argument("--input-scaling", nargs="?", const=Config.SCALING_DURATIONS, type=_parse_load_steps,
+                       metavar="SECONDS",
+                       help="Run voice sessions against --platform and --model with synthetic prompts of each length, "
+                            f"e.g. 1,60,300 (default: {','.join(map(str, Config.SCALING_DURATIONS))})")
+    parser.add_argument("--scaling-sessions", type=_positive_int, default=Config.SCALING_SESSIONS,
+                       help=f"Voice sessions per prompt length (default: {Config.SCALING_SESSIONS})")
+    parser.add_argument("--prompt-duration", type=float,
+                       help="Send a synthetic voice prompt padded to this many seconds")
+    parser.add_argument("--prompt-utterances", type=lambda value: value.split(","),
+                       help="Comma-separated audio files spoken in order in the synthetic prompt (default: the audio file)")
+    parser.add_argument("--prompt-fill", choices=["silence", "repeat"], default=Config.PROMPT_FILL,
+                       help="Pad the synthetic prompt with silence or by repeating the utterances")
+    parser.add_argument("--prompt-lead-silence", type=float, default=Config.PROMPT_LEAD_SILENCE,
+                       help="Seconds of silence at the start of the synthetic prompt")
+    parser.add_argument("--prompt-gap", type=float, default=Config.PROMPT_GAP,
+                       help=f"Seconds of silence between utterances (default: {Config.PROMPT_GAP})")
+    parser.add_argument("--prompt-noise", type=float, metavar="DBFS",
+                       help="Overlay white noise at this RMS level on the synthetic prompt, e.g. -50")
 
     args = parser.parse_args()
 
@@ -936,12 +4277,164 @@ def main():
         print("CI environment detected - running in headless mode")
     
     # Set SSL certificate file as required by ADK
-    os.environ["SSL_CERT_FILE"] = os.popen("python -m certifi").read().strip()
+    import certifi
+    os.environ["SSL_CERT_FILE"] = certifi.where()
+
+    Config.UPLOAD_PACING = args.upload_pacing
+    Config.UPLOAD_SPEED = args.upload_speed
+    Config.CHUNK_SIZE = args.chunk_size
+    Config.RECOGNIZER = args.recognizer
+    Config.VOICE_SESSIONS = args.concurrency
+    Config.RESULTS_STORE = args.results_store
+    if args.recheck_permanent:
+        PERMANENT_FAILURES.clear()
+    if args.reprobe:
+        CAPABILITIES.clear()
+    Config.TRACE_DIR = args.record_traces
+    Config.DEADLINES.update(args.deadlines)
+    Config.RESPONSE_VALIDATORS = args.validators
+    Config.CLOCK_UTC_OFFSETS = args.clock_offsets
+    Config.CLOSE_ON_VERIFIED = not args.wait_for_turn_complete
+    Config.PROFILE_EVENTS = args.profile_events
+    Config.PROFILE_DIR = args.profile_dir
+    if Config.PROFILE_DIR and args.concurrency > 1 and not args.workers:
+        # One cProfile profiler would also record every other session's work; workers serialize themselves
+        print(f"Warning: --profile-dir runs one session at a time instead of {args.concurrency}")
+        args.concurrency = Config.VOICE_SESSIONS = 1
+    if args.shard and Config.PROFILE_DIR:
+        # Workers share the working directory; keep their profiles apart
+        Config.PROFILE_DIR = os.path.join(Config.PROFILE_DIR, f"shard{args.shard[0]}")
+    Config.PROMPT_DURATION = args.prompt_duration
+    Config.PROMPT_UTTERANCES = args.prompt_utterances
+    Config.PROMPT_FILL = args.prompt_fill
+    Config.PROMPT_LEAD_SILENCE = args.prompt_lead_silence
+    Config.PROMPT_GAP = args.prompt_gap
+    Config.PROMPT_NOISE_DBFS = args.prompt_noise
+
+    if args.replay:
+        _run_replay(args)
+        return
+
+    if args.render_report:
+        _render_stored_report(args.render_report)
+        return
+    if args.history:
+        _run_history()
+        return
+    if args.merge_shards:
+        merge_shards(sorted(glob.glob(args.merge_shards)), args.run_id)
+        return
+
+    if args.mock_server:
+        Config.MOCK_SERVER_URL = args.mock_server
+        # The mock server accepts any API key
+        os.environ.setdefault("GOOGLE_API_KEY", "mock-api-key")
+        os.environ.setdefault("GOOGLE_CLOUD_PROJECT", "mock-project")
+        if args.mock_ca:
+            os.environ["SSL_CERT_FILE"] = args.mock_ca
     
-    if args.model:
-        _run_single_model_tests(args)
-    else:
-        _run_all_model_tests(args)
+    try:
+        if args.load:
+            _run_load_tests(args)
+        elif args.soak:
+            _run_soak_test(args)
+        elif args.input_scaling:
+            _run_scaling_test(args)
+        elif args.regions:
+            _run_region_sweep(args)
+        elif args.workers:
+            _run_sharded_tests(args)
+        elif args.model:
+            _run_single_model_tests(args)
+        else:
+            _run_all_model_tests(args)
+    finally:
+        _finish_instrumentation()
+
+def _finish_instrumentation():
+    """Report collector instrumentation."""
+    _print_event_profile(EVENT_PROFILER.summary())
+    if Config.PROFILE_DIR:
+        EVENT_PROFILER.dump_profiles(Config.PROFILE_DIR)
+
+def _positive_int(value: str) -> int:
+    """Parse an integer argument that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {value}")
+    return number
+
+def _parse_chunk_size(value: str) -> int:
+    """Parse --chunk-size; chunks must hold whole 16-bit samples."""
+    size = _positive_int(value)
+    if size % 2:
+        raise argparse.ArgumentTypeError(f"must be even so 16-bit samples are not split across chunks: {value}")
+    return size
+
+def _parse_deadlines(value: str) -> dict:
+    """Parse the --deadlines argument into {phase: seconds}."""
+    deadlines = {}
+    for item in value.split(","):
+        phase, _, seconds = item.partition("=")
+        phase = phase.strip()
+        if phase not in Config.DEADLINES:
+            raise argparse.ArgumentTypeError(f"unknown phase: {phase}")
+        try:
+            deadlines[phase] = float(seconds)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid seconds for {phase}: {seconds}")
+        if deadlines[phase] <= 0:
+            raise argparse.ArgumentTypeError(f"{phase} deadline must be positive")
+    return deadlines
+
+def _parse_validators(value: str) -> list:
+    """Parse the --validators argument."""
+    if value == "none":
+        return []
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in VALIDATORS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown validators: {', '.join(unknown)}")
+    return names
+
+def _render_stored_report(run_id: str):
+    """Re-render the Markdown report of a stored run."""
+    store = ResultStore(Config.RESULTS_STORE)
+    run_ids = store.run_ids()
+    if run_id == "latest":
+        run_id = run_ids[-1] if run_ids else None
+    if run_id not in run_ids:
+        print(f"Error: Run not found in {Config.RESULTS_STORE}: {run_id}")
+        return
+    render_test_report(store.load(run_id), _generate_report_filename(run_id=run_id))
+
+def _run_replay(args):
+    """Replay a recorded trace and print per-turn latencies."""
+    started = time.monotonic()
+    turn_latencies = asyncio.run(replay_session(args.replay, args.replay_speed, args.replay_collector))
+    elapsed = time.monotonic() - started
+    for turn, latencies in enumerate(turn_latencies, 1):
+        print(f"Turn {turn}: " + (", ".join(f"{name} {value:.0f}ms" for name, value in latencies.items()) or "no latencies"))
+    print(f"Replayed {len(turn_latencies)} turn(s) in {elapsed:.2f}s")
+
+def _run_history():
+    """Ingest past reports, write the history report and fail on regressions."""
+    store = ResultStore(Config.RESULTS_STORE)
+    imported = ingest_markdown_reports(store)
+    print(f"Imported {imported} Markdown reports into {Config.RESULTS_STORE}")
+
+    history = analyze_history(store.load())
+    generate_history_report(history, Config.HISTORY_REPORT)
+    for regression in history["regressions"]:
+        platform, model, test_type = regression["key"]
+        print(f"REGRESSION in ADK {history['latest_version']}: {platform} {model} {test_type} "
+              f"{regression['metric']} {regression['baseline']:.0f} -> {regression['current']:.0f}"
+              + ("" if regression["p_value"] is None else f" (p={regression['p_value']:.3f})"))
+    if history["regressions"]:
+        sys.exit(1)
 
 def _run_single_model_tests(args):
     """Run combined tests for a single model."""
@@ -952,9 +4445,102 @@ def _run_single_model_tests(args):
     print("Running combined text and voice tests:")
     asyncio.run(test_single_model_combined(args.platform, args.model, args.region, args.headless))
 
+def _parse_load_steps(value: str) -> list:
+    """Parse comma-separated load levels, keeping whole numbers as int."""
+    return [float(step) if "." in step else int(step) for step in value.split(",")]
+
+def _run_load_tests(args):
+    """Run a load test for a single model."""
+    if args.platform == "all" or not args.model:
+        print("Error: Must specify platform and model for load testing")
+        return
+
+    if args.load_mode == "stepped":
+        Config.VOICE_SESSIONS = max(int(step) for step in args.load_steps)
+    summaries = asyncio.run(run_load_test(args.platform, args.model, args.load_test_type, args.region,
+                                          args.load_mode, args.load_steps, args.load_duration))
+    region = args.region or os.getenv("GOOGLE_CLOUD_LOCATION", "unknown")
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    generate_load_report(args.platform, args.model, args.load_test_type, args.load_mode, summaries,
+                         f"load_report_{region}_{timestamp}.md")
+
+def _run_scaling_test(args):
+    """Run an input-length scaling test for a single model."""
+    if args.platform == "all" or not args.model:
+        print("Error: Must specify platform and model for scaling tests")
+        return
+
+    summaries = asyncio.run(run_scaling_test(args.platform, args.model, args.region, args.input_scaling,
+                                             args.scaling_sessions))
+    region = args.region or os.getenv("GOOGLE_CLOUD_LOCATION", "unknown")
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    generate_scaling_report(args.platform, args.model, summaries, f"scaling_report_{region}_{timestamp}.md")
+
+def _parse_soak_script(value: str) -> list:
+    """Parse comma-separated soak turn kinds."""
+    script = [kind.strip() for kind in value.split(",")]
+    for kind in script:
+        if kind not in ("text", "audio"):
+            raise argparse.ArgumentTypeError(f"invalid turn kind: {kind} (choose text or audio)")
+    return script
+
+def _run_soak_test(args):
+    """Run a soak session for a single model."""
+    if args.platform == "all" or not args.model:
+        print("Error: Must specify platform and model for soak testing")
+        return
+
+    soak = asyncio.run(run_soak_test(args.platform, args.model, args.region, args.soak_turns,
+                                     args.soak_script, args.soak_interval))
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    generate_soak_report(args.platform, args.model, args.soak_script, soak, f"soak_report_{timestamp}.md")
+
+def _run_region_sweep(args):
+    """Run the Vertex AI matrix in several regions."""
+    if args.platform == "google-ai-studio":
+        print("Error: Region sweeps test Vertex AI; use --platform vertex-ai or all")
+        return
+
+    # Every region runs its own scheduler with the full limits
+    Config.VOICE_SESSIONS = args.concurrency * len(args.regions)
+    asyncio.run(run_region_sweep(args.regions, args.headless, args.concurrency,
+                                 {"vertex-ai": args.vertex_concurrency}, args.model))
+
+def _parse_shard(value: str) -> tuple[int, int]:
+    """Parse a shard as INDEX/COUNT, 1-based."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid shard: {value} (expected INDEX/COUNT, e.g. 2/4)")
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"invalid shard: {value} (INDEX must be between 1 and COUNT)")
+    return index, count
+
+def _run_sharded_tests(args):
+    """Run the test matrix in local worker processes and merge their results."""
+    if args.model or args.shard:
+        print("Error: --workers runs the whole test matrix; it cannot be combined with --model or --shard")
+        return
+
+    platform_limits = {
+        "google-ai-studio": args.studio_concurrency,
+        "vertex-ai": args.vertex_concurrency,
+    }
+    try:
+        asyncio.run(run_sharded_tests(args.workers, _worker_argv(sys.argv[1:]), args.region, args.concurrency,
+                                      platform_limits))
+    except ValueError as e:
+        print(f"Error: {e}")
+
 def _run_all_model_tests(args):
     """Run combined tests for all models."""
-    results, transcriptions, error_traces, retry_counts, failure_reasons = asyncio.run(run_all_tests(args.region, args.headless))
+    platform_limits = {
+        "google-ai-studio": args.studio_concurrency,
+        "vertex-ai": args.vertex_concurrency,
+    }
+    results, transcriptions, error_traces, retry_counts, failure_reasons, timings, modalities = asyncio.run(
+        run_all_tests(args.region, args.headless, args.concurrency, platform_limits, args.shard, args.run_id)
+    )
 
 
 if __name__ == "__main__":
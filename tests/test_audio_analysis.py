@@ -0,0 +1,70 @@
+"""Local response audio analysis and its report section."""
+
+import numpy as np
+import pytest
+
+from test_tool import DURATION_AUDIO_METRICS, Config, _generate_audio_metrics_section, analyze_audio
+
+RATE = Config.OUTPUT_RATE
+
+
+def _pcm(*parts):
+    """16-bit PCM from (seconds, amplitude) parts: a 440 Hz tone, or silence for amplitude 0."""
+    chunks = []
+    for seconds, amplitude in parts:
+        t = np.arange(int(seconds * RATE)) / RATE
+        chunks.append(amplitude * np.sin(2 * np.pi * 440 * t))
+    return np.clip(np.concatenate(chunks), -32768, 32767).astype("<i2").tobytes()
+
+
+def test_levels_and_voiced_segments():
+    metrics, segments = analyze_audio(_pcm((0.5, 0), (1.0, 16384), (0.5, 0), (0.5, 16384)))
+    assert metrics["audio_duration"] == pytest.approx(2500)
+    assert metrics["audio_peak"] == pytest.approx(-6.0, abs=0.1)
+    assert metrics["leading_silence"] == pytest.approx(500)
+    assert segments == [(500.0, 1500.0), (2000.0, 2500.0)]
+    assert metrics["voiced_segments"] == 2
+    assert metrics["voiced_duration"] == pytest.approx(1500)
+    assert metrics["audio_silence"] == pytest.approx(40)
+    assert metrics["audio_clipping"] == 0
+
+
+def test_short_pause_is_bridged_and_click_dropped():
+    _, segments = analyze_audio(_pcm((0.5, 16384), (0.1, 0), (0.5, 16384), (1.0, 0), (0.02, 16384), (0.5, 0)))
+    assert segments == [(0.0, 1100.0)]
+
+
+def test_clipping():
+    metrics, _ = analyze_audio(_pcm((1.0, 40000)))
+    assert metrics["audio_clipping"] > 0
+    assert metrics["audio_peak"] == pytest.approx(0.0, abs=0.01)
+
+
+def test_silent_and_empty_responses():
+    metrics, segments = analyze_audio(_pcm((1.0, 0)))
+    assert segments == []
+    assert metrics["audio_peak"] == pytest.approx(-90.3, abs=0.1)
+    assert analyze_audio(b"") == ({}, [])
+
+
+def test_truncated_response_has_no_duration_metrics():
+    metrics, segments = analyze_audio(_pcm((0.2, 0), (0.5, 16384)), complete=False)
+    assert segments
+    assert not set(DURATION_AUDIO_METRICS) & set(metrics)
+    assert metrics["leading_silence"] == pytest.approx(200)
+    metrics, _ = analyze_audio(_pcm((0.5, 0)), complete=False)
+    assert "leading_silence" not in metrics
+    assert "audio_rms" in metrics
+
+
+def test_report_counts_truncated_attempts():
+    complete, _ = analyze_audio(_pcm((1.0, 16384)))
+    truncated, _ = analyze_audio(_pcm((0.4, 16384)), complete=False)
+    timings = {"google-ai-studio-gemini-live-voice": [{**complete, "audio_truncated": 0.0},
+                                                      {**truncated, "audio_truncated": 1.0}],
+               "google-ai-studio-gemini-live-text": [{"first_event": 100.0}]}
+    section = _generate_audio_metrics_section(timings)
+    row = next(line for line in section.splitlines() if "gemini-live" in line)
+    cells = [cell.strip() for cell in row.strip("|").split("|")]
+    assert cells[2] == "1/2"
+    assert cells[3] == "1000.0"  # Duration only from the complete response
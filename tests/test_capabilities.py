@@ -0,0 +1,60 @@
+"""Cached model capabilities and the text-test modality chosen from them."""
+
+import json
+import time
+
+import pytest
+
+import test_tool
+from test_tool import CapabilityCache, Config, text_uses_audio
+
+
+def test_entries_are_kept_per_region(tmp_path):
+    cache = CapabilityCache(str(tmp_path / "capabilities.json"))
+    cache.put("vertex-ai", "gemini-live", {"modalities": ["AUDIO"], "transcription": True}, "europe-west4")
+    reloaded = CapabilityCache(cache.path)
+    assert reloaded.get("vertex-ai", "gemini-live", "europe-west4")["modalities"] == ["AUDIO"]
+    assert reloaded.get("vertex-ai", "gemini-live", "us-central1") is None
+    assert reloaded.get("vertex-ai", "gemini-live") is None
+
+
+def test_mock_server_probes_are_kept_apart(tmp_path, monkeypatch):
+    cache = CapabilityCache(str(tmp_path / "capabilities.json"))
+    cache.put("vertex-ai", "gemini-live", {"modalities": ["TEXT", "AUDIO"], "transcription": True})
+    monkeypatch.setattr(Config, "MOCK_SERVER_URL", "https://localhost:8765")
+    assert cache.get("vertex-ai", "gemini-live") is None
+
+
+def test_expired_entries_are_probed_again(tmp_path):
+    path = tmp_path / "capabilities.json"
+    cache = CapabilityCache(str(path), ttl=60)
+    cache.put("vertex-ai", "gemini-live", {"modalities": ["TEXT"], "transcription": False})
+    entries = json.loads(path.read_text())
+    for entry in entries.values():
+        entry["probed_at"] = time.time() - 120
+    path.write_text(json.dumps(entries))
+    assert CapabilityCache(str(path), ttl=60).get("vertex-ai", "gemini-live") is None
+
+
+def test_clear(tmp_path):
+    path = tmp_path / "capabilities.json"
+    cache = CapabilityCache(str(path))
+    cache.put("vertex-ai", "gemini-live", {"modalities": ["TEXT"], "transcription": False})
+    cache.clear()
+    assert not path.exists()
+    assert cache.get("vertex-ai", "gemini-live") is None
+
+
+@pytest.mark.parametrize("modalities, model, uses_audio", [
+    (["AUDIO"], "gemini-live", True),
+    (["TEXT", "AUDIO"], "gemini-live", False),
+    (None, "gemini-2.5-flash-native-audio-preview", True),
+    (None, "gemini-live-2.5-flash", False),
+    ([], "gemini-2.5-flash-native-audio-preview", True),
+])
+def test_text_uses_audio(tmp_path, monkeypatch, modalities, model, uses_audio):
+    cache = CapabilityCache(str(tmp_path / "capabilities.json"))
+    if modalities is not None:
+        cache.put("vertex-ai", model, {"modalities": modalities, "transcription": True}, "us-central1")
+    monkeypatch.setattr(test_tool, "CAPABILITIES", cache)
+    assert text_uses_audio("vertex-ai", model, "us-central1") is uses_audio
@@ -0,0 +1,73 @@
+"""Per-phase deadlines around the live event stream."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from test_tool import (ADKStreamingTester, Config, PhaseTimeout, SessionTimer, _timeout_phase_from_reason,
+                       phase_deadline)
+
+
+@pytest.fixture(autouse=True)
+def short_deadlines(monkeypatch):
+    monkeypatch.setattr(Config, "DEADLINES", {"connect": 0.3, "first_event": 0.1, "idle": 0.1, "turn": 0.5,
+                                              "upload": 1.0})
+
+
+async def _events(delays, timer):
+    """Yield an event after each delay, marking the first one like the collectors do."""
+    for delay in delays:
+        await asyncio.sleep(delay)
+        timer.mark("first_event")
+        yield delay
+
+
+def _collect(delays, connected=True):
+    timer = SessionTimer()
+    if connected:
+        timer.mark("connected")
+    timer.mark("request_sent")
+    tester = SimpleNamespace(timer=timer)
+
+    async def read():
+        return [event async for event in ADKStreamingTester._deadline_events(tester, _events(delays, timer))]
+    return asyncio.run(read())
+
+
+def _phase(delays, connected=True):
+    with pytest.raises(PhaseTimeout) as raised:
+        _collect(delays, connected)
+    return raised.value.phase
+
+
+def test_stream_within_budgets_is_passed_through():
+    assert _collect([0, 0.01, 0.01]) == [0, 0.01, 0.01]
+
+
+def test_no_first_event():
+    assert _phase([0.3]) == "first_event"
+
+
+def test_stall_after_the_first_event():
+    assert _phase([0, 0.01, 0.3]) == "idle"
+
+
+def test_turn_budget_bounds_a_trickling_response():
+    assert _phase([0.04] * 20) == "turn"
+
+
+def test_connect_budget_is_added_until_connected():
+    # 0.2s exceeds first_event alone, but not connect + first_event
+    assert _collect([0.2], connected=False) == [0.2]
+
+
+def test_phase_deadline_names_the_phase():
+    async def upload():
+        async with phase_deadline("first_event"):
+            await asyncio.sleep(1)
+
+    with pytest.raises(PhaseTimeout) as raised:
+        asyncio.run(upload())
+    assert _timeout_phase_from_reason(str(raised.value)) == "first_event"
+    assert _timeout_phase_from_reason("Exception: 1011 Internal error") == ""
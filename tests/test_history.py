@@ -0,0 +1,79 @@
+"""Regression detection in analyze_history and its statistical tests."""
+
+import pytest
+
+from test_tool import Config, _fisher_exact_greater, _mann_whitney_greater, analyze_history
+
+KEY = ("google-ai-studio", "gemini-live", "text")
+
+
+def _history(runs):
+    """Store records for runs given as (adk_version, success, first_event latencies)."""
+    records = []
+    for position, (version, success, latencies) in enumerate(runs):
+        run_id = f"run-{position}"
+        records.append({"record": "run", "run_id": run_id, "timestamp": f"2026-01-01T00:{position:02d}:00",
+                        "adk_version": version})
+        records.append({"record": "test", "run_id": run_id, "adk_version": version, "platform": KEY[0],
+                        "model": KEY[1], "test_type": KEY[2], "success": success,
+                        "timings": [{"first_event": latency} for latency in latencies]})
+    return records
+
+
+def test_fisher_detects_pass_rate_drop():
+    assert _fisher_exact_greater(5, 5, 0, 10) < Config.REGRESSION_ALPHA
+
+
+def test_fisher_single_failed_run_cannot_reach_alpha():
+    # One failing run against ten passing ones is the smallest p-value possible: 1/11
+    assert _fisher_exact_greater(1, 1, 0, 10) == pytest.approx(1 / 11)
+
+
+def test_fisher_no_change():
+    assert _fisher_exact_greater(1, 5, 2, 10) > 0.5
+
+
+def test_mann_whitney_detects_latency_rise():
+    base = [100, 110, 95, 105, 98, 102, 108, 97, 101, 99]
+    assert _mann_whitney_greater([150, 160, 155], base) < Config.REGRESSION_ALPHA
+
+
+def test_mann_whitney_same_distribution():
+    base = [100, 110, 95, 105, 98, 102, 108, 97, 101, 99]
+    assert _mann_whitney_greater([100, 104, 98], base) > 0.2
+
+
+def test_mann_whitney_ties():
+    assert _mann_whitney_greater([100, 100, 100], [100, 100, 100]) == 1.0
+
+
+def test_single_run_break_is_a_regression():
+    history = analyze_history(_history([("1.0.0", True, [100])] * 10 + [("1.1.0", False, [])]))
+    assert [regression["metric"] for regression in history["regressions"]] == ["pass_rate"]
+    assert history["regressions"][0]["p_value"] is None
+
+
+def test_single_failure_after_flaky_baseline_is_not_a_regression():
+    runs = [("1.0.0", True, [100])] * 8 + [("1.0.0", False, [])] + [("1.0.0", True, [100])] * 2
+    history = analyze_history(_history(runs + [("1.1.0", False, [])]))
+    assert history["regressions"] == []
+
+
+def test_single_run_latency_jump_is_a_regression():
+    runs = [("1.0.0", True, [latency]) for latency in (100, 110, 95, 105, 98, 102, 108, 97, 101, 99)]
+    history = analyze_history(_history(runs + [("1.1.0", True, [180])]))
+    assert [(regression["metric"], regression["p_value"]) for regression in history["regressions"]] \
+        == [("first_event", None)]
+    assert history["regressions"][0]["current"] == 180
+
+
+def test_single_run_within_baseline_range_is_not_a_regression():
+    runs = [("1.0.0", True, [latency]) for latency in (100, 110, 95, 105, 98, 102, 108, 97, 101, 99)]
+    history = analyze_history(_history(runs + [("1.1.0", True, [109])]))
+    assert history["regressions"] == []
+
+
+def test_repeated_runs_use_mann_whitney():
+    runs = [("1.0.0", True, [latency]) for latency in (100, 110, 95, 105, 98, 102, 108, 97, 101, 99)]
+    history = analyze_history(_history(runs + [("1.1.0", True, [130, 150, 105])]))
+    assert history["regressions"][0]["p_value"] < Config.REGRESSION_ALPHA
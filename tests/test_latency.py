@@ -0,0 +1,49 @@
+"""Session phase timing and the p50/p95 latency tables."""
+
+import pytest
+
+from test_tool import SessionTimer, _format_latency_cell, _generate_latency_results, _percentile
+
+
+def test_latencies_from_marks():
+    timer = SessionTimer()
+    timer.marks = {"setup_start": 10.0, "session_created": 10.5, "request_sent": 12.0, "first_event": 12.25,
+                   "turn_complete": 13.0}
+    timer.record("upload_jitter", 4.0)
+    assert timer.latencies() == pytest.approx({"setup": 500.0, "first_event": 250.0, "turn_complete": 1000.0,
+                                               "upload_jitter": 4.0})
+
+
+def test_marks_keep_the_first_occurrence():
+    timer = SessionTimer()
+    timer.mark("first_event")
+    first = timer.marks["first_event"]
+    timer.mark("first_event")
+    assert timer.marks["first_event"] == first
+
+
+def test_metric_names_in_report_order():
+    names = SessionTimer.metric_names()
+    assert names[0] == "setup"
+    assert names.index("first_event") < names.index("turn_complete")
+    assert names[-1] == "upload_jitter"
+
+
+def test_percentile_interpolates():
+    assert _percentile([5.0], 95) == 5.0
+    assert _percentile([1, 2, 3, 4], 50) == 2.5
+    assert _percentile(list(range(101)), 95) == pytest.approx(95)
+    assert _format_latency_cell([100, 200, 300]) == "200 / 290"
+    assert _format_latency_cell([]) == "-"
+
+
+def test_latency_table():
+    timings = {"vertex-ai-gemini-live-text": [{"first_event": 100.0}, {"first_event": 300.0}],
+               "vertex-ai-gemini-live-voice": []}
+    content = _generate_latency_results(timings)
+    assert "### Vertex AI" in content
+    row = next(line for line in content.splitlines() if line.startswith("| gemini-live"))
+    cells = [cell.strip() for cell in row.strip("|").split("|")]
+    assert cells[:3] == ["gemini-live", "text", "2"]
+    assert cells[3 + SessionTimer.metric_names().index("first_event")] == "200 / 290"
+    assert _generate_latency_results({"vertex-ai-gemini-live-text": []}) == ""
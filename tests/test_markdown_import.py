@@ -0,0 +1,53 @@
+"""Importing Markdown test reports into result store records."""
+
+import os
+
+import pytest
+
+from test_tool import _build_test_matrix, build_run_records, parse_markdown_report, render_test_report
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_committed_report():
+    records = parse_markdown_report(os.path.join(REPO, "test_report_us-central1_20260818_011827.md"))
+    run, tests = records[0], {record["test_key"]: record for record in records[1:]}
+    assert run == {"record": "run", "run_id": "us-central1_20260818_011827", "timestamp": "2026-08-18 01:18:27",
+                   "adk_version": "2.7.1", "region": "us-central1", "project": "gcp-samples-ic0",
+                   "loop_lag": {}, "voice_resources": {}, "source": "markdown"}
+    text = tests["google-ai-studio-gemini-2.5-flash-native-audio-preview-09-2025-text"]
+    assert text["success"] and text["modality"] == "AUDIO"
+    voice = tests["google-ai-studio-gemini-2.5-flash-native-audio-preview-09-2025-voice"]
+    assert voice["transcription"] == "the current time in Tokyo Japan is 10:14 a.m."
+    failed = next(record for record in tests.values() if not record["success"])
+    assert failed["retry_count"] == 2
+    assert failed["close_code"] == "1007"
+    assert failed["modality"] == "TEXT"
+
+
+def test_rendered_report_round_trips(tmp_path):
+    matrix = _build_test_matrix()
+    keys = ["-".join(entry) for entry in matrix]
+    failed = keys[0]
+    results = {key: key != failed for key in keys}
+    timings = {key: [{"first_event": 100.0 + index, "turn_complete": 900.0}] for index, key in enumerate(keys)}
+    reasons = {failed: "Timed out in first_event phase after 30s"}
+    retries = {failed: 1}
+    transcriptions = {key: "It is 10:14 a.m." for key in keys if key.endswith("-voice")}
+    records = build_run_records("us-central1_20260101_000000", "us-central1", matrix, results, transcriptions,
+                                {}, retries, reasons, timings, {})
+    path = str(tmp_path / "test_report_us-central1_20260101_000000.md")
+    render_test_report(records, path)
+
+    imported = {record["test_key"]: record for record in parse_markdown_report(path)[1:]}
+    assert sorted(imported) == sorted(keys)
+    for record in records[1:]:
+        parsed = imported[record["test_key"]]
+        assert parsed["success"] == record["success"]
+        assert parsed["retry_count"] == record["retry_count"]
+        assert parsed["failure_reason"] == record["failure_reason"]
+        assert parsed["transcription"] == record["transcription"]
+    assert imported[failed]["timeout_phase"] == "first_event"
+    summary = imported[keys[1]]["latency_summary"]
+    assert summary["first_event"] == pytest.approx([101.0, 101.0], abs=0.5)
+    assert summary["turn_complete"] == pytest.approx([900.0, 900.0], abs=0.5)
@@ -0,0 +1,60 @@
+"""PCMCache hits, misses and invalidation when the source changes."""
+
+import os
+
+from test_tool import PCMCache
+
+
+def _source(path, content):
+    path.write_bytes(content)
+    return str(path)
+
+
+def _decoder(calls, pcm):
+    def decode():
+        calls.append(pcm)
+        return pcm
+    return decode
+
+
+def test_miss_then_hit(tmp_path):
+    cache = PCMCache(str(tmp_path / "cache"))
+    source = _source(tmp_path / "prompt.wav", b"source")
+    calls = []
+    assert bytes(cache.load(source, 16000, 1, 2, _decoder(calls, b"\x01\x02"))) == b"\x01\x02"
+    assert bytes(cache.load(source, 16000, 1, 2, _decoder(calls, b"\x03\x04"))) == b"\x01\x02"
+    assert len(calls) == 1
+
+
+def test_disk_cache_survives_a_new_process(tmp_path):
+    source = _source(tmp_path / "prompt.wav", b"source")
+    calls = []
+    PCMCache(str(tmp_path / "cache")).load(source, 16000, 1, 2, _decoder(calls, b"\x01\x02"))
+    pcm = PCMCache(str(tmp_path / "cache")).load(source, 16000, 1, 2, _decoder(calls, b"\x03\x04"))
+    assert bytes(pcm) == b"\x01\x02"
+    assert len(calls) == 1
+
+
+def test_changed_source_is_decoded_again(tmp_path):
+    cache = PCMCache(str(tmp_path / "cache"))
+    source = _source(tmp_path / "prompt.wav", b"source")
+    calls = []
+    cache.load(source, 16000, 1, 2, _decoder(calls, b"\x01\x02"))
+    _source(tmp_path / "prompt.wav", b"edited source")
+    assert bytes(cache.load(source, 16000, 1, 2, _decoder(calls, b"\x03\x04"))) == b"\x03\x04"
+    assert len(calls) == 2
+
+
+def test_each_target_format_is_cached_separately(tmp_path):
+    cache = PCMCache(str(tmp_path / "cache"))
+    source = _source(tmp_path / "prompt.wav", b"source")
+    calls = []
+    cache.load(source, 16000, 1, 2, _decoder(calls, b"\x01\x02"))
+    assert bytes(cache.load(source, 24000, 1, 2, _decoder(calls, b"\x03\x04"))) == b"\x03\x04"
+    assert len(os.listdir(tmp_path / "cache")) == 2
+
+
+def test_empty_pcm(tmp_path):
+    cache = PCMCache(str(tmp_path / "cache"))
+    source = _source(tmp_path / "silence.wav", b"source")
+    assert bytes(cache.load(source, 16000, 1, 2, lambda: b"")) == b""
@@ -0,0 +1,84 @@
+"""Non-blocking playback through PlaybackSink and event-loop lag measurement."""
+
+import asyncio
+import threading
+import time
+
+from test_tool import Config, LoopLagMonitor, PlaybackSink
+
+
+class FakeStream:
+    """Blocking output stream stand-in that is released chunk by chunk."""
+
+    def __init__(self, gate: threading.Event = None):
+        self.written = bytearray()
+        self.gate = gate
+
+    def write(self, chunk):
+        if self.gate:
+            self.gate.wait()
+        self.written += chunk
+
+
+class FakePool:
+    def __init__(self, stream):
+        self.stream = stream
+        self.closed = []
+
+    def open_output_stream(self):
+        return self.stream
+
+    def close_stream(self, stream):
+        self.closed.append(stream)
+
+
+def test_queued_audio_is_played_in_order():
+    pool = FakePool(FakeStream())
+    audio = bytes(range(256)) * 40
+
+    async def play():
+        sink = PlaybackSink(pool)
+        for start in range(0, len(audio), 1000):
+            sink.write(audio[start:start + 1000])
+        await sink.wait_closed()
+        return sink
+    sink = asyncio.run(play())
+    assert bytes(pool.stream.written) == audio
+    assert sink.dropped == 0
+    assert pool.closed == [pool.stream]
+
+
+def test_write_does_not_block_on_a_stalled_device(monkeypatch):
+    monkeypatch.setattr(Config, "PLAYBACK_BUFFER_SECONDS", 1)
+    gate = threading.Event()
+    pool = FakePool(FakeStream(gate))
+    capacity = Config.OUTPUT_RATE * 2
+
+    async def play():
+        sink = PlaybackSink(pool)
+        started = time.monotonic()
+        sink.write(b"\x01" * capacity)
+        sink.write(b"\x02" * 1000)  # More than the device can take while it is stalled
+        elapsed = time.monotonic() - started
+        gate.set()
+        await sink.wait_closed()
+        return sink, elapsed
+    sink, elapsed = asyncio.run(play())
+    assert elapsed < 0.1
+    # Whatever the drainer had not taken out of the full buffer was dropped, and only that
+    assert sink.dropped + len(pool.stream.written) == capacity + 1000
+    assert pool.stream.written.startswith(b"\x01" * Config.PLAYBACK_CHUNK_BYTES)
+
+
+def test_loop_lag_monitor_sees_a_blocked_loop():
+    async def run():
+        monitor = LoopLagMonitor(interval=0.01)
+        monitor.start()
+        await asyncio.sleep(0.05)
+        time.sleep(0.1)  # Block the event loop
+        await asyncio.sleep(0.03)
+        return await monitor.stop()
+    summary = asyncio.run(run())
+    assert summary["samples"] >= 3
+    assert summary["max"] >= 80
+    assert summary["p50"] < summary["max"]
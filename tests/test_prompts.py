@@ -0,0 +1,94 @@
+"""Resampling in to_mono_pcm and synthetic voice prompts."""
+
+import wave
+
+import numpy as np
+import pytest
+
+from test_tool import Config, decode_audio, synthesize_prompt, to_mono_pcm
+
+RATE = Config.INPUT_RATE
+
+
+def _tone(frequency, rate, seconds=1.0, amplitude=10000, channels=1):
+    t = np.arange(int(rate * seconds)) / rate
+    samples = (amplitude * np.sin(2 * np.pi * frequency * t)).astype(np.int16)
+    return np.repeat(samples[:, None], channels, axis=1)
+
+
+def _gain_db(frequency, rate, amplitude=10000):
+    pcm = np.frombuffer(to_mono_pcm(_tone(frequency, rate, amplitude=amplitude), rate), dtype="<i2")
+    steady = pcm[1000:-1000].astype(np.float64)  # Skip the filter's edges
+    return 20 * np.log10(max(np.sqrt(np.mean(steady ** 2)), 1e-9) / (amplitude / np.sqrt(2)))
+
+
+@pytest.mark.parametrize("rate", [48000, 44100, 24000])
+def test_passband_is_kept(rate):
+    assert _gain_db(1000, rate) == pytest.approx(0, abs=0.3)
+
+
+@pytest.mark.parametrize("rate", [48000, 44100])
+def test_response_at_the_cutoff(rate):
+    # The windowed sinc passes half the amplitude at its 0.45 * 16kHz cutoff
+    assert _gain_db(0.45 * RATE, rate) == pytest.approx(-6, abs=1)
+
+
+@pytest.mark.parametrize("rate", [48000, 44100, 24000])
+def test_content_above_nyquist_is_not_aliased(rate):
+    assert _gain_db(10000, rate, amplitude=30000) < -60
+
+
+def test_stereo_is_mixed_down():
+    samples = np.stack([np.full(RATE, 1000, np.int16), np.full(RATE, 3000, np.int16)], axis=1)
+    assert set(np.frombuffer(to_mono_pcm(samples, RATE), dtype="<i2")) == {2000}
+
+
+def test_upsampling_interpolates():
+    pcm = np.frombuffer(to_mono_pcm(_tone(440, 8000), 8000), dtype="<i2")
+    assert pcm.size == RATE
+    assert _gain_db(440, 8000) == pytest.approx(0, abs=0.3)
+
+
+def _wav(path, samples, rate):
+    with wave.open(str(path), 'wb') as f:
+        f.setnchannels(samples.shape[1])
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(samples.astype("<i2").tobytes())
+    return str(path)
+
+
+def test_wav_is_decoded_in_process(tmp_path):
+    path = _wav(tmp_path / "stereo.wav", _tone(440, 44100, channels=2), 44100)
+    samples, rate = decode_audio(path)
+    assert rate == 44100
+    assert samples.shape == (44100, 2)
+
+
+@pytest.fixture
+def utterance(tmp_path):
+    return _wav(tmp_path / "question.wav", _tone(440, RATE, seconds=1.0), RATE)
+
+
+def test_prompt_is_padded_ahead_of_the_question(utterance):
+    prompt = np.frombuffer(synthesize_prompt((utterance,), duration=3.0), dtype="<i2")
+    assert prompt.size == 3 * RATE
+    assert not prompt[:2 * RATE].any()
+    assert prompt[2 * RATE:].any()
+
+
+def test_repeat_fill_ends_with_a_whole_question(utterance):
+    prompt = np.frombuffer(synthesize_prompt((utterance,), duration=5.0, fill="repeat", gap=0.5), dtype="<i2")
+    assert prompt.size == 5 * RATE
+    question = np.frombuffer(to_mono_pcm(*decode_audio(utterance)), dtype="<i2")
+    assert np.array_equal(prompt[-question.size:], question)
+
+
+def test_noise_is_seeded(utterance):
+    first = synthesize_prompt((utterance,), duration=2.0, noise_dbfs=-50.0, seed=1)
+    again = synthesize_prompt.__wrapped__((utterance,), duration=2.0, noise_dbfs=-50.0, seed=1)
+    other = synthesize_prompt((utterance,), duration=2.0, noise_dbfs=-50.0, seed=2)
+    assert bytes(first) == bytes(again)
+    assert bytes(first) != bytes(other)
+    noise = np.frombuffer(first, dtype="<i2")[:RATE].astype(np.float64)
+    assert 20 * np.log10(np.sqrt(np.mean(noise ** 2)) / 32768) == pytest.approx(-50, abs=0.5)
@@ -0,0 +1,87 @@
+"""Response audio recognizers: the abstract interface, batch and streaming recognition."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from test_tool import RECOGNIZERS, BatchRecognizer, GoogleStreamingRecognizer, StreamingRecognizer
+
+
+def test_recognizer_must_implement_feed_and_finish():
+    class Incomplete(StreamingRecognizer):
+        def feed(self, chunk):
+            pass
+
+    with pytest.raises(TypeError, match="finish"):
+        Incomplete(voice_handler=None)
+    assert set(RECOGNIZERS.values()) == {BatchRecognizer, GoogleStreamingRecognizer}
+
+
+def test_batch_recognizer_transcribes_once_after_the_turn():
+    requests = []
+
+    async def speech_to_text(audio):
+        requests.append(bytes(audio))
+        return "It is ten fourteen"
+
+    transcripts = []
+    recognizer = BatchRecognizer(SimpleNamespace(speech_to_text=speech_to_text), transcripts.append)
+
+    async def run():
+        recognizer.feed(b"\x01\x02")
+        recognizer.feed(b"\x03\x04")
+        return await recognizer.finish()
+    assert asyncio.run(run()) == "It is ten fourteen"
+    assert requests == [b"\x01\x02\x03\x04"]
+    assert transcripts == ["It is ten fourteen"]
+
+
+def test_batch_recognizer_without_audio_sends_nothing():
+    recognizer = BatchRecognizer(SimpleNamespace(speech_to_text=None))
+    assert asyncio.run(recognizer.finish()) == ""
+
+
+def _result(transcript, is_final):
+    return SimpleNamespace(alternatives=[SimpleNamespace(transcript=transcript)], is_final=is_final)
+
+
+class FakeSpeechClient:
+    """streaming_recognize stand-in: consumes every request, then returns interim and final results."""
+
+    def __init__(self):
+        self.audio = []
+
+    def streaming_recognize(self, config, requests):
+        self.audio = [request.audio_content for request in requests]
+        return [SimpleNamespace(results=[_result("It is", False)]),
+                SimpleNamespace(results=[_result("It is 10:14", True)]),
+                SimpleNamespace(results=[_result("a.m.", False)])]
+
+
+def test_streaming_recognizer_publishes_running_transcripts():
+    client = FakeSpeechClient()
+    transcripts = []
+    recognizer = GoogleStreamingRecognizer(SimpleNamespace(stt_client=client), transcripts.append)
+    chunk = b"\x00" * (GoogleStreamingRecognizer.MAX_REQUEST_BYTES + 100)
+
+    async def run():
+        recognizer.feed(chunk)
+        transcript = await recognizer.finish()
+        await asyncio.sleep(0)  # Let published transcripts reach the loop
+        return transcript
+    assert asyncio.run(run()) == "It is 10:14 a.m."
+    assert [len(audio) for audio in client.audio] == [GoogleStreamingRecognizer.MAX_REQUEST_BYTES, 100]
+    assert transcripts == ["It is", "It is 10:14", "It is 10:14 a.m."]
+
+
+def test_aborted_recognizer_publishes_nothing():
+    transcripts = []
+    recognizer = GoogleStreamingRecognizer(SimpleNamespace(stt_client=FakeSpeechClient()), transcripts.append)
+
+    async def run():
+        recognizer.feed(b"\x00" * 100)
+        await recognizer.abort()
+        await asyncio.sleep(0)
+    asyncio.run(run())
+    assert transcripts == []
@@ -0,0 +1,43 @@
+"""The region sweep comparison report."""
+
+from test_tool import build_run_records, render_region_report
+
+MATRIX = [("vertex-ai", "gemini-live", "text"), ("vertex-ai", "gemini-live", "voice")]
+KEYS = ["-".join(entry) for entry in MATRIX]
+
+
+def _run(region, results, first_audio, reasons=None):
+    timings = {key: [{"first_event": 100.0, "first_audio": latency}] for key, latency in zip(KEYS, first_audio)}
+    return build_run_records(f"{region}_20260101_000000", region, MATRIX, dict(zip(KEYS, results)),
+                             {}, {}, {}, reasons or {}, timings, {})
+
+
+def _table(content, heading):
+    lines = content.split(f"## {heading}\n", 1)[1].splitlines()
+    end = next((index for index, line in enumerate(lines) if line.startswith("## ")), len(lines))
+    rows = [line for line in lines[:end] if line.startswith("| ")]
+    return [[cell.strip() for cell in row.strip("|").split("|")] for row in rows[1:]]
+
+
+def test_regions_are_ranked_by_availability_then_latency(tmp_path):
+    runs = {
+        "us-central1": _run("us-central1", [True, True], [900.0, 900.0]),
+        "europe-west4": _run("europe-west4", [True, False], [100.0, 100.0],
+                             {KEYS[1]: "Exception: 1008 not served here"}),
+        "us-east1": _run("us-east1", [True, True], [300.0, 300.0]),
+    }
+    path = tmp_path / "region_report.md"
+    render_region_report(runs, str(path))
+    content = path.read_text()
+
+    ranking = _table(content, "Region Comparison")
+    assert [row[0] for row in ranking] == ["us-east1", "us-central1", "europe-west4"]
+    assert ranking[0][1:3] == ["2/2", "100.0%"]
+    assert ranking[2][1:3] == ["1/2", "50.0%"]
+
+    availability = _table(content, "Availability by Model")
+    assert availability[1][:2] == ["gemini-live", "voice"]
+    assert availability[1][4].endswith("permanent")
+
+    failures = _table(content, "Failures")
+    assert failures == [["europe-west4", "gemini-live", "voice", "Exception: 1008 not served here"]]
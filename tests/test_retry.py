@@ -0,0 +1,64 @@
+"""Failure classification, retry decisions and remembered permanent failures."""
+
+import pytest
+
+from test_tool import (Config, PermanentFailureMemory, RetryPolicy, _describe_retry_policy,
+                       _generate_methodology_section, classify_failure)
+
+
+@pytest.mark.parametrize("reason, failure_class", [
+    ("", ""),
+    ("Exception: 1007 None. The requested combination of response modalities (TEXT) is not supported", "permanent"),
+    ("Exception: 1008 Operation is not implemented", "permanent"),
+    ("GOOGLE_API_KEY not found in environment", "permanent"),
+    ("Exception: 429 RESOURCE_EXHAUSTED", "quota"),
+    ("Exception: 1013 Try again later", "quota"),
+    ("Timed out in first_event phase after 30s", "timeout"),
+    ("Empty response received", "empty"),
+    ("Audio response is silent (peak -90.3 dBFS)", "empty"),
+    ("Exception: 1011 Internal error", "transient"),
+    ("Response does not contain time-related keywords", "transient"),
+])
+def test_classify_failure(reason, failure_class):
+    assert classify_failure(reason) == failure_class
+
+
+def test_attempts_per_class():
+    policy = RetryPolicy({"permanent": (1, 0.0), "timeout": (2, 2.0), "transient": (3, 1.0)})
+    assert not policy.should_retry("permanent", 1)
+    assert policy.should_retry("timeout", 1)
+    assert not policy.should_retry("timeout", 2)
+    # Unknown classes are retried like transient failures
+    assert policy.should_retry("empty", 2)
+    assert not policy.should_retry("empty", 3)
+
+
+def test_backoff_is_exponential_capped_and_jittered(monkeypatch):
+    policy = RetryPolicy({"quota": (5, 10.0), "transient": (3, 1.0)}, max_delay=30.0)
+    monkeypatch.setattr("random.uniform", lambda low, high: high)
+    assert [policy.delay("quota", attempts) for attempts in (1, 2, 3)] == [10.0, 20.0, 30.0]
+    assert policy.delay("transient", 2) == 2.0
+    monkeypatch.setattr("random.uniform", lambda low, high: low)
+    assert policy.delay("quota", 3) == 0
+
+
+def test_permanent_failures_are_kept_per_region_and_skip_credentials(tmp_path):
+    path = str(tmp_path / "failures.json")
+    memory = PermanentFailureMemory(path)
+    memory.remember("vertex-ai", "gemini-live", "text", "Exception: 1008 not served here", "europe-west4")
+    memory.remember("google-ai-studio", "gemini-live", "voice", "GOOGLE_API_KEY not found in environment")
+
+    reloaded = PermanentFailureMemory(path)
+    assert reloaded.get("vertex-ai", "gemini-live", "text", "europe-west4") == "Exception: 1008 not served here"
+    assert reloaded.get("vertex-ai", "gemini-live", "text", "us-central1") == ""
+    assert reloaded.get("google-ai-studio", "gemini-live", "voice") == ""
+
+
+def test_methodology_follows_the_retry_policy(monkeypatch):
+    monkeypatch.setattr(Config, "RETRY_POLICY", {"permanent": (1, 0.0), "quota": (4, 5.0), "transient": (2, 0.5)})
+    monkeypatch.setattr(Config, "RETRY_MAX_DELAY", 20.0)
+    assert _describe_retry_policy() == (
+        "- Permanent failures are not retried; quota and transient failures are tried up to 4 and 2 times\n"
+        "- Retries wait with exponential backoff and full jitter "
+        "(base delay 5s for quota, 0.5s for transient; doubled per attempt, capped at 20s)")
+    assert _describe_retry_policy() in _generate_methodology_section()
@@ -0,0 +1,58 @@
+"""Concurrent matrix runs within global and per-platform session limits."""
+
+import asyncio
+
+import pytest
+
+import test_tool
+from test_tool import MatrixScheduler
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    """Replace _test_model with a session that records how many ran at once, overall and per platform."""
+    state = {"running": {}, "peak": {}}
+
+    async def fake_test_model(platform, model, test_type, region, headless):
+        running = state["running"]
+        running[platform] = running.get(platform, 0) + 1
+        running["all"] = running.get("all", 0) + 1
+        for key in (platform, "all"):
+            state["peak"][key] = max(state["peak"].get(key, 0), running[key])
+        await asyncio.sleep(0.01)
+        running[platform] -= 1
+        running["all"] -= 1
+        success = model != "broken"
+        modality = "AUDIO" if test_type == "voice" else "TEXT"
+        return (success, f"{model} transcript", 1 if success else 2, "" if success else "Exception: 1011",
+                "" if success else "trace", [{"first_event": 100.0}], modality)
+
+    monkeypatch.setattr(test_tool, "_test_model", fake_test_model)
+    return state
+
+
+def _matrix(platform, count, test_type="text"):
+    return [(platform, f"model-{index}", test_type) for index in range(count)]
+
+
+def test_platform_and_global_limits(sessions):
+    scheduler = MatrixScheduler(max_concurrency=4, platform_limits={"google-ai-studio": 2, "vertex-ai": 3})
+    matrix = _matrix("google-ai-studio", 6) + _matrix("vertex-ai", 6)
+    asyncio.run(scheduler.run(matrix))
+    assert sessions["peak"]["google-ai-studio"] == 2
+    assert sessions["peak"]["vertex-ai"] <= 3
+    assert sessions["peak"]["all"] == 4
+
+
+def test_results_are_merged_in_matrix_order(sessions):
+    matrix = [("vertex-ai", "broken", "voice"), ("google-ai-studio", "model-0", "text")]
+    results, transcriptions, error_traces, retry_counts, failure_reasons, timings, modalities = asyncio.run(
+        MatrixScheduler(max_concurrency=2).run(matrix))
+    assert list(results) == ["vertex-ai-broken-voice", "google-ai-studio-model-0-text"]
+    assert results == {"vertex-ai-broken-voice": False, "google-ai-studio-model-0-text": True}
+    assert transcriptions == {"vertex-ai-broken-voice": "broken transcript"}
+    assert failure_reasons == {"vertex-ai-broken-voice": "Exception: 1011"}
+    assert error_traces == {"vertex-ai-broken-voice": "trace"}
+    assert retry_counts == {"vertex-ai-broken-voice": 2, "google-ai-studio-model-0-text": 1}
+    assert modalities == {"vertex-ai-broken-voice": "AUDIO", "google-ai-studio-model-0-text": "TEXT"}
+    assert timings["google-ai-studio-model-0-text"] == [{"first_event": 100.0}]
@@ -0,0 +1,57 @@
+"""Matrix sharding, worker command lines and merging shard stores."""
+
+import argparse
+
+import pytest
+
+from test_tool import (Config, ResultStore, _build_test_matrix, _positive_int, _worker_argv, build_run_records,
+                       merge_shards, shard_matrix)
+
+
+def test_shards_cover_the_matrix_once():
+    matrix = _build_test_matrix()
+    shards = [shard_matrix(matrix, index, 3) for index in range(1, 4)]
+    assert sorted(entry for shard in shards for entry in shard) == sorted(matrix)
+    assert max(map(len, shards)) - min(map(len, shards)) <= 1
+
+
+def test_worker_argv_drops_coordinator_options():
+    argv = ["--headless", "--workers", "2", "--concurrency=4", "--reprobe", "--region", "us-east1",
+            "--recheck-permanent", "--studio-concurrency", "2"]
+    assert _worker_argv(argv) == ["--headless", "--region", "us-east1"]
+
+
+@pytest.mark.parametrize("value", ["0", "-3", "two"])
+def test_counts_must_be_positive(value):
+    # Shared by --workers, --concurrency, --soak-turns and --scaling-sessions
+    with pytest.raises(argparse.ArgumentTypeError):
+        _positive_int(value)
+    assert _positive_int("1") == 1
+
+
+def _shard_store(path, run_id, entries):
+    keys = ["-".join(entry) for entry in entries]
+    records = build_run_records(run_id, "us-central1", entries, dict.fromkeys(keys, True),
+                                {}, {}, {}, {}, {}, {})
+    ResultStore(str(path)).append(records)
+    return str(path)
+
+
+def test_merge_reports_missing_tests_as_failed(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(Config, "RESULTS_STORE", str(tmp_path / "results.jsonl"))
+    matrix = _build_test_matrix()
+    first, second = shard_matrix(matrix, 1, 2), shard_matrix(matrix, 2, 2)
+    paths = [_shard_store(tmp_path / "shard1.jsonl", "run-1", first),
+             _shard_store(tmp_path / "shard2.jsonl", "run-1", second[1:])]
+
+    report = merge_shards(paths, "run-1", [0, 1])
+
+    assert (tmp_path / report).exists()
+    tests = {record["test_key"]: record for record in ResultStore(Config.RESULTS_STORE).load("run-1")
+             if record["record"] == "test"}
+    assert list(tests) == ["-".join(entry) for entry in matrix]
+    lost = tests["-".join(second[0])]
+    assert not lost["success"]
+    assert lost["failure_reason"] == "Exception: no worker reported this test"
+    assert all(tests["-".join(entry)]["success"] for entry in first + second[1:])
@@ -0,0 +1,106 @@
+"""Recording run_live event streams to traces and replaying them."""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from test_tool import EventRecorder, load_trace, replay_session, replay_trace
+
+
+def _event(text=None, audio=None, transcription=None, turn_complete=False):
+    parts = None
+    if text is not None or audio is not None:
+        inline_data = SimpleNamespace(mime_type="audio/pcm;rate=24000", data=audio) if audio else None
+        parts = [SimpleNamespace(text=text, inline_data=inline_data)]
+    return SimpleNamespace(turn_complete=turn_complete, partial=not turn_complete,
+                           content=SimpleNamespace(parts=parts) if parts else None,
+                           output_transcription=SimpleNamespace(text=transcription) if transcription else None)
+
+
+async def _stream(events, marks, delay=0.0):
+    """Yield events, marking a request sent before each turn like the soak session does."""
+    turn_start = True
+    for event in events:
+        if turn_start:
+            marks["request_sent"] = time.monotonic()
+        await asyncio.sleep(delay)
+        turn_start = event.turn_complete
+        yield event
+
+
+def _record(tmp_path, events, collector="text", delay=0.0, **metadata):
+    marks = {}
+    recorder = EventRecorder(str(tmp_path / "trace"), collector, marks=lambda: marks, **metadata)
+
+    async def drain():
+        return [event async for event in recorder.record(_stream(events, marks, delay))]
+    assert asyncio.run(drain()) == events
+    return recorder.trace_path
+
+
+def test_trace_keeps_text_audio_and_marks(tmp_path):
+    events = [_event(text="The time"), _event(audio=b"\x01\x02" * 10), _event(transcription="is noon"),
+              _event(turn_complete=True)]
+    path = _record(tmp_path, events, model="gemini-live")
+
+    header, records, blob = load_trace(path)
+    assert header["collector"] == "text" and header["model"] == "gemini-live"
+    assert records[0]["mark"] == "request_sent"
+    assert [record.get("text") for record in records[1:]] == ["The time", None, None, None]
+    assert records[2]["audio"][:2] == [0, 20]
+    assert bytes(blob) == b"\x01\x02" * 10
+    blob.close()
+
+
+def test_replay_rebuilds_the_events(tmp_path):
+    events = [_event(text="The time"), _event(audio=b"\x03\x04" * 8), _event(transcription="is noon"),
+              _event(turn_complete=True)]
+    path = _record(tmp_path, events)
+    marks = []
+
+    async def replay():
+        return [event async for event in replay_trace(path, speed=0, on_mark=marks.append)]
+    replayed = asyncio.run(replay())
+    assert marks == ["request_sent"]
+    assert replayed[0].content.parts[0].text == "The time"
+    assert bytes(replayed[1].content.parts[0].inline_data.data) == b"\x03\x04" * 8
+    assert replayed[2].output_transcription.text == "is noon"
+    assert [event.turn_complete for event in replayed] == [False, False, False, True]
+
+
+def test_replay_keeps_the_recorded_timing(tmp_path):
+    path = _record(tmp_path, [_event(text="a"), _event(text="b"), _event(turn_complete=True)], delay=0.05)
+
+    async def replay(speed):
+        started = time.monotonic()
+        async for _ in replay_trace(path, speed=speed):
+            pass
+        return time.monotonic() - started
+    assert asyncio.run(replay(1.0)) >= 0.14
+    assert asyncio.run(replay(0)) < 0.05
+
+
+def test_replay_session_verifies_each_turn(tmp_path):
+    events = [_event(text="The time is 10:14 a.m."), _event(turn_complete=True),
+              _event(text="Still the same time"), _event(turn_complete=True)]
+    path = _record(tmp_path, events, stop_on_verified=False)
+    with open(path, encoding="utf-8") as f:
+        assert json.loads(f.readline())["stop_on_verified"] is False
+
+    turns = asyncio.run(replay_session(path, speed=0))
+    assert len(turns) == 2
+    for latencies in turns:
+        assert {"first_event", "first_text", "turn_complete", "verified"} <= set(latencies)
+        assert latencies["verified"] <= latencies["turn_complete"] + 1
+    assert turns[0]["first_event"] == pytest.approx(0, abs=50)
+
+
+def test_replay_session_stops_at_verification_like_the_recording(tmp_path):
+    events = [_event(text="The time is 10:14 a.m."), _event(text=" in Tokyo"), _event(turn_complete=True)]
+    path = _record(tmp_path, events, stop_on_verified=True)
+    [latencies] = asyncio.run(replay_session(path, speed=0))
+    assert "verified" in latencies
+    assert "turn_complete" not in latencies
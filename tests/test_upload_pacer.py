@@ -0,0 +1,55 @@
+"""UploadPacer schedules for each pacing mode."""
+
+import asyncio
+import time
+
+import pytest
+
+from test_tool import Config, UploadPacer
+
+SECOND = Config.INPUT_RATE * Config.CHANNELS * 2  # Bytes of one second of 16-bit audio
+
+
+def test_realtime_schedule_follows_the_byte_offset():
+    pacer = UploadPacer("realtime", speed=8.0)
+    pacer.start = 100.0
+    assert pacer.speed == 1.0
+    assert pacer._scheduled_time(SECOND) == pytest.approx(101.0)
+    assert pacer._scheduled_time(SECOND // 10) == pytest.approx(100.1)
+
+
+def test_accelerated_schedule_is_sped_up():
+    pacer = UploadPacer("accelerated", speed=4.0)
+    pacer.start = 100.0
+    assert pacer._scheduled_time(SECOND) == pytest.approx(100.25)
+
+
+def test_fixed_delay_counts_from_the_last_chunk():
+    pacer = UploadPacer("fixed")
+    pacer.start, pacer.last_sent = 100.0, 105.0
+    assert pacer._scheduled_time(SECOND * 60) == pytest.approx(105.0 + Config.FIXED_CHUNK_DELAY)
+
+
+async def _send(pacer, offsets):
+    started = time.monotonic()
+    for offset in offsets:
+        await pacer.wait(offset)
+    return time.monotonic() - started
+
+
+def test_burst_never_waits():
+    pacer = UploadPacer("burst")
+    elapsed = asyncio.run(_send(pacer, range(0, SECOND * 60, 3200)))
+    assert elapsed < 0.5
+    assert pacer.lateness == []
+    assert pacer.jitter() == 0.0
+
+
+def test_accelerated_upload_keeps_to_the_schedule():
+    pacer = UploadPacer("accelerated", speed=10.0)
+    # Three 100ms chunks at 10x: the last one is due 20ms after the first
+    elapsed = asyncio.run(_send(pacer, [0, SECOND // 10, SECOND // 5]))
+    # The event loop may wake a timer up to its clock resolution early
+    assert elapsed >= 0.018
+    assert len(pacer.lateness) == 2
+    assert all(lateness > -2 for lateness in pacer.lateness)
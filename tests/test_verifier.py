@@ -0,0 +1,58 @@
+"""Keyword matching in ResponseVerifier and the opt-in clock validator."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from test_tool import VALIDATORS, Config, ResponseVerifier, validate_clock
+
+NOW = datetime(2026, 1, 1, 15, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def utc_only(monkeypatch):
+    monkeypatch.setattr(Config, "CLOCK_UTC_OFFSETS", [0])
+
+
+def test_keywords_only_by_default():
+    verifier = ResponseVerifier()
+    assert verifier.validators == {}
+    assert verifier.verify("The time is 9:47 a.m.")
+
+
+def test_am_is_not_a_keyword_on_its_own():
+    assert not ResponseVerifier().verify("I am not sure")
+
+
+def test_digit_time_matches_wall_clock(utc_only):
+    assert validate_clock("It's 3:02 PM", NOW) is True
+    assert validate_clock("It is 15:00 right now", NOW) is True
+
+
+def test_wrong_time_fails(utc_only):
+    assert validate_clock("It's 9:47 a.m.", NOW) is False
+    assert validate_clock("It's 3:30 PM", NOW) is False
+
+
+def test_bare_hour_uses_the_same_tolerance(utc_only):
+    assert validate_clock("It's 3 PM", NOW) is True
+    later = datetime(2026, 1, 1, 15, 25, tzinfo=timezone.utc)
+    assert validate_clock("It's 3 PM", later) is False
+
+
+def test_spelled_out_time_has_nothing_to_check(utc_only):
+    assert validate_clock("It's ten fourteen", NOW) is None
+
+
+def test_spelled_out_time_falls_back_to_keyword(utc_only):
+    verifier = ResponseVerifier(validators=["clock"])
+    assert verifier.verify("The time is ten fourteen in the morning")
+    assert not verifier.verify("It is ten fourteen")
+    assert verifier.reason == "Response does not contain time-related keywords"
+
+
+def test_wrong_digit_time_fails_verification(monkeypatch, utc_only):
+    monkeypatch.setitem(VALIDATORS, "clock", lambda text: validate_clock(text, NOW))
+    verifier = ResponseVerifier(validators=["clock"])
+    assert not verifier.verify("The time is 9:47 a.m.")
+    assert verifier.reason == "Response failed the clock validator"